@@ -159,6 +159,7 @@ class PipelineListResponse(BaseModel):
     """List of saved pipelines."""
     pipelines: List[PipelineMetadata]
     count: int
+    next_offset: Optional[int] = None
 
 
 class PipelineGetResponse(BaseModel):
@@ -255,6 +256,7 @@ class CompositeListResponse(BaseModel):
     """List of saved composites."""
     composites: List[CompositeMetadata]
     count: int
+    next_offset: Optional[int] = None
 
 
 class CompositeGetResponse(BaseModel):
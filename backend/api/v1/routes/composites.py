@@ -1,6 +1,6 @@
 """Composite Node API routes."""
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from dependency_injector.wiring import inject, Provide
 from typing import Optional
 
@@ -31,13 +31,20 @@ router = APIRouter(prefix="/composites", tags=["composites"])
 @inject
 async def list_composites(
     category: Optional[str] = Query(None, description="Filter by category"),
+    offset: int = Query(0, ge=0, description="Number of composites to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all if omitted)"),
     use_case: ListCompositesUseCase = Depends(
         Provide[Container.list_composites_use_case]
     ),
 ):
-    """List all saved composite nodes."""
+    """List saved composite nodes, optionally one page at a time."""
     try:
-        composites_meta = await use_case.execute(category=category)
+        next_offset = None
+        if limit is None:
+            composites_meta = await use_case.execute(category=category)
+        else:
+            page = await use_case.execute_page(category, offset, limit)
+            composites_meta, next_offset = page["items"], page["next_offset"]
 
         composites = [
             CompositeMetadata(
@@ -55,7 +62,9 @@ async def list_composites(
             for c in composites_meta
         ]
 
-        return CompositeListResponse(composites=composites, count=len(composites))
+        return CompositeListResponse(
+            composites=composites, count=len(composites), next_offset=next_offset
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to list composites: {str(e)}"
@@ -72,8 +81,12 @@ async def get_composite(
 ):
     """Get a specific composite by ID."""
     try:
-        composite_data = await use_case.execute(composite_id)
-        return CompositeGetResponse(composite=composite_data)
+        # The composite's JSON is cached on the entity, so it is embedded
+        # as-is instead of being re-validated and re-encoded
+        payload = await use_case.execute_json(composite_id)
+        return Response(
+            content=b'{"composite":' + payload + b'}', media_type="application/json"
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -1,7 +1,8 @@
 """Pipeline API routes - refactored with Use Cases."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from dependency_injector.wiring import inject, Provide
+from typing import Optional
 
 from api.models import (
     PipelineExecuteRequest,
@@ -81,13 +82,20 @@ async def save_pipeline(
 @router.get("", response_model=PipelineListResponse)
 @inject
 async def list_pipelines(
+    offset: int = Query(0, ge=0, description="Number of pipelines to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all if omitted)"),
     use_case: ListPipelinesUseCase = Depends(
         Provide[Container.list_pipelines_use_case]
     ),
 ):
-    """List all saved pipelines."""
+    """List saved pipelines, optionally one page at a time."""
     try:
-        pipelines_meta = await use_case.execute()
+        next_offset = None
+        if limit is None:
+            pipelines_meta = await use_case.execute()
+        else:
+            page = await use_case.execute_page(offset, limit)
+            pipelines_meta, next_offset = page["items"], page["next_offset"]
 
         pipelines = [
             PipelineMetadata(
@@ -99,7 +107,9 @@ async def list_pipelines(
             for p in pipelines_meta
         ]
 
-        return PipelineListResponse(pipelines=pipelines, count=len(pipelines))
+        return PipelineListResponse(
+            pipelines=pipelines, count=len(pipelines), next_offset=next_offset
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to list pipelines: {str(e)}"
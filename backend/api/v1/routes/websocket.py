@@ -1,7 +1,10 @@
 """WebSocket endpoint for real-time updates."""
 
+import asyncio
 import logging
-from typing import List
+from typing import List, Optional
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from domain.events import (
     event_bus,
@@ -21,11 +24,22 @@ logger = logging.getLogger(__name__)
 class WebSocketManager:
     """
     Manages WebSocket connections and broadcasts events.
+
+    Events published in quick succession (e.g. node_executing/node_completed
+    pairs of a fast pipeline) are coalesced for up to ``BATCH_WINDOW``
+    seconds and sent as a single ``{"type": "batch", "events": [...]}``
+    frame. A lone event is still sent unwrapped.
     """
 
+    BATCH_WINDOW = 0.005
+    BATCH_MAX = 64
+
     def __init__(self):
         """Initialize WebSocket manager."""
         self.active_connections: List[WebSocket] = []
+        self._pending: List[bytes] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._send_lock = asyncio.Lock()
         self._setup_event_subscribers()
 
     async def connect(self, websocket: WebSocket):
@@ -59,16 +73,65 @@ class WebSocketManager:
 
     async def broadcast(self, message: dict):
         """
-        Broadcast message to all connected clients.
+        Queue message for broadcast to all connected clients.
+
+        The message is encoded with orjson right away; one that cannot be
+        serialized is logged and dropped without affecting the other queued
+        messages. Queued messages are flushed after ``BATCH_WINDOW`` or as
+        soon as ``BATCH_MAX`` of them are pending, whichever comes first.
 
         Args:
             message: Dictionary to send as JSON
         """
+        if not self.active_connections:
+            return
+
+        try:
+            encoded = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError as e:
+            logger.error(f"Dropping {message.get('type', 'unknown')} event that cannot be serialized: {e}")
+            return
+
+        self._pending.append(encoded)
+
+        if len(self._pending) >= self.BATCH_MAX:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self):
+        """Send all queued messages, as one batch frame if more than one."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        if len(pending) == 1:
+            payload = pending[0]
+        else:
+            # Splice the already-encoded events into the batch envelope
+            payload = b'{"type":"batch","events":[' + b",".join(pending) + b"]}"
+
+        # Serialize sends so batches reach every client in queue order
+        async with self._send_lock:
+            await self._send_all(payload.decode())
+
+    async def _flush_later(self):
+        """Flush queued messages once the batch window has passed."""
+        await asyncio.sleep(self.BATCH_WINDOW)
+        await self.flush()
+
+    async def _send_all(self, payload: str):
+        """
+        Send one text frame to all connected clients.
+
+        Args:
+            payload: JSON text to send
+        """
         disconnected = []
 
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.error(f"Error sending to WebSocket: {e}")
                 disconnected.append(connection)
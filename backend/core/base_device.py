@@ -1,10 +1,27 @@
 """Base device class for all hardware plugins."""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from datetime import datetime
 
+# Shared by all devices for blocking driver calls (serial, sockets, ...)
+IO_POOL_WORKERS = 4
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Get the shared device I/O thread pool, creating it on first use."""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(
+            max_workers=IO_POOL_WORKERS, thread_name_prefix="device-io"
+        )
+    return _io_pool
+
 
 class DeviceStatus(Enum):
     """Device connection status."""
@@ -20,8 +37,16 @@ class BaseDevice(ABC):
 
     All plugin devices must inherit from this class and implement
     the abstract methods.
+
+    The base attributes live in ``__slots__``; subclasses that do not
+    declare their own slots still get a ``__dict__`` for extra state.
     """
 
+    __slots__ = (
+        "instance_id", "config", "_status", "_connected",
+        "error_message", "last_health_check",
+    )
+
     def __init__(self, instance_id: str, config: Dict[str, Any]):
         """
         Initialize device instance.
@@ -32,10 +57,21 @@ class BaseDevice(ABC):
         """
         self.instance_id = instance_id
         self.config = config
-        self.status = DeviceStatus.DISCONNECTED
+        self.status = DeviceStatus.DISCONNECTED  # also sets _connected
         self.error_message: Optional[str] = None
         self.last_health_check: Optional[datetime] = None
 
+    @property
+    def status(self) -> DeviceStatus:
+        """Current connection status."""
+        return self._status
+
+    @status.setter
+    def status(self, value: DeviceStatus) -> None:
+        self._status = value
+        # Kept in step with status so is_connected() is a plain attribute read
+        self._connected = value is DeviceStatus.CONNECTED
+
     @abstractmethod
     async def connect(self) -> bool:
         """
@@ -76,6 +112,27 @@ class BaseDevice(ABC):
         """
         pass
 
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking driver call in the shared device I/O pool.
+
+        Use this for synchronous hardware APIs (e.g. pyserial reads and
+        writes) so they do not stall the event loop and other pipeline
+        steps.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_io_pool(), functools.partial(func, *args, **kwargs)
+        )
+
     def set_error(self, message: str) -> None:
         """
         Set device error state.
@@ -94,7 +151,7 @@ class BaseDevice(ABC):
 
     def is_connected(self) -> bool:
         """Check if device is currently connected."""
-        return self.status == DeviceStatus.CONNECTED
+        return self._connected
 
     def get_status(self) -> str:
         """Get current status as string."""
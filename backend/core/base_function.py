@@ -1,9 +1,54 @@
 """Base function class for all device functions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Callable, List
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Callable, List, Mapping, NamedTuple, Tuple
 from .base_device import BaseDevice
 
+# Type check for each schema type string
+_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "number": lambda value: isinstance(value, (int, float)),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "object": lambda value: isinstance(value, dict),
+    "trigger": lambda value: isinstance(value, bool),
+    "any": lambda value: True
+}
+
+
+class CompiledSchema(NamedTuple):
+    """Input schema flattened for validation (see compile_schema)."""
+
+    required: Tuple[str, ...]
+    defaults: Mapping[str, Any]
+    type_checks: Tuple[Tuple[str, str, Callable[[Any], bool]], ...]
+
+
+def compile_schema(schema: Dict[str, Dict[str, Any]]) -> CompiledSchema:
+    """
+    Flatten an input schema into the lookups validate_inputs needs.
+
+    Args:
+        schema: Schema in the validate_inputs format
+
+    Returns:
+        Required input names, default values and per-input type checks
+    """
+    required = tuple(
+        name for name, spec in schema.items() if spec.get("required", False)
+    )
+    defaults = MappingProxyType({
+        name: spec["default"] for name, spec in schema.items() if "default" in spec
+    })
+    # "any" and unknown types accept every value, so they need no check
+    type_checks = tuple(
+        (name, spec["type"], _VALIDATORS[spec["type"]])
+        for name, spec in schema.items()
+        if spec.get("type") in _VALIDATORS and spec["type"] != "any"
+    )
+    return CompiledSchema(required, defaults, type_checks)
+
 
 class BaseFunction(ABC):
     """
@@ -11,8 +56,23 @@ class BaseFunction(ABC):
 
     Each function represents a specific operation that can be performed
     on a device (e.g., move, read, write, etc.).
+
+    Subclasses may declare their input schema as a ``_SCHEMA`` class
+    attribute; it is compiled once when the class is defined and used by
+    ``validate_inputs()`` when no schema is passed.
     """
 
+    __slots__ = ("device_instance", "_log_callback", "_logs")
+
+    _SCHEMA: Dict[str, Dict[str, Any]] = {}
+    _compiled_schema: CompiledSchema = compile_schema({})
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the subclass input schema once at class creation."""
+        super().__init_subclass__(**kwargs)
+        if "_SCHEMA" in cls.__dict__:
+            cls._compiled_schema = compile_schema(cls._SCHEMA)
+
     def __init__(self, device_instance: BaseDevice):
         """
         Initialize function with device instance.
@@ -71,14 +131,15 @@ class BaseFunction(ABC):
     def validate_inputs(
         self,
         inputs: Dict[str, Any],
-        schema: Dict[str, Dict[str, Any]]
+        schema: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> bool:
         """
         Validate inputs against schema.
 
         Args:
             inputs: Input parameters to validate
-            schema: Schema defining required inputs
+            schema: Schema defining required inputs, or None to use the
+                class ``_SCHEMA`` compiled at class creation
                 Example: {
                     "position": {"type": "number", "required": True},
                     "speed": {"type": "number", "required": False, "default": 100.0}
@@ -90,22 +151,23 @@ class BaseFunction(ABC):
         Raises:
             ValueError: If required inputs are missing or types are invalid
         """
-        for input_name, input_schema in schema.items():
-            is_required = input_schema.get("required", False)
-            expected_type = input_schema.get("type")
+        compiled = self._compiled_schema if schema is None else compile_schema(schema)
 
-            # Check required inputs
-            if is_required and input_name not in inputs:
+        # Check required inputs
+        for input_name in compiled.required:
+            if input_name not in inputs:
                 raise ValueError(f"Required input '{input_name}' is missing")
 
-            # Apply default values
-            if input_name not in inputs and "default" in input_schema:
-                inputs[input_name] = input_schema["default"]
+        # Apply default values
+        for input_name, default in compiled.defaults.items():
+            if input_name not in inputs:
+                inputs[input_name] = default
 
-            # Validate type if input is present
-            if input_name in inputs and expected_type:
+        # Validate type if input is present
+        for input_name, expected_type, is_valid in compiled.type_checks:
+            if input_name in inputs:
                 value = inputs[input_name]
-                if not self._validate_type(value, expected_type):
+                if not is_valid(value):
                     raise ValueError(
                         f"Input '{input_name}' has invalid type. "
                         f"Expected: {expected_type}, Got: {type(value).__name__}"
@@ -124,25 +186,12 @@ class BaseFunction(ABC):
         Returns:
             True if type matches
         """
-        type_map = {
-            "number": (int, float),
-            "string": str,
-            "boolean": bool,
-            "array": (list, tuple),
-            "object": dict,
-            "trigger": bool,
-            "any": object
-        }
-
-        if expected_type == "any":
-            return True
-
-        expected_python_type = type_map.get(expected_type)
-        if expected_python_type is None:
+        validator = _VALIDATORS.get(expected_type)
+        if validator is None:
             # Unknown type, assume valid
             return True
 
-        return isinstance(value, expected_python_type)
+        return validator(value)
 
     def get_function_info(self) -> Dict[str, Any]:
         """
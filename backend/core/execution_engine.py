@@ -2,12 +2,23 @@
 
 import asyncio
 import logging
+import sys
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 import networkx as nx
 from .device_manager import DeviceManager
 from .plugin_loader import PluginLoader
+from domain.events import (
+    PipelineStartedEvent,
+    NodeExecutingEvent,
+    NodeCompletedEvent,
+    NodeLogEvent,
+    PipelineCompletedEvent,
+    PipelineErrorEvent,
+)
 from domain.exceptions import (
     PipelineExecutionError,
     NodeExecutionError,
@@ -21,6 +32,31 @@ logger = logging.getLogger(__name__)
 MAX_COMPOSITE_DEPTH = 5
 
 
+def _intern_id(value: Any) -> Any:
+    """Intern a string node ID; other values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledPipeline:
+    """
+    Pipeline definition with its execution plan precomputed.
+
+    Built by ExecutionEngine.compile_pipeline(); executing it again skips
+    graph construction, cycle detection and level grouping.
+    """
+
+    definition: Dict[str, Any]
+    order: Tuple[str, ...]
+    levels: Tuple[Tuple[str, ...], ...]
+    nodes: Mapping[str, Dict[str, Any]]
+
+
+def _index_nodes(nodes: List[Dict[str, Any]]) -> Mapping[str, Dict[str, Any]]:
+    """Map interned node IDs to their definitions, read-only."""
+    return MappingProxyType({_intern_id(node["id"]): node for node in nodes})
+
+
 class ExecutionEngine:
     """
     Pipeline execution engine.
@@ -49,71 +85,146 @@ class ExecutionEngine:
         self.plugin_loader = plugin_loader
         self.event_bus = event_bus
         self.composite_repository = composite_repository
-        self.data_store: Dict[str, Dict[str, Any]] = {}
+
+        # Node outputs of the run in progress. A context variable gives each
+        # execute_pipeline() call (and each composite subgraph, which runs in
+        # its own task next to sibling nodes) its own store, so concurrent
+        # runs on one engine do not see each other's results
+        self._data_store_var: ContextVar[Dict[str, Dict[str, Any]]] = ContextVar(
+            f"data_store_{id(self)}"
+        )
+        # Store of the most recently finished run, for get_execution_results()
+        self._last_data_store: Dict[str, Dict[str, Any]] = {}
+
+        # Event classes published by the engine, keyed by type name
+        self._event_classes: Dict[str, type] = {
+            "PipelineStartedEvent": PipelineStartedEvent,
+            "NodeExecutingEvent": NodeExecutingEvent,
+            "NodeCompletedEvent": NodeCompletedEvent,
+            "NodeLogEvent": NodeLogEvent,
+            "PipelineCompletedEvent": PipelineCompletedEvent,
+            "PipelineErrorEvent": PipelineErrorEvent,
+        }
+
+        # Built-in logic plugin handlers, keyed by function ID
+        self._logic_dispatch = {
+            "delay": self._logic_delay,
+            "branch": self._logic_branch,
+            "print": self._logic_print,
+            "set_variable": self._logic_set_variable,
+        }
 
         logger.info("ExecutionEngine initialized")
 
+    @property
+    def data_store(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Node outputs of the run in progress in the calling task, or else of
+        the most recently finished run.
+        """
+        return self._data_store_var.get(self._last_data_store)
+
     def set_composite_repository(self, composite_repository):
         """Set the composite repository after initialization."""
         self.composite_repository = composite_repository
 
-    async def execute_pipeline(self, pipeline_def: Dict[str, Any]) -> Dict[str, Any]:
+    def compile_pipeline(self, pipeline_def: Dict[str, Any]) -> CompiledPipeline:
         """
-        Execute a complete pipeline.
+        Build the execution plan for a pipeline definition.
 
         Args:
             pipeline_def: Pipeline definition containing nodes and edges
 
+        Returns:
+            Compiled pipeline that execute_pipeline() can run repeatedly
+
+        Raises:
+            CircularDependencyError: If the pipeline graph has a cycle
+            PipelineExecutionError: If no execution order can be determined
+        """
+        pipeline_id = pipeline_def.get("pipeline_id", "unknown")
+
+        # Build execution graph
+        graph = self._build_execution_graph(pipeline_def)
+
+        # Check for cycles
+        if not nx.is_directed_acyclic_graph(graph):
+            # Find cycles to provide better error message
+            cycles = list(nx.simple_cycles(graph))
+            cycle = cycles[0] if cycles else []
+            raise CircularDependencyError(
+                cycle=[str(node) for node in cycle],
+                details={"all_cycles": [[str(n) for n in c] for c in cycles]}
+            )
+
+        # Get execution order (topological sort)
+        try:
+            execution_order = tuple(nx.topological_sort(graph))
+        except nx.NetworkXError as e:
+            raise PipelineExecutionError(
+                pipeline_id=pipeline_id,
+                message="Cannot determine execution order",
+                cause=e,
+                details={"error": str(e)}
+            )
+
+        logger.info(f"Execution order: {execution_order}")
+
+        # Group nodes by execution level for parallel execution
+        execution_levels = self._group_by_execution_level(graph, execution_order)
+
+        return CompiledPipeline(
+            definition=pipeline_def,
+            order=execution_order,
+            levels=execution_levels,
+            nodes=_index_nodes(pipeline_def.get("nodes", []))
+        )
+
+    async def execute_pipeline(
+        self,
+        pipeline: Union[Dict[str, Any], CompiledPipeline]
+    ) -> Dict[str, Any]:
+        """
+        Execute a complete pipeline.
+
+        Args:
+            pipeline: Pipeline definition containing nodes and edges, or a
+                pipeline already compiled with compile_pipeline()
+
         Returns:
             Execution results
         """
+        if isinstance(pipeline, CompiledPipeline):
+            compiled = pipeline
+            pipeline_def = compiled.definition
+        else:
+            compiled = None
+            pipeline_def = pipeline
+
         pipeline_id = pipeline_def.get("pipeline_id", "unknown")
         pipeline_name = pipeline_def.get("name", "Unknown Pipeline")
         logger.info(f"Executing pipeline: {pipeline_id}")
 
         start_time = time.time()
 
-        try:
-            # Build execution graph
-            graph = self._build_execution_graph(pipeline_def)
-
-            # Check for cycles
-            if not nx.is_directed_acyclic_graph(graph):
-                # Find cycles to provide better error message
-                cycles = list(nx.simple_cycles(graph))
-                cycle = cycles[0] if cycles else []
-                raise CircularDependencyError(
-                    cycle=[str(node) for node in cycle],
-                    details={"all_cycles": [[str(n) for n in c] for c in cycles]}
-                )
+        data_store: Dict[str, Dict[str, Any]] = {}
+        token = self._data_store_var.set(data_store)
 
-            # Get execution order (topological sort)
-            try:
-                execution_order = list(nx.topological_sort(graph))
-            except nx.NetworkXError as e:
-                raise PipelineExecutionError(
-                    pipeline_id=pipeline_id,
-                    message="Cannot determine execution order",
-                    cause=e,
-                    details={"error": str(e)}
-                )
-
-            logger.info(f"Execution order: {execution_order}")
+        try:
+            if compiled is None:
+                compiled = self.compile_pipeline(pipeline_def)
 
-            # Group nodes by execution level for parallel execution
-            execution_levels = self._group_by_execution_level(graph, execution_order)
+            execution_order = compiled.order
+            execution_levels = compiled.levels
 
             # 🆕 Publish pipeline started event
             await self._publish_event("PipelineStartedEvent", {
                 "pipeline_id": pipeline_id,
                 "pipeline_name": pipeline_name,
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "node_count": len(execution_order)
             })
 
-            # Clear data store
-            self.data_store = {}
-
             # Execute nodes level by level (parallel within each level)
             nodes_executed = 0
             for level_idx, level_nodes in enumerate(execution_levels):
@@ -121,7 +232,7 @@ class ExecutionEngine:
 
                 # Publish executing events for all nodes in this level
                 for node_id in level_nodes:
-                    node = self._find_node(node_id, pipeline_def)
+                    node = compiled.nodes.get(node_id)
                     node_label = node.get("label", node_id) if node else node_id
                     await self._publish_event("NodeExecutingEvent", {
                         "pipeline_id": pipeline_id,
@@ -129,27 +240,27 @@ class ExecutionEngine:
                         "label": node_label,
                         "node_type": node.get("type") if node else "unknown",
                         "function_id": node.get("function_id") if node else None,
-                        "timestamp": datetime.now()
+                        "timestamp": time.time()
                     })
 
                 # Execute all nodes in this level in parallel
                 level_start = time.time()
                 await asyncio.gather(*[
-                    self._execute_node(node_id, pipeline_def)
+                    self._execute_node(node_id, pipeline_def, compiled.nodes)
                     for node_id in level_nodes
                 ])
                 level_time = time.time() - level_start
 
                 # Publish completed events for all nodes in this level
                 for node_id in level_nodes:
-                    node = self._find_node(node_id, pipeline_def)
+                    node = compiled.nodes.get(node_id)
                     node_label = node.get("label", node_id) if node else node_id
                     await self._publish_event("NodeCompletedEvent", {
                         "pipeline_id": pipeline_id,
                         "node_id": node_id,
                         "label": node_label,
-                        "timestamp": datetime.now(),
-                        "outputs": self.data_store.get(node_id, {}),
+                        "timestamp": time.time(),
+                        "outputs": data_store.get(node_id, {}),
                         "execution_time": level_time
                     })
 
@@ -165,7 +276,7 @@ class ExecutionEngine:
             # 🆕 Publish pipeline completed event
             await self._publish_event("PipelineCompletedEvent", {
                 "pipeline_id": pipeline_id,
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "success": True,
                 "execution_time": execution_time,
                 "nodes_executed": nodes_executed
@@ -175,7 +286,7 @@ class ExecutionEngine:
                 "success": True,
                 "nodes_executed": nodes_executed,
                 "execution_time": execution_time,
-                "results": self.data_store
+                "results": data_store
             }
 
         except Exception as e:
@@ -185,7 +296,7 @@ class ExecutionEngine:
             # 🆕 Publish pipeline error event
             await self._publish_event("PipelineErrorEvent", {
                 "pipeline_id": pipeline_id,
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "error_message": str(e),
                 "node_id": None,
                 "error_type": type(e).__name__
@@ -195,10 +306,14 @@ class ExecutionEngine:
                 "success": False,
                 "nodes_executed": 0,
                 "execution_time": execution_time,
-                "results": self.data_store,
+                "results": data_store,
                 "error": str(e)
             }
 
+        finally:
+            self._data_store_var.reset(token)
+            self._last_data_store = data_store
+
     def _build_execution_graph(self, pipeline_def: Dict[str, Any]) -> nx.DiGraph:
         """
         Build execution graph from pipeline definition.
@@ -211,15 +326,18 @@ class ExecutionEngine:
         """
         graph = nx.DiGraph()
 
-        # Add all nodes
+        # Graph keys are interned IDs; the definition itself is left untouched
+        # since it belongs to the caller
         for node in pipeline_def.get("nodes", []):
-            graph.add_node(node["id"])
+            graph.add_node(_intern_id(node["id"]))
 
         # Add edges (dependencies)
         for edge in pipeline_def.get("edges", []):
-            source = edge["source"]
-            target = edge["target"]
-            graph.add_edge(source, target, edge_data=edge)
+            graph.add_edge(
+                _intern_id(edge["source"]),
+                _intern_id(edge["target"]),
+                edge_data=edge
+            )
 
         logger.debug(f"Built execution graph with {len(graph.nodes)} nodes and {len(graph.edges)} edges")
 
@@ -229,6 +347,7 @@ class ExecutionEngine:
         self,
         node_id: str,
         pipeline_def: Dict[str, Any],
+        nodes: Mapping[str, Dict[str, Any]],
         depth: int = 0
     ):
         """
@@ -237,9 +356,10 @@ class ExecutionEngine:
         Args:
             node_id: Node identifier
             pipeline_def: Pipeline definition
+            nodes: Node definitions of pipeline_def by ID
             depth: Current nesting depth for composite nodes
         """
-        node = self._find_node(node_id, pipeline_def)
+        node = nodes.get(node_id)
         if node is None:
             raise NodeExecutionError(
                 node_id=node_id,
@@ -278,7 +398,7 @@ class ExecutionEngine:
                 )
         elif node_type == "for_loop":
             try:
-                result = await self._execute_for_loop_node(node, pipeline_def, depth)
+                result = await self._execute_for_loop_node(node, pipeline_def, nodes, depth)
             except Exception as e:
                 if isinstance(e, NodeExecutionError):
                     raise
@@ -290,7 +410,7 @@ class ExecutionEngine:
                 )
         elif node_type == "while_loop":
             try:
-                result = await self._execute_while_loop_node(node, pipeline_def, depth)
+                result = await self._execute_while_loop_node(node, pipeline_def, nodes, depth)
             except Exception as e:
                 if isinstance(e, NodeExecutionError):
                     raise
@@ -381,10 +501,10 @@ class ExecutionEngine:
             "nodes": subgraph_nodes,
             "edges": subgraph_edges,
         }
+        subgraph_nodes_by_id = _index_nodes(subgraph_nodes)
 
-        # Save current data store and create isolated one for subgraph
-        parent_data_store = self.data_store
-        self.data_store = {}
+        # Isolated data store for the subgraph; the parent's is restored below
+        token = self._data_store_var.set({})
 
         try:
             # Map external inputs to internal nodes
@@ -415,12 +535,12 @@ class ExecutionEngine:
                     details={"composite_id": composite_id}
                 )
 
-            execution_order = list(nx.topological_sort(graph))
+            execution_order = tuple(nx.topological_sort(graph))
             logger.debug(f"Composite '{node_id}' execution order: {execution_order}")
 
             # Execute subgraph nodes
             for sub_node_id in execution_order:
-                await self._execute_node(sub_node_id, subgraph_pipeline, depth + 1)
+                await self._execute_node(sub_node_id, subgraph_pipeline, subgraph_nodes_by_id, depth + 1)
 
             # Collect outputs
             outputs = {}
@@ -443,12 +563,13 @@ class ExecutionEngine:
 
         finally:
             # Restore parent data store
-            self.data_store = parent_data_store
+            self._data_store_var.reset(token)
 
     async def _execute_for_loop_node(
         self,
         node: Dict[str, Any],
         pipeline_def: Dict[str, Any],
+        nodes: Mapping[str, Dict[str, Any]],
         depth: int = 0
     ) -> Dict[str, Any]:
         """
@@ -468,6 +589,7 @@ class ExecutionEngine:
         Args:
             node: For Loop node definition
             pipeline_def: Pipeline definition
+            nodes: Node definitions of pipeline_def by ID
             depth: Current nesting depth
 
         Returns:
@@ -519,7 +641,7 @@ class ExecutionEngine:
                 "label": node_label,
                 "node_type": "for_loop",
                 "function_id": None,
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "iteration": i + 1,
                 "total_iterations": count
             })
@@ -527,7 +649,7 @@ class ExecutionEngine:
             # Execute each body node
             for body_node_id in loop_body_nodes:
                 # Execute the body node and its downstream dependencies
-                await self._execute_loop_body(body_node_id, pipeline_def, depth)
+                await self._execute_loop_body(body_node_id, pipeline_def, nodes, depth)
 
         # Return completion status
         return {
@@ -541,6 +663,7 @@ class ExecutionEngine:
         self,
         node: Dict[str, Any],
         pipeline_def: Dict[str, Any],
+        nodes: Mapping[str, Dict[str, Any]],
         depth: int = 0
     ) -> Dict[str, Any]:
         """
@@ -560,6 +683,7 @@ class ExecutionEngine:
         Args:
             node: While Loop node definition
             pipeline_def: Pipeline definition
+            nodes: Node definitions of pipeline_def by ID
             depth: Current nesting depth
 
         Returns:
@@ -612,13 +736,13 @@ class ExecutionEngine:
                 "label": node_label,
                 "node_type": "while_loop",
                 "function_id": None,
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "iteration": iteration + 1
             })
 
             # Execute each body node
             for body_node_id in loop_body_nodes:
-                await self._execute_loop_body(body_node_id, pipeline_def, depth)
+                await self._execute_loop_body(body_node_id, pipeline_def, nodes, depth)
 
             iteration += 1
 
@@ -636,6 +760,7 @@ class ExecutionEngine:
         self,
         start_node_id: str,
         pipeline_def: Dict[str, Any],
+        nodes: Mapping[str, Dict[str, Any]],
         depth: int
     ):
         """
@@ -647,6 +772,7 @@ class ExecutionEngine:
         Args:
             start_node_id: Starting node ID
             pipeline_def: Pipeline definition
+            nodes: Node definitions of pipeline_def by ID
             depth: Current nesting depth
         """
         # Build a subgraph of nodes reachable from start_node_id
@@ -661,13 +787,13 @@ class ExecutionEngine:
             visited.add(current_id)
 
             # Execute this node
-            await self._execute_node(current_id, pipeline_def, depth + 1)
+            await self._execute_node(current_id, pipeline_def, nodes, depth + 1)
 
             # Find downstream nodes connected to this node's outputs
             for edge in pipeline_def.get("edges", []):
                 if edge["source"] == current_id:
                     target_id = edge["target"]
-                    target_node = self._find_node(target_id, pipeline_def)
+                    target_node = nodes.get(target_id)
 
                     # Don't follow edges to other control flow nodes
                     if target_node:
@@ -807,7 +933,7 @@ class ExecutionEngine:
                 "pipeline_id": "direct_execution",
                 "node_id": f"{plugin_id}.{function_id}",
                 "label": f"{plugin_id}.{function_id}",
-                "timestamp": datetime.now(),
+                "timestamp": time.time(),
                 "message": log_entry.get("message", ""),
                 "level": log_entry.get("level", "info")
             })
@@ -827,40 +953,44 @@ class ExecutionEngine:
         Returns:
             Function outputs
         """
-        import asyncio
-
-        if function_id == "delay":
-            # Get duration from config (in milliseconds)
-            duration_ms = inputs.get('duration_ms', 1000)
-            duration_sec = duration_ms / 1000.0
-            logger.info(f"Delay: waiting {duration_ms}ms")
-            await asyncio.sleep(duration_sec)
-            logger.info(f"Delay: complete")
+        handler = self._logic_dispatch.get(function_id)
+        if handler is None:
+            # Unknown logic function - return trigger complete
+            logger.warning(f"Unknown logic function: {function_id}")
             return {'complete': True}
 
-        elif function_id == "branch":
-            condition = inputs.get('condition', False)
-            logger.info(f"Branch: condition is {condition}")
-            if condition:
-                return {'true': True, 'false': False}
-            else:
-                return {'true': False, 'false': True}
-
-        elif function_id == "print":
-            message = inputs.get('message', '')
-            print(f"[Pipeline Print] {message}")
-            logger.info(f"Print: {message}")
-            return {'complete': True}
+        return await handler(inputs)
+
+    async def _logic_delay(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for duration_ms milliseconds."""
+        duration_ms = inputs.get('duration_ms', 1000)
+        duration_sec = duration_ms / 1000.0
+        logger.info(f"Delay: waiting {duration_ms}ms")
+        await asyncio.sleep(duration_sec)
+        logger.info(f"Delay: complete")
+        return {'complete': True}
+
+    async def _logic_branch(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Route the trigger to the true or false output."""
+        condition = inputs.get('condition', False)
+        logger.info(f"Branch: condition is {condition}")
+        if condition:
+            return {'true': True, 'false': False}
+        else:
+            return {'true': False, 'false': True}
 
-        elif function_id == "set_variable":
-            value = inputs.get('value', None)
-            logger.info(f"SetVariable: value = {value}")
-            return {'complete': True, 'value': value}
+    async def _logic_print(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Print a message to the console."""
+        message = inputs.get('message', '')
+        print(f"[Pipeline Print] {message}")
+        logger.info(f"Print: {message}")
+        return {'complete': True}
 
-        else:
-            # Unknown logic function - return trigger complete
-            logger.warning(f"Unknown logic function: {function_id}")
-            return {'complete': True}
+    async def _logic_set_variable(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Pass the value input through."""
+        value = inputs.get('value', None)
+        logger.info(f"SetVariable: value = {value}")
+        return {'complete': True, 'value': value}
 
     async def _collect_inputs(
         self,
@@ -875,14 +1005,12 @@ class ExecutionEngine:
             pipeline_def: Pipeline definition
 
         Returns:
-            Collected inputs dictionary
+            Collected inputs dictionary (always a new dict owned by the caller)
         """
+        # Overrides for the node config (default values)
         inputs = {}
         node_id = node["id"]
-
-        # Start with node config (default values)
-        node_config = node.get("config", {})
-        inputs.update(node_config)
+        node_config = node.get("config")
 
         # Check for injected inputs from composite node execution
         # These are stored with __input__ prefix during subgraph execution
@@ -918,43 +1046,48 @@ class ExecutionEngine:
                 else:
                     logger.warning(f"Source node '{source_node_id}' has no output data")
 
-        return inputs
+        # Merge config defaults only when both sides are non-empty
+        if not node_config:
+            return inputs
+        if not inputs:
+            return dict(node_config)
+        return {**node_config, **inputs}
 
-    def _find_node(self, node_id: str, pipeline_def: Dict[str, Any]) -> Dict[str, Any]:
+    def get_execution_results(self) -> Mapping[str, Dict[str, Any]]:
         """
-        Find a node by ID in pipeline definition.
+        Get execution results (data store).
 
-        Args:
-            node_id: Node identifier
-            pipeline_def: Pipeline definition
+        Inside a run (its task or tasks it spawned) this is the live store
+        of that run. Anywhere else, such as an API request handled while a
+        pipeline executes, it is the store of the most recently finished
+        run; results of runs still in progress are not visible.
 
         Returns:
-            Node definition or None if not found
+            Read-only view of the data store containing all node outputs
         """
-        for node in pipeline_def.get("nodes", []):
-            if node["id"] == node_id:
-                return node
-        return None
+        return MappingProxyType(self.data_store)
 
-    def get_execution_results(self) -> Dict[str, Dict[str, Any]]:
+    def snapshot_execution_results(self) -> Dict[str, Dict[str, Any]]:
         """
-        Get execution results (data store).
+        Get a mutable copy of the execution results.
+
+        Reads the same store as get_execution_results().
 
         Returns:
-            Data store containing all node outputs
+            Copy of the data store with each node's outputs copied as well
         """
-        return self.data_store.copy()
+        return {node_id: dict(outputs) for node_id, outputs in self.data_store.items()}
 
     def clear_execution_results(self):
         """Clear execution results."""
-        self.data_store = {}
+        self._last_data_store = {}
         logger.debug("Execution results cleared")
 
     def _group_by_execution_level(
         self,
         graph: nx.DiGraph,
-        execution_order: List[str]
-    ) -> List[List[str]]:
+        execution_order: Tuple[str, ...]
+    ) -> Tuple[Tuple[str, ...], ...]:
         """
         Group nodes by execution level for parallel execution.
 
@@ -974,21 +1107,21 @@ class ExecutionEngine:
 
         while remaining:
             # Find nodes whose dependencies are all executed
-            current_level = [
+            current_level = tuple(
                 node for node in remaining
                 if all(pred in executed for pred in graph.predecessors(node))
-            ]
+            )
 
             if not current_level:
                 # Safety: if no nodes can be executed, take first remaining
-                current_level = [next(iter(remaining))]
+                current_level = (next(iter(remaining)),)
 
             levels.append(current_level)
             executed.update(current_level)
-            remaining -= set(current_level)
+            remaining.difference_update(current_level)
 
         logger.info(f"Grouped into {len(levels)} execution levels: {[len(l) for l in levels]} nodes per level")
-        return levels
+        return tuple(levels)
 
     async def _publish_event(self, event_type: str, event_data: Dict[str, Any]):
         """
@@ -1002,33 +1135,15 @@ class ExecutionEngine:
             logger.debug(f"Event bus not available, skipping event: {event_type}")
             return
 
-        try:
-            # Dynamically import event classes
-            from domain.events import (
-                PipelineStartedEvent,
-                NodeExecutingEvent,
-                NodeCompletedEvent,
-                NodeLogEvent,
-                PipelineCompletedEvent,
-                PipelineErrorEvent
-            )
-
-            event_classes = {
-                "PipelineStartedEvent": PipelineStartedEvent,
-                "NodeExecutingEvent": NodeExecutingEvent,
-                "NodeCompletedEvent": NodeCompletedEvent,
-                "NodeLogEvent": NodeLogEvent,
-                "PipelineCompletedEvent": PipelineCompletedEvent,
-                "PipelineErrorEvent": PipelineErrorEvent
-            }
+        event_class = self._event_classes.get(event_type)
+        if event_class is None:
+            logger.warning(f"Unknown event type: {event_type}")
+            return
 
-            if event_type in event_classes:
-                event_class = event_classes[event_type]
-                event = event_class(**event_data)
-                await self.event_bus.publish(event)
-                logger.debug(f"Published event: {event_type}")
-            else:
-                logger.warning(f"Unknown event type: {event_type}")
+        try:
+            event = event_class(**event_data)
+            await self.event_bus.publish(event)
+            logger.debug(f"Published event: {event_type}")
 
         except Exception as e:
             logger.error(f"Error publishing event {event_type}: {e}")
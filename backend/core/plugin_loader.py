@@ -1,13 +1,22 @@
 """Plugin loader for dynamic plugin discovery and loading."""
 
+import asyncio
 import importlib.util
 import logging
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Directory holding the core package; plugins import core.* from here
+_BACKEND_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Parsed plugin configs per plugin directory, shared by all loaders in the
+# process and keyed by the (name, config.yaml mtime) of every plugin in it
+_discovery_cache: Dict[Path, Tuple[Tuple[Tuple[str, int], ...], List[Optional[Dict[str, Any]]]]] = {}
+
 
 class PluginLoader:
     """
@@ -34,6 +43,10 @@ class PluginLoader:
         # Create plugin directory if it doesn't exist
         self.plugin_dir.mkdir(parents=True, exist_ok=True)
 
+        # Make core.* importable from plugin modules (once per process)
+        if _BACKEND_ROOT not in sys.path:
+            sys.path.append(_BACKEND_ROOT)
+
         logger.info(f"PluginLoader initialized with directory: {self.plugin_dir}")
 
     async def discover_plugins(self) -> List[Dict[str, Any]]:
@@ -49,17 +62,34 @@ class PluginLoader:
             logger.warning(f"Plugin directory does not exist: {self.plugin_dir}")
             return discovered_plugins
 
-        for plugin_path in self.plugin_dir.iterdir():
+        plugin_paths = [
+            plugin_path
+            for plugin_path in self.plugin_dir.iterdir()
             # Skip non-directories and private folders
-            if not plugin_path.is_dir() or plugin_path.name.startswith('_'):
-                continue
-
+            if plugin_path.is_dir() and not plugin_path.name.startswith('_')
             # Check if valid plugin
-            if not self._validate_plugin(plugin_path):
-                continue
-
+            and self._validate_plugin(plugin_path)
+        ]
+
+        cache_dir = self.plugin_dir.resolve()
+        cache_key = tuple(
+            (plugin_path.name, (plugin_path / "config.yaml").stat().st_mtime_ns)
+            for plugin_path in plugin_paths
+        )
+        cached = _discovery_cache.get(cache_dir)
+
+        if cached is not None and cached[0] == cache_key:
+            configs = cached[1]
+        else:
+            # Read the config files concurrently, off the event loop
+            configs = await asyncio.gather(*(
+                asyncio.to_thread(self._load_plugin_config, plugin_path)
+                for plugin_path in plugin_paths
+            ))
+            _discovery_cache[cache_dir] = (cache_key, configs)
+
+        for plugin_path, config in zip(plugin_paths, configs):
             try:
-                config = self._load_plugin_config(plugin_path)
                 if config:
                     plugin_info = self._extract_plugin_info(config, plugin_path.name)
                     discovered_plugins.append(plugin_info)
@@ -199,6 +229,10 @@ class PluginLoader:
         """
         Dynamically load a Python module.
 
+        Modules are registered in ``sys.modules`` and reused as long as they
+        came from the same source file and its mtime is unchanged, so
+        repeated loads skip ``exec_module``.
+
         Args:
             module_path: Path to the module file
             module_name: Name for the module
@@ -206,12 +240,31 @@ class PluginLoader:
         Returns:
             Loaded module
         """
+        mtime = module_path.stat().st_mtime_ns
+
+        # Another plugin directory may hold a plugin with the same id (and,
+        # if copied with its timestamps, the same mtime), so match the file
+        cached = sys.modules.get(module_name)
+        if (
+            cached is not None
+            and getattr(cached, "__file__", None) == str(module_path)
+            and getattr(cached, "__mtime__", None) == mtime
+        ):
+            return cached
+
         spec = importlib.util.spec_from_file_location(module_name, module_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Cannot load module from {module_path}")
 
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(module_name, None)
+            raise
+
+        module.__mtime__ = mtime
         return module
 
     def _to_class_name(self, func_id: str) -> str:
@@ -273,6 +326,10 @@ class PluginLoader:
         if plugin_id in self.loaded_modules:
             del self.loaded_modules[plugin_id]
 
+        # Force re-execution of the plugin modules
+        for module_name in (f"{plugin_id}.device", f"{plugin_id}.functions"):
+            sys.modules.pop(module_name, None)
+
         return await self.load_plugin(plugin_id)
 
     def unload_plugin(self, plugin_id: str) -> bool:
@@ -1,11 +1,17 @@
 """Composite Node entity definition."""
 
+import copy
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+import orjson
 
-@dataclass
+# Attributes holding derived data; assigning them does not invalidate caches
+_CACHE_ATTRS = frozenset({"_json_cache", "_node_repr_cache", "_validation_cache"})
+
+
+@dataclass(slots=True, frozen=True)
 class CompositeInput:
     """Input pin mapping for Composite Node."""
     name: str           # External pin name
@@ -14,8 +20,27 @@ class CompositeInput:
     description: str = ""
     default_value: Any = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompositeInput":
+        """
+        Create from dictionary.
+
+        Raises:
+            ValueError: If a required key is missing
+        """
+        try:
+            return cls(
+                name=data["name"],
+                type=data["type"],
+                maps_to=data["maps_to"],
+                description=data.get("description", ""),
+                default_value=data.get("default_value"),
+            )
+        except KeyError as e:
+            raise ValueError(f"missing input.{e.args[0]}") from None
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompositeOutput:
     """Output pin mapping for Composite Node."""
     name: str           # External pin name
@@ -23,8 +48,26 @@ class CompositeOutput:
     maps_from: str      # Internal node.pin (e.g., "node5.output1")
     description: str = ""
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompositeOutput":
+        """
+        Create from dictionary.
+
+        Raises:
+            ValueError: If a required key is missing
+        """
+        try:
+            return cls(
+                name=data["name"],
+                type=data["type"],
+                maps_from=data["maps_from"],
+                description=data.get("description", ""),
+            )
+        except KeyError as e:
+            raise ValueError(f"missing output.{e.args[0]}") from None
+
 
-@dataclass
+@dataclass(slots=True)
 class CompositeNodeDefinition:
     """
     Composite Node Definition.
@@ -53,6 +96,25 @@ class CompositeNodeDefinition:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Cached serializations (cleared whenever a field is reassigned)
+    _json_cache: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _node_repr_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validation_cache: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and invalidate cached serializations."""
+        object.__setattr__(self, name, value)
+        if name not in _CACHE_ATTRS:
+            object.__setattr__(self, "_json_cache", None)
+            object.__setattr__(self, "_node_repr_cache", None)
+            object.__setattr__(self, "_validation_cache", None)
+
     def __post_init__(self):
         """Initialize timestamps if not provided."""
         if self.created_at is None:
@@ -61,12 +123,17 @@ class CompositeNodeDefinition:
             self.updated_at = datetime.now()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+        """
+        Convert to dictionary for serialization.
+
+        Builds a fresh dict (with a copy of the subgraph) on every call, so
+        callers may modify the result. Use to_json() for the cached form.
+        """
         return {
             "composite_id": self.composite_id,
             "name": self.name,
             "description": self.description,
-            "subgraph": self.subgraph,
+            "subgraph": copy.deepcopy(self.subgraph),
             "inputs": [
                 {
                     "name": inp.name,
@@ -94,29 +161,23 @@ class CompositeNodeDefinition:
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
 
+    def to_json(self) -> bytes:
+        """
+        Serialize to_dict() as JSON bytes.
+
+        The immutable result is cached until a field is reassigned; edits
+        made in place to subgraph, inputs or outputs must be followed by
+        reassigning the field to take effect.
+        """
+        if self._json_cache is None:
+            self._json_cache = orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return self._json_cache
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CompositeNodeDefinition":
         """Create from dictionary."""
-        inputs = [
-            CompositeInput(
-                name=inp["name"],
-                type=inp["type"],
-                maps_to=inp["maps_to"],
-                description=inp.get("description", ""),
-                default_value=inp.get("default_value"),
-            )
-            for inp in data.get("inputs", [])
-        ]
-
-        outputs = [
-            CompositeOutput(
-                name=out["name"],
-                type=out["type"],
-                maps_from=out["maps_from"],
-                description=out.get("description", ""),
-            )
-            for out in data.get("outputs", [])
-        ]
+        inputs = [CompositeInput.from_dict(inp) for inp in data.get("inputs", [])]
+        outputs = [CompositeOutput.from_dict(out) for out in data.get("outputs", [])]
 
         created_at = None
         if data.get("created_at"):
@@ -146,8 +207,12 @@ class CompositeNodeDefinition:
         Get the node representation for use in pipeline canvas.
 
         Returns a node definition that can be added to a pipeline.
+        The result is cached until a field is reassigned.
         """
-        return {
+        if self._node_repr_cache is not None:
+            return self._node_repr_cache
+
+        self._node_repr_cache = {
             "type": "composite",
             "composite_id": self.composite_id,
             "label": self.name,
@@ -162,13 +227,18 @@ class CompositeNodeDefinition:
                 for out in self.outputs
             ],
         }
+        return self._node_repr_cache
 
     def validate(self) -> List[str]:
         """
         Validate the composite node definition.
 
         Returns a list of validation errors (empty if valid).
+        The result is cached until a field is reassigned.
         """
+        if self._validation_cache is not None:
+            return list(self._validation_cache)
+
         errors = []
 
         if not self.composite_id:
@@ -188,13 +258,26 @@ class CompositeNodeDefinition:
                 errors.append("subgraph must contain 'edges'")
 
         # Validate input mappings
-        for inp in self.inputs:
-            if not inp.maps_to or "." not in inp.maps_to:
-                errors.append(f"Invalid input mapping for '{inp.name}': maps_to must be 'node_id.pin_name'")
+        errors.extend(
+            f"Invalid input mapping for '{inp.name}': maps_to must be 'node_id.pin_name'"
+            for inp in self.inputs
+            if not _is_pin_ref(inp.maps_to)
+        )
 
         # Validate output mappings
-        for out in self.outputs:
-            if not out.maps_from or "." not in out.maps_from:
-                errors.append(f"Invalid output mapping for '{out.name}': maps_from must be 'node_id.pin_name'")
+        errors.extend(
+            f"Invalid output mapping for '{out.name}': maps_from must be 'node_id.pin_name'"
+            for out in self.outputs
+            if not _is_pin_ref(out.maps_from)
+        )
+
+        self._validation_cache = errors
+        return list(errors)
+
 
-        return errors
+def _is_pin_ref(ref: Optional[str]) -> bool:
+    """Check that a pin reference has the form 'node_id.pin_name'."""
+    if not ref:
+        return False
+    node_id, sep, pin_name = ref.partition(".")
+    return bool(sep and node_id and pin_name)
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceConnectedEvent:
     """Event published when a device connects successfully."""
 
@@ -25,7 +25,7 @@ class DeviceConnectedEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceDisconnectedEvent:
     """Event published when a device disconnects."""
 
@@ -43,7 +43,7 @@ class DeviceDisconnectedEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeviceErrorEvent:
     """Event published when a device encounters an error."""
 
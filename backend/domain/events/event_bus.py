@@ -1,11 +1,38 @@
 """Event Bus for publish-subscribe pattern."""
 
 import asyncio
+import contextvars
+import inspect
 import logging
-from typing import Callable, Dict, List, Type, Any
+import weakref
+from typing import Callable, Dict, Hashable, Tuple, Type, Any
 
 logger = logging.getLogger(__name__)
 
+# Subscribed handler (or weak reference to it) with its precomputed
+# "is coroutine function" and "is weak reference" flags
+Subscription = Tuple[Callable, bool, bool]
+
+# Handler key -> (handler or WeakMethod, "is coroutine function" flag), in
+# subscription order. Plain functions are keyed by themselves; bound methods
+# by (id of instance, function), which stays hashable even when the
+# instance is not, so removal stays O(1).
+HandlerRegistry = Dict[Hashable, Tuple[Callable, bool]]
+
+
+async def _wrap_sync(handler: Callable, event: Any) -> None:
+    """Run a synchronous handler as a task-schedulable coroutine."""
+    handler(event)
+
+
+def _log_task_exception(task: asyncio.Task) -> None:
+    """Done callback that logs a failed handler task."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Exception in %s: %s", task.get_name(), exc, exc_info=exc)
+
 
 class EventBus:
     """
@@ -15,23 +42,39 @@ class EventBus:
     """
 
     def __init__(self):
-        """Initialize event bus."""
-        self._subscribers: Dict[Type, List[Callable]] = {}
-        self._lock = asyncio.Lock()
+        """
+        Initialize event bus.
+
+        Handler registries are copy-on-write: subscribe/unsubscribe always
+        assign a new dict, so publish can iterate without locking. Bound
+        methods are held weakly and dropped when their instance is
+        garbage-collected.
+        """
+        self._subscribers: Dict[Type, HandlerRegistry] = {}
+        self._wildcard: HandlerRegistry = {}
+        # Per concrete event type: subscriptions for every class in its
+        # MRO followed by wildcard subscriptions, as an immutable snapshot
+        # that publish iterates (rebuilt lazily after any change)
+        self._resolved: Dict[Type, Tuple[Subscription, ...]] = {}
 
     def subscribe(self, event_type: Type, handler: Callable) -> None:
         """
         Subscribe to an event type.
 
+        The handler also receives events of subclasses of event_type.
+        Subscribing the same handler twice has no additional effect.
+
         Args:
             event_type: Event class type
             handler: Async function to handle the event
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-
-        self._subscribers[event_type].append(handler)
-        logger.info(f"Subscribed {handler.__name__} to {event_type.__name__}")
+        key, target = self._entry(handler)
+        is_coro = asyncio.iscoroutinefunction(handler)
+        self._subscribers[event_type] = {
+            **self._subscribers.get(event_type, {}), key: (target, is_coro)
+        }
+        self._resolved.clear()
+        logger.info("Subscribed %s to %s", handler.__name__, event_type.__name__)
 
     def unsubscribe(self, event_type: Type, handler: Callable) -> None:
         """
@@ -41,12 +84,144 @@ class EventBus:
             event_type: Event class type
             handler: Handler function to remove
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(handler)
-                logger.info(f"Unsubscribed {handler.__name__} from {event_type.__name__}")
-            except ValueError:
-                logger.warning(f"Handler {handler.__name__} not found for {event_type.__name__}")
+        registry = self._subscribers.get(event_type)
+        if registry is None:
+            return
+
+        key = self._key(handler)
+        if key in registry:
+            registry = dict(registry)
+            del registry[key]
+            self._subscribers[event_type] = registry
+            self._resolved.clear()
+            logger.info("Unsubscribed %s from %s", handler.__name__, event_type.__name__)
+        else:
+            logger.warning("Handler %s not found for %s", handler.__name__, event_type.__name__)
+
+    def subscribe_all(self, handler: Callable) -> None:
+        """
+        Subscribe to every published event regardless of type.
+
+        Args:
+            handler: Async function to handle the event
+        """
+        key, target = self._entry(handler)
+        is_coro = asyncio.iscoroutinefunction(handler)
+        self._wildcard = {**self._wildcard, key: (target, is_coro)}
+        self._resolved.clear()
+        logger.info("Subscribed %s to all events", handler.__name__)
+
+    def unsubscribe_all(self, handler: Callable) -> None:
+        """
+        Remove a handler registered with subscribe_all.
+
+        Args:
+            handler: Handler function to remove
+        """
+        key = self._key(handler)
+        if key in self._wildcard:
+            wildcard = dict(self._wildcard)
+            del wildcard[key]
+            self._wildcard = wildcard
+            self._resolved.clear()
+            logger.info("Unsubscribed %s from all events", handler.__name__)
+        else:
+            logger.warning("Handler %s not found for all events", handler.__name__)
+
+    @staticmethod
+    def install_eager_task_factory(loop: asyncio.AbstractEventLoop) -> bool:
+        """
+        Run handler tasks eagerly on the loop hosting the bus.
+
+        With asyncio.eager_task_factory (Python 3.12+), the tasks publish
+        creates run their first step synchronously and only get scheduled
+        if the handler actually suspends, so short handlers skip the
+        loop round-trip. On older Pythons this is a no-op.
+
+        Args:
+            loop: Event loop that publishes events
+
+        Returns:
+            True if the eager task factory was installed
+        """
+        factory = getattr(asyncio, "eager_task_factory", None)
+        if factory is None:
+            logger.debug("Eager task factory unavailable; using default tasks")
+            return False
+        loop.set_task_factory(factory)
+        return True
+
+    @staticmethod
+    def _key(handler: Callable) -> Hashable:
+        """
+        Return the registry key for a handler.
+
+        Args:
+            handler: Handler function or bound method
+
+        Returns:
+            (id of instance, function) for bound methods, otherwise the
+            handler itself
+        """
+        if inspect.ismethod(handler):
+            return (id(handler.__self__), handler.__func__)
+        return handler
+
+    def _entry(self, handler: Callable) -> Tuple[Hashable, Callable]:
+        """
+        Return the registry key and stored target for a handler.
+
+        Args:
+            handler: Handler function or bound method
+
+        Returns:
+            The key and a WeakMethod for bound methods (removed from every
+            registry once its instance is garbage-collected), otherwise
+            the key and the handler itself
+        """
+        key = self._key(handler)
+        if inspect.ismethod(handler):
+            return key, weakref.WeakMethod(handler, lambda ref: self._purge(key, ref))
+        return key, handler
+
+    def _purge(self, key: Hashable, ref: weakref.WeakMethod) -> None:
+        """
+        Remove a dead bound-method handler from every registry.
+
+        Args:
+            key: Registry key the handler was stored under
+            ref: WeakMethod whose instance was garbage-collected
+        """
+        for event_type, registry in list(self._subscribers.items()):
+            if key in registry and registry[key][0] is ref:
+                registry = dict(registry)
+                del registry[key]
+                self._subscribers[event_type] = registry
+        if key in self._wildcard and self._wildcard[key][0] is ref:
+            wildcard = dict(self._wildcard)
+            del wildcard[key]
+            self._wildcard = wildcard
+        self._resolved.clear()
+
+    def _resolve(self, event_type: Type) -> Tuple[Subscription, ...]:
+        """
+        Build and cache the subscriptions that receive an event type.
+
+        Args:
+            event_type: Concrete event class
+
+        Returns:
+            Subscriptions for the class and its bases, then wildcard ones
+        """
+        registries = [self._subscribers.get(cls, {}) for cls in event_type.__mro__]
+        registries.append(self._wildcard)
+        resolved = tuple(
+            (target, is_coro, isinstance(target, weakref.WeakMethod))
+            for registry in registries
+            for target, is_coro in registry.values()
+        )
+        self._resolved[event_type] = resolved
+        return resolved
 
     async def publish(self, event: Any) -> None:
         """
@@ -57,52 +232,48 @@ class EventBus:
         """
         event_type = type(event)
 
-        if event_type not in self._subscribers:
-            logger.debug(f"No subscribers for {event_type.__name__}")
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = self._resolve(event_type)
+        if not handlers:
+            logger.debug("No subscribers for %s", event_type.__name__)
             return
 
-        async with self._lock:
-            handlers = self._subscribers[event_type].copy()
-
-        logger.debug(f"Publishing {event_type.__name__} to {len(handlers)} subscribers")
+        logger.debug("Publishing %s to %d subscribers", event_type.__name__, len(handlers))
 
-        # Execute all handlers concurrently
-        tasks = []
-        for handler in handlers:
+        # Fast path: a single handler is awaited inline, no task needed
+        if len(handlers) == 1:
+            target, is_coro, is_weak = handlers[0]
+            handler = target() if is_weak else target
+            if handler is None:
+                return
             try:
-                task = asyncio.create_task(self._safe_execute(handler, event))
-                tasks.append(task)
+                if is_coro:
+                    await handler(event)
+                else:
+                    handler(event)
             except Exception as e:
-                logger.error(f"Error creating task for {handler.__name__}: {e}")
+                logger.error("Exception in %s: %s", handler.__name__, e, exc_info=True)
+            return
 
-        # Wait for all handlers to complete
+        # Execute all handlers concurrently. Failures are logged by a done
+        # callback; asyncio.wait (unlike TaskGroup) never cancels siblings.
+        # All tasks share one context copy instead of one copy per task.
+        ctx = contextvars.copy_context()
+        tasks = []
+        for target, is_coro, is_weak in handlers:
+            handler = target() if is_weak else target
+            if handler is None:
+                continue
+            task = asyncio.create_task(
+                handler(event) if is_coro else _wrap_sync(handler, event),
+                name=handler.__name__,
+                context=ctx,
+            )
+            task.add_done_callback(_log_task_exception)
+            tasks.append(task)
         if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Log any exceptions
-            for handler, result in zip(handlers, results):
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Error in event handler {handler.__name__} "
-                        f"for {event_type.__name__}: {result}"
-                    )
-
-    async def _safe_execute(self, handler: Callable, event: Any) -> None:
-        """
-        Safely execute a handler with error handling.
-
-        Args:
-            handler: Handler function
-            event: Event instance
-        """
-        try:
-            if asyncio.iscoroutinefunction(handler):
-                await handler(event)
-            else:
-                handler(event)
-        except Exception as e:
-            logger.error(f"Exception in {handler.__name__}: {e}", exc_info=True)
-            raise
+            await asyncio.wait(tasks)
 
     def get_subscribers_count(self, event_type: Type) -> int:
         """
@@ -114,11 +285,13 @@ class EventBus:
         Returns:
             Number of subscribers
         """
-        return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, {}))
 
     def clear_all_subscribers(self) -> None:
         """Clear all subscribers (for testing)."""
         self._subscribers.clear()
+        self._wildcard = {}
+        self._resolved.clear()
         logger.info("Cleared all event subscribers")
 
 
@@ -1,18 +1,31 @@
 """Pipeline execution domain events."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 
-@dataclass
+def _timestamp_iso(event: Any) -> str:
+    """
+    Return the event timestamp in ISO format, formatting it only once.
+
+    Events store timestamps as epoch seconds (time.time()); the datetime
+    is only built here, at the serialization boundary.
+    """
+    if event._ts_iso is None:
+        object.__setattr__(event, "_ts_iso", datetime.fromtimestamp(event.timestamp).isoformat())
+    return event._ts_iso
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineStartedEvent:
     """Event published when pipeline execution starts."""
 
     pipeline_id: str
     pipeline_name: str
-    timestamp: datetime
+    timestamp: float
     node_count: int
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -20,12 +33,12 @@ class PipelineStartedEvent:
             "type": "pipeline_started",
             "pipeline_id": self.pipeline_id,
             "pipeline_name": self.pipeline_name,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "node_count": self.node_count
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeExecutingEvent:
     """Event published when a node starts executing."""
 
@@ -33,10 +46,11 @@ class NodeExecutingEvent:
     node_id: str
     node_type: str
     function_id: Optional[str]
-    timestamp: datetime
+    timestamp: float
     label: Optional[str] = None
     iteration: Optional[int] = None
     total_iterations: Optional[int] = None
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -46,7 +60,7 @@ class NodeExecutingEvent:
             "node_id": self.node_id,
             "node_type": self.node_type,
             "function_id": self.function_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "label": self.label or self.node_id,
         }
         if self.iteration is not None:
@@ -55,16 +69,17 @@ class NodeExecutingEvent:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeCompletedEvent:
     """Event published when a node completes execution."""
 
     pipeline_id: str
     node_id: str
-    timestamp: datetime
+    timestamp: float
     outputs: Dict[str, Any]
     execution_time: float
     label: Optional[str] = None
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -73,44 +88,46 @@ class NodeCompletedEvent:
             "pipeline_id": self.pipeline_id,
             "node_id": self.node_id,
             "label": self.label or self.node_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "outputs": self.outputs,
             "execution_time": self.execution_time
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PipelineCompletedEvent:
     """Event published when pipeline execution completes."""
 
     pipeline_id: str
-    timestamp: datetime
+    timestamp: float
     success: bool
     execution_time: float
     nodes_executed: int
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
         return {
             "type": "pipeline_completed",
             "pipeline_id": self.pipeline_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "success": self.success,
             "execution_time": self.execution_time,
             "nodes_executed": self.nodes_executed
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeLogEvent:
     """Event published when a node outputs a log message."""
 
     pipeline_id: str
     node_id: str
-    timestamp: datetime
+    timestamp: float
     message: str
     level: str = "info"  # info, warning, error, debug
     label: Optional[str] = None
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
@@ -119,28 +136,29 @@ class NodeLogEvent:
             "pipeline_id": self.pipeline_id,
             "node_id": self.node_id,
             "label": self.label or self.node_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "message": self.message,
             "level": self.level
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PipelineErrorEvent:
     """Event published when pipeline execution fails."""
 
     pipeline_id: str
-    timestamp: datetime
+    timestamp: float
     error_message: str
     node_id: Optional[str] = None
     error_type: Optional[str] = None
+    _ts_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization."""
         return {
             "type": "pipeline_error",
             "pipeline_id": self.pipeline_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _timestamp_iso(self),
             "error_message": self.error_message,
             "node_id": self.node_id,
             "error_type": self.error_type
@@ -24,7 +24,12 @@ Exception Hierarchy:
         └── PluginConfigError
 """
 
-from typing import Optional, Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
+
+# Shared empty mapping used when no extra details are passed
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class DomainException(Exception):
@@ -35,6 +40,14 @@ class DomainException(Exception):
     consistent error handling and logging.
     """
 
+    # Interned class name used as the serialized error type
+    _type_name: str = "DomainException"
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the serialized type name for each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._type_name = sys.intern(cls.__name__)
+
     def __init__(
         self,
         message: str,
@@ -53,18 +66,24 @@ class DomainException(Exception):
         self.message = message
         self.details = details or {}
         self.cause = cause
+        # Formatted __str__, built on first use (details are not mutated
+        # after construction)
+        self._str_cache: Optional[str] = None
 
     def __str__(self) -> str:
         """String representation of the exception."""
-        if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            return f"{self.message} ({details_str})"
-        return self.message
+        if self._str_cache is None:
+            if self.details:
+                details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
+                self._str_cache = f"{self.message} ({details_str})"
+            else:
+                self._str_cache = self.message
+        return self._str_cache
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for serialization."""
         return {
-            "type": self.__class__.__name__,
+            "type": self._type_name,
             "message": self.message,
             "details": self.details,
         }
@@ -78,7 +97,7 @@ class ValidationError(DomainException):
     """Raised when validation fails (invalid input, configuration, etc.)."""
 
     def __init__(self, message: str, field: Optional[str] = None, **kwargs):
-        details = kwargs.get('details', {})
+        details = dict(kwargs.get('details') or _NO_DETAILS)
         if field:
             details['field'] = field
         super().__init__(message, details=details, cause=kwargs.get('cause'))
@@ -93,8 +112,11 @@ class NotFoundError(DomainException):
 
     def __init__(self, resource_type: str, resource_id: str, **kwargs):
         message = f"{resource_type} '{resource_id}' not found"
-        details = {'resource_type': resource_type, 'resource_id': resource_id}
-        details.update(kwargs.get('details', {}))
+        details = {
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            **(kwargs.get('details') or _NO_DETAILS),
+        }
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -107,8 +129,11 @@ class AlreadyExistsError(DomainException):
 
     def __init__(self, resource_type: str, resource_id: str, **kwargs):
         message = f"{resource_type} '{resource_id}' already exists"
-        details = {'resource_type': resource_type, 'resource_id': resource_id}
-        details.update(kwargs.get('details', {}))
+        details = {
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            **(kwargs.get('details') or _NO_DETAILS),
+        }
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -120,7 +145,7 @@ class InvalidStateError(DomainException):
     """Raised when an operation is attempted in an invalid state."""
 
     def __init__(self, message: str, current_state: Optional[str] = None, **kwargs):
-        details = kwargs.get('details', {})
+        details = dict(kwargs.get('details') or _NO_DETAILS)
         if current_state:
             details['current_state'] = current_state
         super().__init__(message, details=details, cause=kwargs.get('cause'))
@@ -139,8 +164,7 @@ class PipelineExecutionError(ExecutionError):
     """Raised when pipeline execution fails."""
 
     def __init__(self, pipeline_id: str, message: str, **kwargs):
-        details = {'pipeline_id': pipeline_id}
-        details.update(kwargs.get('details', {}))
+        details = {'pipeline_id': pipeline_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -157,8 +181,8 @@ class NodeExecutionError(ExecutionError):
         details = {
             'node_id': node_id,
             'node_label': node_label,
+            **(kwargs.get('details') or _NO_DETAILS),
         }
-        details.update(kwargs.get('details', {}))
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -167,8 +191,7 @@ class CircularDependencyError(ExecutionError):
 
     def __init__(self, cycle: list, **kwargs):
         message = f"Circular dependency detected: {' -> '.join(cycle)}"
-        details = {'cycle': cycle}
-        details.update(kwargs.get('details', {}))
+        details = {'cycle': cycle, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -197,8 +220,7 @@ class DeviceConnectionError(DeviceError):
     """Raised when device connection fails."""
 
     def __init__(self, instance_id: str, message: str, **kwargs):
-        details = {'instance_id': instance_id}
-        details.update(kwargs.get('details', {}))
+        details = {'instance_id': instance_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -215,8 +237,8 @@ class DeviceFunctionError(DeviceError):
         details = {
             'instance_id': instance_id,
             'function_id': function_id,
+            **(kwargs.get('details') or _NO_DETAILS),
         }
-        details.update(kwargs.get('details', {}))
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -245,8 +267,7 @@ class PluginLoadError(PluginError):
     """Raised when plugin loading fails."""
 
     def __init__(self, plugin_id: str, message: str, **kwargs):
-        details = {'plugin_id': plugin_id}
-        details.update(kwargs.get('details', {}))
+        details = {'plugin_id': plugin_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -254,8 +275,7 @@ class PluginConfigError(PluginError):
     """Raised when plugin configuration is invalid."""
 
     def __init__(self, plugin_id: str, message: str, **kwargs):
-        details = {'plugin_id': plugin_id}
-        details.update(kwargs.get('details', {}))
+        details = {'plugin_id': plugin_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -284,8 +304,7 @@ class PipelineSaveError(RepositoryError):
     """Raised when saving a pipeline fails."""
 
     def __init__(self, pipeline_id: str, message: str, **kwargs):
-        details = {'pipeline_id': pipeline_id}
-        details.update(kwargs.get('details', {}))
+        details = {'pipeline_id': pipeline_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
 
 
@@ -293,6 +312,5 @@ class PipelineDeleteError(RepositoryError):
     """Raised when deleting a pipeline fails."""
 
     def __init__(self, pipeline_id: str, message: str, **kwargs):
-        details = {'pipeline_id': pipeline_id}
-        details.update(kwargs.get('details', {}))
+        details = {'pipeline_id': pipeline_id, **(kwargs.get('details') or _NO_DETAILS)}
         super().__init__(message, details=details, cause=kwargs.get('cause'))
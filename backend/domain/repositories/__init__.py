@@ -2,5 +2,6 @@
 
 from .pipeline_repository import IPipelineRepository
 from .composite_repository import ICompositeRepository
+from .composite_write_coordinator import CompositeWriteCoordinator
 
-__all__ = ['IPipelineRepository', 'ICompositeRepository']
+__all__ = ['IPipelineRepository', 'ICompositeRepository', 'CompositeWriteCoordinator']
@@ -1,7 +1,8 @@
 """Composite Node repository interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Iterable
 
 from domain.entities.composite import CompositeNodeDefinition
 
@@ -29,6 +30,24 @@ class ICompositeRepository(ABC):
         """
         pass
 
+    async def save_many(self, composites: List[CompositeNodeDefinition]) -> List[str]:
+        """
+        Save several composite node definitions.
+
+        The default implementation saves them one by one; repositories
+        that can write in bulk should override it.
+
+        Args:
+            composites: Composite node definitions to save
+
+        Returns:
+            Composite IDs, in input order
+
+        Raises:
+            ValueError: If any composite data is invalid
+        """
+        return [await self.save(composite) for composite in composites]
+
     @abstractmethod
     async def get(self, composite_id: str) -> Optional[CompositeNodeDefinition]:
         """
@@ -42,6 +61,29 @@ class ICompositeRepository(ABC):
         """
         pass
 
+    async def get_many(
+        self, composite_ids: Iterable[str]
+    ) -> Dict[str, CompositeNodeDefinition]:
+        """
+        Get several composites in one call.
+
+        The default implementation issues the individual gets
+        concurrently; repositories with a bulk lookup should override it.
+
+        Args:
+            composite_ids: Composite identifiers
+
+        Returns:
+            Mapping of ID to composite for every ID that was found
+        """
+        composite_ids = list(composite_ids)
+        composites = await asyncio.gather(*(self.get(cid) for cid in composite_ids))
+        return {
+            cid: composite
+            for cid, composite in zip(composite_ids, composites)
+            if composite is not None
+        }
+
     @abstractmethod
     async def list_all(self) -> List[Dict[str, Any]]:
         """
@@ -52,6 +94,41 @@ class ICompositeRepository(ABC):
         """
         pass
 
+    async def list_page(self, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List one page of saved composites.
+
+        The default implementation slices list_all(); repositories that
+        can seek should override it.
+
+        Args:
+            offset: Number of entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            Up to limit metadata entries starting at offset
+        """
+        return (await self.list_all())[offset:offset + limit]
+
+    async def iter_all(self, batch_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all saved composites in batches.
+
+        Args:
+            batch_size: Maximum number of entries per batch
+
+        Yields:
+            Lists of at most batch_size metadata entries
+        """
+        offset = 0
+        while True:
+            page = await self.list_page(offset, batch_size)
+            if page:
+                yield page
+            if len(page) < batch_size:
+                return
+            offset += batch_size
+
     @abstractmethod
     async def delete(self, composite_id: str) -> bool:
         """
@@ -0,0 +1,133 @@
+"""Write-behind batching for composite saves."""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from domain.entities.composite import CompositeNodeDefinition
+from domain.repositories.composite_repository import ICompositeRepository
+
+logger = logging.getLogger(__name__)
+
+# Queued save paired with the future its caller is awaiting
+PendingWrite = Tuple[CompositeNodeDefinition, asyncio.Future]
+
+
+class CompositeWriteCoordinator:
+    """
+    Coalesces concurrent composite saves into batched repository writes.
+
+    Callers await save() as usual; a single background task collects
+    queued composites for up to max_wait seconds (or max_batch items) and
+    writes them with one save_many call, then resolves each caller's
+    future with its own result.
+    """
+
+    MAX_BATCH = 32
+    MAX_WAIT = 0.005
+
+    def __init__(
+        self,
+        repository: ICompositeRepository,
+        max_batch: int = MAX_BATCH,
+        max_wait: float = MAX_WAIT,
+    ):
+        """
+        Initialize write coordinator.
+
+        Args:
+            repository: Repository that receives the batched writes
+            max_batch: Maximum number of composites per save_many call
+            max_wait: Seconds to wait for more writes after the first one
+        """
+        self.repository = repository
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def save(self, composite: CompositeNodeDefinition) -> str:
+        """
+        Queue a composite for saving and wait until it is written.
+
+        Args:
+            composite: Composite node definition to save
+
+        Returns:
+            Composite ID
+
+        Raises:
+            ValueError: If the repository rejects the composite
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((composite, future))
+        return await future
+
+    async def close(self) -> None:
+        """Write any queued composites and stop the background task."""
+        if self._worker is None or self._worker.done():
+            return
+        self._queue.put_nowait(None)
+        await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        """Collect queued writes into batches until closed."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stop:
+                return
+
+    async def _flush(self, batch: List[PendingWrite]) -> None:
+        """
+        Write one batch and resolve its callers' futures.
+
+        If the bulk write fails, each composite is retried on its own so
+        that only the offending callers see an error.
+
+        Args:
+            batch: Queued composites with their futures
+        """
+        try:
+            composite_ids = await self.repository.save_many([c for c, _ in batch])
+        except Exception as e:
+            logger.warning(f"Batched save of {len(batch)} composites failed, retrying singly: {e}")
+            for composite, future in batch:
+                try:
+                    result = await self.repository.save(composite)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+
+        for (_, future), composite_id in zip(batch, composite_ids):
+            if not future.done():
+                future.set_result(composite_id)
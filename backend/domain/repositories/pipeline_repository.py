@@ -1,7 +1,7 @@
 """Pipeline repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from datetime import datetime
 
 
@@ -52,6 +52,41 @@ class IPipelineRepository(ABC):
         """
         pass
 
+    async def list_page(self, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List one page of saved pipelines.
+
+        The default implementation slices list_all(); repositories that
+        can seek should override it.
+
+        Args:
+            offset: Number of entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            Up to limit metadata entries starting at offset
+        """
+        return (await self.list_all())[offset:offset + limit]
+
+    async def iter_all(self, batch_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all saved pipelines in batches.
+
+        Args:
+            batch_size: Maximum number of entries per batch
+
+        Yields:
+            Lists of at most batch_size metadata entries
+        """
+        offset = 0
+        while True:
+            page = await self.list_page(offset, batch_size)
+            if page:
+                yield page
+            if len(page) < batch_size:
+                return
+            offset += batch_size
+
     @abstractmethod
     async def delete(self, pipeline_id: str) -> bool:
         """
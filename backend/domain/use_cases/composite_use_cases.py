@@ -1,11 +1,124 @@
 """Composite Node-related use cases."""
 
-from typing import Dict, Any, List
+import functools
+from dataclasses import replace
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
-import uuid
+from secrets import token_hex
 
 from domain.entities.composite import CompositeNodeDefinition, CompositeInput, CompositeOutput
 from domain.repositories.composite_repository import ICompositeRepository
+from domain.repositories.composite_write_coordinator import CompositeWriteCoordinator
+
+# Composite fields an update can change without touching the subgraph or pins
+_METADATA_FIELDS = ("name", "description", "category", "color", "author", "version")
+
+
+def _requires_repository(method):
+    """Make a use case method raise ValueError when no repository is set."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self.composite_repository is None:
+            raise ValueError("Composite repository not initialized")
+        return await method(self, *args, **kwargs)
+    return wrapper
+
+
+def _composite_refs(subgraph: Dict[str, Any]) -> Iterator[str]:
+    """
+    Lazily yield the composite IDs referenced by a subgraph's nodes.
+
+    Args:
+        subgraph: Subgraph definition
+
+    Returns:
+        Iterator over referenced composite IDs (may repeat)
+    """
+    return (
+        node["composite_id"]
+        for node in subgraph.get("nodes", ())
+        if node.get("type") == "composite" and node.get("composite_id")
+    )
+
+
+def _nested_composite_ids(subgraph: Dict[str, Any]) -> List[str]:
+    """
+    Get the distinct composite IDs referenced by a subgraph's nodes.
+
+    Args:
+        subgraph: Subgraph definition
+
+    Returns:
+        Nested composite IDs in first-seen order
+    """
+    return list(dict.fromkeys(_composite_refs(subgraph)))
+
+
+async def _check_circular_reference(
+    composite_repository: ICompositeRepository,
+    composite_id: str,
+    subgraph: Dict[str, Any],
+) -> List[str]:
+    """
+    Check a composite's subgraph for direct or transitive self-containment.
+
+    Runs an iterative DFS over the composite reference graph rooted at
+    composite_id (using the new subgraph, not the stored one). A reference
+    to a composite still on the DFS stack is a back edge, i.e. a cycle.
+    Referenced composites are prefetched breadth-first with one get_many
+    call per nesting level, so the DFS itself never waits on the repository.
+
+    Args:
+        composite_repository: Repository used to resolve nested composites
+        composite_id: ID of the composite being created/updated
+        subgraph: Subgraph definition of that composite
+
+    Returns:
+        List of error messages (empty if no cycle was found)
+    """
+    # Direct self-reference: stop at the first hit, no repository access
+    if composite_id in _composite_refs(subgraph):
+        return [f"Composite '{composite_id}' cannot contain itself"]
+
+    children: Dict[str, List[str]] = {composite_id: _nested_composite_ids(subgraph)}
+
+    # Fetch the reachable reference graph one level at a time
+    frontier = set(children[composite_id]) - children.keys()
+    while frontier:
+        fetched = await composite_repository.get_many(frontier)
+        next_frontier = set()
+        for nested_id in frontier:
+            nested = fetched.get(nested_id)
+            children[nested_id] = _nested_composite_ids(nested.subgraph) if nested else []
+            next_frontier.update(children[nested_id])
+        frontier = next_frontier - children.keys()
+
+    path = [composite_id]
+    in_stack = {composite_id}
+    done = set()
+    stack = [iter(children[composite_id])]
+
+    while stack:
+        nested_id = next(stack[-1], None)
+        if nested_id is None:
+            finished = path.pop()
+            in_stack.discard(finished)
+            done.add(finished)
+            stack.pop()
+            continue
+
+        if nested_id in in_stack:
+            cycle = path[path.index(nested_id):] + [nested_id]
+            return [f"'{nested_id}' already in chain ({' -> '.join(cycle)})"]
+
+        if nested_id in done:
+            continue
+
+        path.append(nested_id)
+        in_stack.add(nested_id)
+        stack.append(iter(children[nested_id]))
+
+    return []
 
 
 class ListCompositesUseCase:
@@ -14,6 +127,7 @@ class ListCompositesUseCase:
     def __init__(self, composite_repository: ICompositeRepository):
         self.composite_repository = composite_repository
 
+    @_requires_repository
     async def execute(self, category: str = None) -> List[Dict[str, Any]]:
         """
         List all saved composite nodes.
@@ -27,9 +141,6 @@ class ListCompositesUseCase:
         Raises:
             ValueError: If repository not initialized
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         if category:
             composites = await self.composite_repository.get_by_category(category)
             return [c.to_dict() for c in composites]
@@ -37,6 +148,36 @@ class ListCompositesUseCase:
         composites_meta = await self.composite_repository.list_all()
         return composites_meta
 
+    @_requires_repository
+    async def execute_page(
+        self, category: str = None, offset: int = 0, limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        List one page of saved composite nodes.
+
+        Args:
+            category: Optional category filter
+            offset: Number of composites to skip
+            limit: Maximum number of composites to return
+
+        Returns:
+            Dictionary with the page items and the offset of the next page
+            (None when this was the last page)
+
+        Raises:
+            ValueError: If repository not initialized
+        """
+        if category:
+            composites = await self.composite_repository.get_by_category(category)
+            items = [c.to_dict() for c in composites[offset:offset + limit]]
+        else:
+            items = await self.composite_repository.list_page(offset, limit)
+
+        return {
+            "items": items,
+            "next_offset": offset + len(items) if len(items) == limit else None,
+        }
+
 
 class GetCompositeUseCase:
     """Use case for retrieving a composite node."""
@@ -44,6 +185,7 @@ class GetCompositeUseCase:
     def __init__(self, composite_repository: ICompositeRepository):
         self.composite_repository = composite_repository
 
+    @_requires_repository
     async def execute(self, composite_id: str) -> Dict[str, Any]:
         """
         Get a composite by ID.
@@ -57,9 +199,6 @@ class GetCompositeUseCase:
         Raises:
             ValueError: If composite not found or repository not initialized
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         composite = await self.composite_repository.get(composite_id)
 
         if composite is None:
@@ -67,57 +206,42 @@ class GetCompositeUseCase:
 
         return composite.to_dict()
 
-
-class CreateCompositeUseCase:
-    """Use case for creating a new composite node."""
-
-    def __init__(self, composite_repository: ICompositeRepository):
-        self.composite_repository = composite_repository
-
-    def _check_circular_reference(
-        self,
-        composite_id: str,
-        subgraph: Dict[str, Any],
-        checked_ids: set = None
-    ) -> List[str]:
+    @_requires_repository
+    async def execute_json(self, composite_id: str) -> bytes:
         """
-        Check for circular references in composite nodes.
+        Get a composite by ID, already serialized as JSON.
 
         Args:
-            composite_id: ID of the composite being created/updated
-            subgraph: Subgraph definition
-            checked_ids: Set of already checked composite IDs
+            composite_id: Composite identifier
 
         Returns:
-            List of error messages if circular references found
+            Composite definition as JSON bytes
+
+        Raises:
+            ValueError: If composite not found or repository not initialized
         """
-        if checked_ids is None:
-            checked_ids = set()
+        composite = await self.composite_repository.get(composite_id)
 
-        errors = []
-        nodes = subgraph.get("nodes", [])
+        if composite is None:
+            raise ValueError(f"Composite '{composite_id}' not found")
 
-        for node in nodes:
-            node_type = node.get("type")
-            if node_type == "composite":
-                nested_composite_id = node.get("composite_id")
+        return composite.to_json()
 
-                # Check for direct self-reference
-                if nested_composite_id == composite_id:
-                    errors.append(
-                        f"Circular reference: Composite '{composite_id}' cannot contain itself"
-                    )
-                    continue
 
-                # Check if we've already visited this composite (indirect circular reference)
-                if nested_composite_id in checked_ids:
-                    errors.append(
-                        f"Circular reference detected: '{nested_composite_id}' already in chain"
-                    )
-                    continue
+class CreateCompositeUseCase:
+    """Use case for creating a new composite node."""
 
-        return errors
+    def __init__(
+        self,
+        composite_repository: ICompositeRepository,
+        write_coordinator: Optional[CompositeWriteCoordinator] = None,
+    ):
+        self.composite_repository = composite_repository
+        # Optional write-behind batching; saves go straight to the
+        # repository when absent
+        self.write_coordinator = write_coordinator
 
+    @_requires_repository
     async def execute(self, composite_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new composite node.
@@ -131,56 +255,41 @@ class CreateCompositeUseCase:
         Raises:
             ValueError: If data is invalid or repository not initialized
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         # Generate ID if not provided
         composite_id = composite_data.get("composite_id")
         if not composite_id:
-            composite_id = f"composite_{uuid.uuid4().hex[:8]}"
+            composite_id = f"composite_{token_hex(4)}"
             composite_data["composite_id"] = composite_id
 
         # Check for circular references
-        subgraph = composite_data.get("subgraph", {"nodes": [], "edges": []})
-        circular_errors = self._check_circular_reference(composite_id, subgraph)
+        subgraph = composite_data.get("subgraph")
+        if subgraph is None:
+            subgraph = {"nodes": [], "edges": []}
+        circular_errors = await _check_circular_reference(
+            self.composite_repository, composite_id, subgraph
+        )
         if circular_errors:
             raise ValueError(f"Circular reference detected: {', '.join(circular_errors)}")
 
-        # Parse inputs
-        inputs = []
-        for inp_data in composite_data.get("inputs", []):
-            inputs.append(CompositeInput(
-                name=inp_data["name"],
-                type=inp_data["type"],
-                maps_to=inp_data["maps_to"],
-                description=inp_data.get("description", ""),
-                default_value=inp_data.get("default_value"),
-            ))
-
-        # Parse outputs
-        outputs = []
-        for out_data in composite_data.get("outputs", []):
-            outputs.append(CompositeOutput(
-                name=out_data["name"],
-                type=out_data["type"],
-                maps_from=out_data["maps_from"],
-                description=out_data.get("description", ""),
-            ))
+        # Parse inputs/outputs
+        inputs = [CompositeInput.from_dict(inp) for inp in composite_data.get("inputs", [])]
+        outputs = [CompositeOutput.from_dict(out) for out in composite_data.get("outputs", [])]
 
         # Create composite entity
+        now = datetime.now()
         composite = CompositeNodeDefinition(
             composite_id=composite_id,
             name=composite_data.get("name", "Untitled Composite"),
             description=composite_data.get("description", ""),
-            subgraph=composite_data.get("subgraph", {"nodes": [], "edges": []}),
+            subgraph=subgraph,
             inputs=inputs,
             outputs=outputs,
             category=composite_data.get("category", "Composite"),
             color=composite_data.get("color", "#9b59b6"),
             author=composite_data.get("author", ""),
             version=composite_data.get("version", "1.0.0"),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Validate
@@ -189,7 +298,7 @@ class CreateCompositeUseCase:
             raise ValueError(f"Invalid composite: {', '.join(errors)}")
 
         # Save
-        await self.composite_repository.save(composite)
+        await (self.write_coordinator or self.composite_repository).save(composite)
 
         return {
             "success": True,
@@ -202,27 +311,17 @@ class CreateCompositeUseCase:
 class UpdateCompositeUseCase:
     """Use case for updating an existing composite node."""
 
-    def __init__(self, composite_repository: ICompositeRepository):
-        self.composite_repository = composite_repository
-
-    def _check_circular_reference(
+    def __init__(
         self,
-        composite_id: str,
-        subgraph: Dict[str, Any],
-    ) -> List[str]:
-        """Check for circular references."""
-        errors = []
-        nodes = subgraph.get("nodes", [])
-
-        for node in nodes:
-            if node.get("type") == "composite":
-                nested_id = node.get("composite_id")
-                if nested_id == composite_id:
-                    errors.append(
-                        f"Composite '{composite_id}' cannot contain itself"
-                    )
-        return errors
+        composite_repository: ICompositeRepository,
+        write_coordinator: Optional[CompositeWriteCoordinator] = None,
+    ):
+        self.composite_repository = composite_repository
+        # Optional write-behind batching; saves go straight to the
+        # repository when absent
+        self.write_coordinator = write_coordinator
 
+    @_requires_repository
     async def execute(self, composite_id: str, composite_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing composite.
@@ -237,9 +336,6 @@ class UpdateCompositeUseCase:
         Raises:
             ValueError: If composite not found or data is invalid
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         # Get existing composite
         existing = await self.composite_repository.get(composite_id)
         if existing is None:
@@ -247,48 +343,42 @@ class UpdateCompositeUseCase:
 
         # Check for circular references if subgraph is being updated
         if "subgraph" in composite_data:
-            circular_errors = self._check_circular_reference(
-                composite_id, composite_data["subgraph"]
+            circular_errors = await _check_circular_reference(
+                self.composite_repository, composite_id, composite_data["subgraph"]
             )
             if circular_errors:
                 raise ValueError(f"Circular reference: {', '.join(circular_errors)}")
 
-        # Parse inputs
-        inputs = []
-        for inp_data in composite_data.get("inputs", []):
-            inputs.append(CompositeInput(
-                name=inp_data["name"],
-                type=inp_data["type"],
-                maps_to=inp_data["maps_to"],
-                description=inp_data.get("description", ""),
-                default_value=inp_data.get("default_value"),
-            ))
-
-        # Parse outputs
-        outputs = []
-        for out_data in composite_data.get("outputs", []):
-            outputs.append(CompositeOutput(
-                name=out_data["name"],
-                type=out_data["type"],
-                maps_from=out_data["maps_from"],
-                description=out_data.get("description", ""),
-            ))
-
-        # Create updated composite entity
-        updated = CompositeNodeDefinition(
-            composite_id=composite_id,
-            name=composite_data.get("name", existing.name),
-            description=composite_data.get("description", existing.description),
-            subgraph=composite_data.get("subgraph", existing.subgraph),
-            inputs=inputs if inputs else existing.inputs,
-            outputs=outputs if outputs else existing.outputs,
-            category=composite_data.get("category", existing.category),
-            color=composite_data.get("color", existing.color),
-            author=composite_data.get("author", existing.author),
-            version=composite_data.get("version", existing.version),
-            created_at=existing.created_at,
-            updated_at=datetime.now(),
-        )
+        structural = any(key in composite_data for key in ("subgraph", "inputs", "outputs"))
+        if not structural:
+            # Metadata-only update: reuse the existing subgraph and pin
+            # lists instead of re-parsing them. This copies rather than
+            # edits existing, so a failed save leaves it unchanged.
+            updated = replace(
+                existing,
+                **{key: composite_data[key] for key in _METADATA_FIELDS if key in composite_data},
+                updated_at=datetime.now(),
+            )
+        else:
+            # Parse inputs/outputs
+            inputs = [CompositeInput.from_dict(inp) for inp in composite_data.get("inputs", [])]
+            outputs = [CompositeOutput.from_dict(out) for out in composite_data.get("outputs", [])]
+
+            # Create updated composite entity
+            updated = CompositeNodeDefinition(
+                composite_id=composite_id,
+                name=composite_data.get("name", existing.name),
+                description=composite_data.get("description", existing.description),
+                subgraph=composite_data.get("subgraph", existing.subgraph),
+                inputs=inputs if inputs else existing.inputs,
+                outputs=outputs if outputs else existing.outputs,
+                category=composite_data.get("category", existing.category),
+                color=composite_data.get("color", existing.color),
+                author=composite_data.get("author", existing.author),
+                version=composite_data.get("version", existing.version),
+                created_at=existing.created_at,
+                updated_at=datetime.now(),
+            )
 
         # Validate
         errors = updated.validate()
@@ -296,7 +386,13 @@ class UpdateCompositeUseCase:
             raise ValueError(f"Invalid composite: {', '.join(errors)}")
 
         # Update
-        success = await self.composite_repository.update(composite_id, updated)
+        if self.write_coordinator is not None:
+            # Existence was checked above and created_at carried over, so a
+            # plain (batched) save is equivalent to update()
+            await self.write_coordinator.save(updated)
+            success = True
+        else:
+            success = await self.composite_repository.update(composite_id, updated)
         if not success:
             raise ValueError(f"Failed to update composite '{composite_id}'")
 
@@ -314,6 +410,7 @@ class DeleteCompositeUseCase:
     def __init__(self, composite_repository: ICompositeRepository):
         self.composite_repository = composite_repository
 
+    @_requires_repository
     async def execute(self, composite_id: str) -> Dict[str, Any]:
         """
         Delete a composite by ID.
@@ -327,9 +424,6 @@ class DeleteCompositeUseCase:
         Raises:
             ValueError: If composite not found or repository not initialized
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         success = await self.composite_repository.delete(composite_id)
 
         if not success:
@@ -345,9 +439,17 @@ class DeleteCompositeUseCase:
 class CreateCompositeFromNodesUseCase:
     """Use case for creating a composite from selected nodes."""
 
-    def __init__(self, composite_repository: ICompositeRepository):
+    def __init__(
+        self,
+        composite_repository: ICompositeRepository,
+        write_coordinator: Optional[CompositeWriteCoordinator] = None,
+    ):
         self.composite_repository = composite_repository
+        # Optional write-behind batching; saves go straight to the
+        # repository when absent
+        self.write_coordinator = write_coordinator
 
+    @_requires_repository
     async def execute(
         self,
         name: str,
@@ -373,17 +475,29 @@ class CreateCompositeFromNodesUseCase:
         Raises:
             ValueError: If data is invalid
         """
-        if self.composite_repository is None:
-            raise ValueError("Composite repository not initialized")
-
         if not nodes:
             raise ValueError("At least one node is required")
 
         # Generate ID
-        composite_id = f"composite_{uuid.uuid4().hex[:8]}"
+        composite_id = f"composite_{token_hex(4)}"
+
+        # Index nodes and their pins by name once, for O(1) lookups per edge
+        node_index = {node["id"]: node for node in nodes}
+        node_ids = node_index.keys()
+        pin_index = {
+            node["id"]: (
+                {inp["name"]: inp for inp in node.get("data", {}).get("inputs", [])},
+                {out["name"]: out for out in node.get("data", {}).get("outputs", [])},
+            )
+            for node in nodes
+        }
+
+        # Fan-out edges produce the same pin names/paths many times; share
+        # one string object per distinct value
+        pin_strings: Dict[str, str] = {}
 
-        # Collect node IDs
-        node_ids = {node["id"] for node in nodes}
+        def share(value: str) -> str:
+            return pin_strings.setdefault(value, value)
 
         # Analyze external connections to determine inputs/outputs
         inputs = []
@@ -399,69 +513,63 @@ class CreateCompositeFromNodesUseCase:
 
             if source_id not in node_ids and target_id in node_ids:
                 # External source -> internal target = input
-                input_name = f"in_{target_handle}"
+                input_name = share(f"in_{target_handle}")
                 # Find the type from the target node
-                input_type = "any"
-                for node in nodes:
-                    if node["id"] == target_id:
-                        for inp in node.get("data", {}).get("inputs", []):
-                            if inp["name"] == target_handle:
-                                input_type = inp.get("type", "any")
-                                break
-                        break
+                inputs_by_name, _ = pin_index[target_id]
+                input_type = inputs_by_name.get(target_handle, {}).get("type", "any")
 
                 inputs.append(CompositeInput(
                     name=input_name,
                     type=input_type,
-                    maps_to=f"{target_id}.{target_handle}",
+                    maps_to=share(f"{target_id}.{target_handle}"),
                 ))
 
             elif source_id in node_ids and target_id not in node_ids:
                 # Internal source -> external target = output
-                output_name = f"out_{source_handle}"
+                output_name = share(f"out_{source_handle}")
                 # Find the type from the source node
-                output_type = "any"
-                for node in nodes:
-                    if node["id"] == source_id:
-                        for out in node.get("data", {}).get("outputs", []):
-                            if out["name"] == source_handle:
-                                output_type = out.get("type", "any")
-                                break
-                        break
+                _, outputs_by_name = pin_index[source_id]
+                output_type = outputs_by_name.get(source_handle, {}).get("type", "any")
 
                 outputs.append(CompositeOutput(
                     name=output_name,
                     type=output_type,
-                    maps_from=f"{source_id}.{source_handle}",
+                    maps_from=share(f"{source_id}.{source_handle}"),
                 ))
 
         # If no external edges, try to find entry/exit points
         if not inputs and not outputs:
-            # Find nodes with no incoming internal edges (entry points)
-            internal_targets = {edge["target"] for edge in edges}
-            for node in nodes:
-                if node["id"] not in internal_targets:
-                    # This is an entry node
-                    for inp in node.get("data", {}).get("inputs", []):
-                        inputs.append(CompositeInput(
-                            name=inp["name"],
-                            type=inp.get("type", "any"),
-                            maps_to=f"{node['id']}.{inp['name']}",
-                        ))
-
-            # Find nodes with no outgoing internal edges (exit points)
-            internal_sources = {edge["source"] for edge in edges}
-            for node in nodes:
-                if node["id"] not in internal_sources:
-                    # This is an exit node
-                    for out in node.get("data", {}).get("outputs", []):
-                        outputs.append(CompositeOutput(
-                            name=out["name"],
-                            type=out.get("type", "any"),
-                            maps_from=f"{node['id']}.{out['name']}",
-                        ))
+            internal_targets = set()
+            internal_sources = set()
+            for edge in edges:
+                internal_targets.add(edge["target"])
+                internal_sources.add(edge["source"])
+
+            # Entry nodes have no incoming internal edges, exit nodes no
+            # outgoing ones
+            entry_ids = node_ids - internal_targets
+            exit_ids = node_ids - internal_sources
+
+            # Walk pin_index rather than the sets to keep pins in node order
+            if entry_ids or exit_ids:
+                for node_id, (inputs_by_name, outputs_by_name) in pin_index.items():
+                    if node_id in entry_ids:
+                        for inp in inputs_by_name.values():
+                            inputs.append(CompositeInput(
+                                name=inp["name"],
+                                type=inp.get("type", "any"),
+                                maps_to=f"{node_id}.{inp['name']}",
+                            ))
+                    if node_id in exit_ids:
+                        for out in outputs_by_name.values():
+                            outputs.append(CompositeOutput(
+                                name=out["name"],
+                                type=out.get("type", "any"),
+                                maps_from=f"{node_id}.{out['name']}",
+                            ))
 
         # Create composite
+        now = datetime.now()
         composite = CompositeNodeDefinition(
             composite_id=composite_id,
             name=name,
@@ -471,12 +579,12 @@ class CreateCompositeFromNodesUseCase:
             outputs=outputs,
             category="Composite",
             color="#9b59b6",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save
-        await self.composite_repository.save(composite)
+        await (self.write_coordinator or self.composite_repository).save(composite)
 
         return {
             "success": True,
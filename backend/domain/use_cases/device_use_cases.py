@@ -119,30 +119,24 @@ class ExecuteFunctionUseCase:
         if self.device_manager is None:
             raise ValueError("Device manager not initialized")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        outputs = None
+        error = None
 
         try:
             outputs = await self.device_manager.execute_function(
                 instance_id=instance_id, function_id=function_id, inputs=inputs
             )
+        except Exception as e:
+            error = str(e)
 
-            execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
-            return {
-                "success": True,
-                "instance_id": instance_id,
-                "function_id": function_id,
-                "outputs": outputs,
-                "execution_time": execution_time,
-                "error": None,
-            }
-        except Exception as e:
-            execution_time = time.time() - start_time
-            return {
-                "success": False,
-                "instance_id": instance_id,
-                "function_id": function_id,
-                "outputs": None,
-                "execution_time": execution_time,
-                "error": str(e),
-            }
+        return {
+            "success": error is None,
+            "instance_id": instance_id,
+            "function_id": function_id,
+            "outputs": outputs,
+            "execution_time": execution_time,
+            "error": error,
+        }
@@ -26,41 +26,35 @@ class ExecutePipelineUseCase:
         if self.execution_engine is None:
             raise ValueError("Execution engine not initialized")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             result = await self.execution_engine.execute_pipeline(pipeline_def)
-            execution_time = time.time() - start_time
-
-            # Convert results to proper format
-            node_results = {}
-            for node_id, outputs in result.get("results", {}).items():
-                node_results[node_id] = {
-                    "node_id": node_id,
-                    "status": "completed",
-                    "outputs": outputs,
-                    "error": None,
-                    "execution_time": 0.0,
-                }
-
-            return {
-                "success": result.get("success", True),
-                "pipeline_id": pipeline_def.get("pipeline_id"),
-                "execution_time": execution_time,
-                "nodes_executed": result.get("nodes_executed", 0),
-                "results": node_results,
-                "error": result.get("error"),
-            }
         except Exception as e:
-            execution_time = time.time() - start_time
-            return {
-                "success": False,
-                "pipeline_id": pipeline_def.get("pipeline_id"),
-                "execution_time": execution_time,
-                "nodes_executed": 0,
-                "results": {},
-                "error": str(e),
+            result = {"success": False, "error": str(e)}
+
+        execution_time = time.perf_counter() - start_time
+
+        # Convert results to proper format
+        node_results = {
+            node_id: {
+                "node_id": node_id,
+                "status": "completed",
+                "outputs": outputs,
+                "error": None,
+                "execution_time": 0.0,
             }
+            for node_id, outputs in result.get("results", {}).items()
+        }
+
+        return {
+            "success": result.get("success", True),
+            "pipeline_id": pipeline_def.get("pipeline_id"),
+            "execution_time": execution_time,
+            "nodes_executed": result.get("nodes_executed", 0),
+            "results": node_results,
+            "error": result.get("error"),
+        }
 
 
 class SavePipelineUseCase:
@@ -151,6 +145,30 @@ class ListPipelinesUseCase:
         pipelines_meta = await self.pipeline_repository.list_all()
         return pipelines_meta
 
+    async def execute_page(self, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """
+        List one page of saved pipelines.
+
+        Args:
+            offset: Number of pipelines to skip
+            limit: Maximum number of pipelines to return
+
+        Returns:
+            Dictionary with the page items and the offset of the next page
+            (None when this was the last page)
+
+        Raises:
+            ValueError: If repository not initialized
+        """
+        if self.pipeline_repository is None:
+            raise ValueError("Pipeline repository not initialized")
+
+        items = await self.pipeline_repository.list_page(offset, limit)
+        return {
+            "items": items,
+            "next_offset": offset + len(items) if len(items) == limit else None,
+        }
+
 
 class DeletePipelineUseCase:
     """Use case for deleting a pipeline."""
@@ -1,23 +1,45 @@
 """Plugin-related use cases."""
 
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class ListPluginsUseCase:
     """Use case for listing available plugins."""
 
-    def __init__(self, plugin_loader):
+    def __init__(self, plugin_loader, ttl: float = 30.0):
+        """
+        Initialize use case.
+
+        Args:
+            plugin_loader: Plugin loader used for discovery
+            ttl: Seconds a discovery result is reused before rescanning
+        """
         self.plugin_loader = plugin_loader
+        self._ttl = ttl
+        # (monotonic time of discovery, discovered plugins)
+        self._cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
 
     async def execute(self) -> List[Dict[str, Any]]:
         """
         List all available plugins.
 
+        Discovery results are cached for the configured TTL.
+
         Returns:
             List of plugin information dictionaries
         """
         if self.plugin_loader is None:
             return []
 
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache[0] < self._ttl:
+            return self._cache[1]
+
         plugins = await self.plugin_loader.discover_plugins()
+        self._cache = (now, plugins)
         return plugins
+
+    def invalidate(self) -> None:
+        """Drop the cached discovery result (e.g. after installing a plugin)."""
+        self._cache = None
@@ -16,6 +16,7 @@ from domain.use_cases.pipeline_use_cases import (
     ListPipelinesUseCase,
     DeletePipelineUseCase,
 )
+from domain.repositories.composite_write_coordinator import CompositeWriteCoordinator
 from domain.use_cases.composite_use_cases import (
     ListCompositesUseCase,
     GetCompositeUseCase,
@@ -39,8 +40,8 @@ class Container(containers.DeclarativeContainer):
     pipeline_repository = providers.Dependency()
     composite_repository = providers.Dependency()
 
-    # Plugin Use Cases
-    list_plugins_use_case = providers.Factory(
+    # Plugin Use Cases (singleton so its discovery cache outlives a request)
+    list_plugins_use_case = providers.Singleton(
         ListPluginsUseCase, plugin_loader=plugin_loader
     )
 
@@ -82,6 +83,11 @@ class Container(containers.DeclarativeContainer):
         DeletePipelineUseCase, pipeline_repository=pipeline_repository
     )
 
+    # Batches concurrent composite saves into save_many calls
+    composite_write_coordinator = providers.Singleton(
+        CompositeWriteCoordinator, repository=composite_repository
+    )
+
     # Composite Use Cases
     list_composites_use_case = providers.Factory(
         ListCompositesUseCase, composite_repository=composite_repository
@@ -92,11 +98,15 @@ class Container(containers.DeclarativeContainer):
     )
 
     create_composite_use_case = providers.Factory(
-        CreateCompositeUseCase, composite_repository=composite_repository
+        CreateCompositeUseCase,
+        composite_repository=composite_repository,
+        write_coordinator=composite_write_coordinator,
     )
 
     update_composite_use_case = providers.Factory(
-        UpdateCompositeUseCase, composite_repository=composite_repository
+        UpdateCompositeUseCase,
+        composite_repository=composite_repository,
+        write_coordinator=composite_write_coordinator,
     )
 
     delete_composite_use_case = providers.Factory(
@@ -104,5 +114,7 @@ class Container(containers.DeclarativeContainer):
     )
 
     create_composite_from_nodes_use_case = providers.Factory(
-        CreateCompositeFromNodesUseCase, composite_repository=composite_repository
+        CreateCompositeFromNodesUseCase,
+        composite_repository=composite_repository,
+        write_coordinator=composite_write_coordinator,
     )
@@ -1,22 +1,27 @@
 """JSON file-based composite node repository implementation."""
 
-import json
+import asyncio
 import logging
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+
+import orjson
 
 from domain.repositories.composite_repository import ICompositeRepository
 from domain.entities.composite import CompositeNodeDefinition
+from infrastructure.storage.json_file_store import JsonFileStore
 
 logger = logging.getLogger(__name__)
 
 
-class JsonCompositeRepository(ICompositeRepository):
+class JsonCompositeRepository(JsonFileStore, ICompositeRepository):
     """
     JSON file-based composite node storage.
 
-    Each composite is stored as a separate JSON file.
+    Each composite is stored as a separate JSON file. Repeated reads of an
+    unchanged file skip the disk (see JsonFileStore), but each returns its
+    own entity.
     """
 
     def __init__(self, storage_dir: str = "data/composites"):
@@ -26,42 +31,11 @@ class JsonCompositeRepository(ICompositeRepository):
         Args:
             storage_dir: Directory to store composite files
         """
-        self.storage_dir = Path(storage_dir)
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(storage_dir)
+        # (composite_id, mtime_ns) -> file read in progress, shared by concurrent gets
+        self._loading: Dict[Tuple[str, int], asyncio.Future] = {}
         logger.info(f"JsonCompositeRepository initialized with directory: {self.storage_dir}")
 
-    def _get_file_path(self, composite_id: str) -> Path:
-        """Get file path for a composite."""
-        # Sanitize composite_id to prevent directory traversal
-        safe_id = "".join(c for c in composite_id if c.isalnum() or c in ('_', '-'))
-        return self.storage_dir / f"{safe_id}.json"
-
-    def _get_metadata_path(self) -> Path:
-        """Get path for metadata index file."""
-        return self.storage_dir / "_metadata.json"
-
-    async def _load_metadata(self) -> Dict[str, Any]:
-        """Load metadata index."""
-        metadata_path = self._get_metadata_path()
-        if not metadata_path.exists():
-            return {}
-
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading metadata: {e}")
-            return {}
-
-    async def _save_metadata(self, metadata: Dict[str, Any]):
-        """Save metadata index."""
-        metadata_path = self._get_metadata_path()
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving metadata: {e}")
-
     async def save(self, composite: CompositeNodeDefinition) -> str:
         """
         Save a composite node definition to JSON file.
@@ -72,43 +46,70 @@ class JsonCompositeRepository(ICompositeRepository):
         Returns:
             Composite ID
         """
-        # Validate before saving
-        errors = composite.validate()
-        if errors:
-            raise ValueError(f"Invalid composite: {', '.join(errors)}")
+        return (await self.save_many([composite]))[0]
 
-        file_path = self._get_file_path(composite.composite_id)
+    async def save_many(self, composites: List[CompositeNodeDefinition]) -> List[str]:
+        """
+        Save several composites, updating the metadata index once.
 
-        # Update timestamp
-        composite.updated_at = datetime.now()
+        Args:
+            composites: Composite node definitions to save
 
-        try:
-            # Save composite file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(composite.to_dict(), f, indent=2, ensure_ascii=False)
-
-            # Update metadata index
-            metadata = await self._load_metadata()
-            metadata[composite.composite_id] = {
-                "id": composite.composite_id,
-                "name": composite.name,
-                "category": composite.category,
-                "color": composite.color,
-                "version": composite.version,
-                "author": composite.author,
-                "input_count": len(composite.inputs),
-                "output_count": len(composite.outputs),
-                "created_at": composite.created_at.isoformat() if composite.created_at else None,
-                "updated_at": composite.updated_at.isoformat() if composite.updated_at else None,
-            }
-            await self._save_metadata(metadata)
-
-            logger.info(f"Saved composite: {composite.composite_id}")
-            return composite.composite_id
+        Returns:
+            Composite IDs, in input order
 
-        except Exception as e:
-            logger.error(f"Error saving composite {composite.composite_id}: {e}")
-            raise ValueError(f"Failed to save composite: {str(e)}")
+        Raises:
+            ValueError: If any composite is invalid or a write fails
+        """
+        # Validate all before writing anything
+        for composite in composites:
+            errors = composite.validate()
+            if errors:
+                raise ValueError(f"Invalid composite: {', '.join(errors)}")
+
+        # Index entries for the files written so far; recorded even if a
+        # later write fails, so the index matches what is on disk
+        entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        try:
+            for composite in composites:
+                file_path = self._get_file_path(composite.composite_id)
+
+                # Update timestamp
+                composite.updated_at = datetime.now()
+
+                # Serialize once: the file and the read cache get the
+                # entity's cached JSON bytes (also served by the GET
+                # endpoint) and the index entry reuses the dict's
+                # already-formatted fields
+                data = composite.to_dict()
+                payload = composite.to_json()
+                try:
+                    # Save composite file
+                    await asyncio.to_thread(self._write_bytes, file_path, payload)
+                    self._remember(composite.composite_id, file_path.stat().st_mtime_ns, payload)
+                except Exception as e:
+                    logger.error(f"Error saving composite {composite.composite_id}: {e}")
+                    raise ValueError(f"Failed to save composite: {str(e)}")
+
+                entries[composite.composite_id] = {
+                    "id": data["composite_id"],
+                    "name": data["name"],
+                    "category": data["category"],
+                    "color": data["color"],
+                    "version": data["version"],
+                    "author": data["author"],
+                    "input_count": len(data["inputs"]),
+                    "output_count": len(data["outputs"]),
+                    "created_at": data["created_at"],
+                    "updated_at": data["updated_at"],
+                }
+                logger.info(f"Saved composite: {composite.composite_id}")
+        finally:
+            # Update metadata index (written to disk by the deferred flush)
+            if entries:
+                await self._update_metadata(entries)
+
+        return [composite.composite_id for composite in composites]
 
     async def get(self, composite_id: str) -> Optional[CompositeNodeDefinition]:
         """
@@ -118,18 +119,31 @@ class JsonCompositeRepository(ICompositeRepository):
             composite_id: Composite identifier
 
         Returns:
-            CompositeNodeDefinition or None if not found
+            A new CompositeNodeDefinition per call, or None if not found
         """
         file_path = self._get_file_path(composite_id)
 
-        if not file_path.exists():
+        try:
+            mtime = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._forget(composite_id)
             logger.debug(f"Composite not found: {composite_id}")
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return CompositeNodeDefinition.from_dict(data)
+            payload = self._cached(composite_id, mtime)
+            if payload is None:
+                # Concurrent misses for the same file version share one read
+                key = (composite_id, mtime)
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = asyncio.ensure_future(asyncio.to_thread(self._read_bytes, file_path))
+                    self._loading[key] = loading
+                    loading.add_done_callback(lambda _: self._loading.pop(key, None))
+                payload = await asyncio.shield(loading)
+                self._remember(composite_id, mtime, payload)
+
+            return CompositeNodeDefinition.from_dict(orjson.loads(payload))
 
         except Exception as e:
             logger.error(f"Error loading composite {composite_id}: {e}")
@@ -157,27 +171,24 @@ class JsonCompositeRepository(ICompositeRepository):
         """
         file_path = self._get_file_path(composite_id)
 
-        if not file_path.exists():
+        try:
+            # Delete file (a missing file is the not-found case; no stat first)
+            await asyncio.to_thread(file_path.unlink)
+        except FileNotFoundError:
             logger.debug(f"Composite not found for deletion: {composite_id}")
             return False
-
-        try:
-            # Delete file
-            file_path.unlink()
-
-            # Update metadata
-            metadata = await self._load_metadata()
-            if composite_id in metadata:
-                del metadata[composite_id]
-                await self._save_metadata(metadata)
-
-            logger.info(f"Deleted composite: {composite_id}")
-            return True
-
         except Exception as e:
             logger.error(f"Error deleting composite {composite_id}: {e}")
             return False
 
+        self._forget(composite_id)
+
+        # Update metadata
+        await self._update_metadata({composite_id: None})
+
+        logger.info(f"Deleted composite: {composite_id}")
+        return True
+
     async def exists(self, composite_id: str) -> bool:
         """
         Check if a composite exists.
@@ -206,10 +217,14 @@ class JsonCompositeRepository(ICompositeRepository):
             logger.debug(f"Composite not found for update: {composite_id}")
             return False
 
-        # Get existing data to preserve created_at
-        existing = await self.get(composite_id)
-        if existing:
-            composite.created_at = existing.created_at
+        # Preserve created_at from the index rather than re-reading the file
+        meta = (await self._load_metadata()).get(composite_id)
+        if meta and meta.get("created_at"):
+            composite.created_at = datetime.fromisoformat(meta["created_at"])
+        else:
+            existing = await self.get(composite_id)
+            if existing:
+                composite.created_at = existing.created_at
 
         await self.save(composite)
         return True
@@ -224,13 +239,9 @@ class JsonCompositeRepository(ICompositeRepository):
         Returns:
             List of composite definitions in the category
         """
-        result = []
         metadata = await self._load_metadata()
+        ids = [meta["id"] for meta in metadata.values() if meta.get("category") == category]
 
-        for meta in metadata.values():
-            if meta.get("category") == category:
-                composite = await self.get(meta["id"])
-                if composite:
-                    result.append(composite)
-
-        return result
+        # Cache misses read concurrently in the thread pool
+        composites = await asyncio.gather(*(self.get(composite_id) for composite_id in ids))
+        return [composite for composite in composites if composite]
@@ -0,0 +1,244 @@
+"""Shared file handling for the JSON file-based repositories."""
+
+import asyncio
+import logging
+import mmap
+import os
+import re
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Compact output: the files are machine-read, and fewer bytes means faster
+# writes and parses. orjson always emits UTF-8.
+DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Anything that is not safe in a file name; \w is Unicode-aware, so
+# non-ASCII letters and digits (e.g. Korean ids) are kept
+_UNSAFE_ID_RE = re.compile(r'[^\w-]')
+
+
+class JsonFileStore:
+    """
+    Base for repositories that keep one JSON file per item.
+
+    Besides the item files, the storage directory holds a _metadata.json
+    index. The parsed index is cached in memory and only re-read when the
+    file's mtime changes (i.e. it was modified outside this process).
+
+    Index updates only touch the cache; a background task writes the
+    index FLUSH_DELAY seconds after the first unsaved change, so a burst
+    of saves costs one metadata write. Call flush() before shutting down.
+
+    Item files are kept as raw bytes in an LRU cache keyed by file mtime,
+    so unchanged files are not read from disk again. The cached bytes are
+    immutable and every read parses a fresh object from them, so callers
+    may modify what they get.
+    """
+
+    FLUSH_DELAY = 0.1
+    # Below this size a plain read is cheaper than setting up a mapping
+    MMAP_THRESHOLD = 64 * 1024
+    OBJ_CACHE_SIZE = 128
+
+    def __init__(self, storage_dir: str):
+        """
+        Initialize file store.
+
+        Args:
+            storage_dir: Directory to store item files
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._meta_cache: Optional[Dict[str, Any]] = None
+        self._meta_mtime: Optional[int] = None
+        self._meta_lock = asyncio.Lock()
+        self._meta_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # item_id -> (file mtime_ns, file bytes), least recently used first
+        self._obj_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+
+    def _get_file_path(self, item_id: str) -> Path:
+        """Get file path for an item."""
+        # Sanitize item_id to prevent directory traversal
+        safe_id = _UNSAFE_ID_RE.sub('', item_id)
+        return self.storage_dir / f"{safe_id}.json"
+
+    def _get_metadata_path(self) -> Path:
+        """Get path for metadata index file."""
+        return self.storage_dir / "_metadata.json"
+
+    def _cached(self, item_id: str, mtime: int) -> Optional[bytes]:
+        """Get an item's file bytes from the cache if the file has not changed since."""
+        entry = self._obj_cache.get(item_id)
+        if entry is None or entry[0] != mtime:
+            return None
+        self._obj_cache.move_to_end(item_id)
+        return entry[1]
+
+    def _remember(self, item_id: str, mtime: int, payload: bytes):
+        """Cache an item's file bytes, evicting the least recently used item if full."""
+        self._obj_cache[item_id] = (mtime, payload)
+        self._obj_cache.move_to_end(item_id)
+        if len(self._obj_cache) > self.OBJ_CACHE_SIZE:
+            self._obj_cache.popitem(last=False)
+
+    def _forget(self, item_id: str):
+        """Drop an item from the cache."""
+        self._obj_cache.pop(item_id, None)
+
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a whole file (blocking; run it via asyncio.to_thread)."""
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _read_json(self, path: Path) -> Any:
+        """
+        Read and parse a JSON file (blocking; run it via asyncio.to_thread).
+
+        The raw bytes go straight to orjson; there is no intermediate str
+        or UTF-8 decode pass. Files of MMAP_THRESHOLD bytes or more are
+        memory-mapped instead of copied into a bytes object, so the kernel
+        pages them in as the parser reaches them.
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The view must be released before the map can close
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _write_json(self, path: Path, data: Any):
+        """
+        Write data to path as JSON, atomically (blocking; run it via
+        asyncio.to_thread).
+
+        Args:
+            path: Destination file
+            data: JSON-serializable data
+        """
+        self._write_bytes(path, orjson.dumps(data, option=DUMP_OPTIONS))
+
+    def _write_bytes(self, path: Path, payload: bytes):
+        """
+        Write already-serialized JSON to path, atomically (blocking; run it
+        via asyncio.to_thread).
+
+        The bytes go to a sibling temp file that is fsynced and then renamed
+        over path, so readers (and a restart after a crash) see either the
+        old or the new file, never a partial one.
+
+        Args:
+            path: Destination file
+            payload: Serialized file contents
+        """
+        # Per-thread temp name: concurrent writers of one item may run in
+        # different worker threads
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            # Thread ids vary, so a leftover temp file would never be reused
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _metadata_stat(self) -> Optional[os.stat_result]:
+        """Stat the metadata file, or None if it does not exist."""
+        try:
+            return self._get_metadata_path().stat()
+        except FileNotFoundError:
+            return None
+
+    def _metadata_mtime(self) -> Optional[int]:
+        """Get the metadata file's mtime_ns, or None if it does not exist."""
+        st = self._metadata_stat()
+        return st.st_mtime_ns if st is not None else None
+
+    async def _load_metadata(self) -> Dict[str, Any]:
+        """
+        Load metadata index.
+
+        Returns the cached index (the same dict on every call) unless the
+        file changed on disk since it was last read or written. Unflushed
+        changes always win over the file.
+        """
+        async with self._meta_lock:
+            return await self._load_metadata_locked()
+
+    async def _load_metadata_locked(self) -> Dict[str, Any]:
+        """Body of _load_metadata; the caller must hold _meta_lock."""
+        if self._meta_dirty:
+            return self._meta_cache
+
+        st = self._metadata_stat()
+        mtime = st.st_mtime_ns if st is not None else None
+        if self._meta_cache is not None and mtime == self._meta_mtime:
+            return self._meta_cache
+
+        metadata: Dict[str, Any] = {}
+        # Missing, empty or "{}": nothing to parse
+        if st is not None and st.st_size > 2:
+            try:
+                metadata = await asyncio.to_thread(
+                    self._read_json, self._get_metadata_path()
+                )
+            except Exception as e:
+                logger.error(f"Error loading metadata: {e}")
+
+        self._meta_cache = metadata
+        self._meta_mtime = mtime
+        return metadata
+
+    async def preload(self):
+        """Load the metadata index into memory ahead of the first request."""
+        await self._load_metadata()
+
+    async def _update_metadata(self, entries: Dict[str, Optional[Dict[str, Any]]]):
+        """
+        Set or remove index entries and schedule writing the index to disk.
+
+        Args:
+            entries: Item ID -> new index entry, or None to remove the item
+        """
+        async with self._meta_lock:
+            metadata = await self._load_metadata_locked()
+            for item_id, entry in entries.items():
+                if entry is None:
+                    metadata.pop(item_id, None)
+                else:
+                    metadata[item_id] = entry
+            self._meta_dirty = True
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        """Write the index once the current burst of changes has settled."""
+        await asyncio.sleep(self.FLUSH_DELAY)
+        await self.flush()
+
+    async def flush(self):
+        """Write the cached metadata index to disk if it has unsaved changes."""
+        async with self._meta_lock:
+            if not self._meta_dirty:
+                return
+            try:
+                # Serialize a snapshot so the worker thread never sees the
+                # dict change underneath it
+                await asyncio.to_thread(
+                    self._write_json, self._get_metadata_path(), dict(self._meta_cache)
+                )
+            except Exception as e:
+                logger.error(f"Error saving metadata: {e}")
+                return
+            self._meta_dirty = False
+            self._meta_mtime = self._metadata_mtime()
@@ -1,17 +1,19 @@
 """JSON file-based pipeline repository implementation."""
 
-import json
+import asyncio
 import logging
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import orjson
+
 from domain.repositories.pipeline_repository import IPipelineRepository
+from infrastructure.storage.json_file_store import JsonFileStore
 
 logger = logging.getLogger(__name__)
 
 
-class JsonPipelineRepository(IPipelineRepository):
+class JsonPipelineRepository(JsonFileStore, IPipelineRepository):
     """
     JSON file-based pipeline storage.
 
@@ -26,42 +28,9 @@ class JsonPipelineRepository(IPipelineRepository):
         Args:
             storage_dir: Directory to store pipeline files
         """
-        self.storage_dir = Path(storage_dir)
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(storage_dir)
         logger.info(f"JsonPipelineRepository initialized with directory: {self.storage_dir}")
 
-    def _get_file_path(self, pipeline_id: str) -> Path:
-        """Get file path for a pipeline."""
-        # Sanitize pipeline_id to prevent directory traversal
-        safe_id = "".join(c for c in pipeline_id if c.isalnum() or c in ('_', '-'))
-        return self.storage_dir / f"{safe_id}.json"
-
-    def _get_metadata_path(self) -> Path:
-        """Get path for metadata index file."""
-        return self.storage_dir / "_metadata.json"
-
-    async def _load_metadata(self) -> Dict[str, Any]:
-        """Load metadata index."""
-        metadata_path = self._get_metadata_path()
-        if not metadata_path.exists():
-            return {}
-
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading metadata: {e}")
-            return {}
-
-    async def _save_metadata(self, metadata: Dict[str, Any]):
-        """Save metadata index."""
-        metadata_path = self._get_metadata_path()
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Error saving metadata: {e}")
-
     async def save(self, pipeline_id: str, pipeline_data: Dict[str, Any]) -> str:
         """
         Save a pipeline to JSON file.
@@ -87,18 +56,18 @@ class JsonPipelineRepository(IPipelineRepository):
 
         try:
             # Save pipeline file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(full_data, f, indent=2, ensure_ascii=False)
-
-            # Update metadata index
-            metadata = await self._load_metadata()
-            metadata[pipeline_id] = {
-                "id": pipeline_id,
-                "name": full_data["name"],
-                "created_at": full_data["created_at"],
-                "updated_at": full_data["updated_at"]
-            }
-            await self._save_metadata(metadata)
+            await asyncio.to_thread(self._write_json, file_path, full_data)
+            self._forget(pipeline_id)
+
+            # Update metadata index (written to disk by the deferred flush)
+            await self._update_metadata({
+                pipeline_id: {
+                    "id": pipeline_id,
+                    "name": full_data["name"],
+                    "created_at": full_data["created_at"],
+                    "updated_at": full_data["updated_at"]
+                }
+            })
 
             logger.info(f"Saved pipeline: {pipeline_id}")
             return pipeline_id
@@ -115,18 +84,25 @@ class JsonPipelineRepository(IPipelineRepository):
             pipeline_id: Pipeline identifier
 
         Returns:
-            Pipeline data or None if not found
+            A new copy of the pipeline data per call, or None if not found
         """
         file_path = self._get_file_path(pipeline_id)
 
-        if not file_path.exists():
+        try:
+            mtime = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._forget(pipeline_id)
             logger.debug(f"Pipeline not found: {pipeline_id}")
             return None
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                full_data = json.load(f)
-                return full_data.get("data", full_data)
+            payload = self._cached(pipeline_id, mtime)
+            if payload is None:
+                payload = await asyncio.to_thread(self._read_bytes, file_path)
+                self._remember(pipeline_id, mtime, payload)
+
+            full_data = orjson.loads(payload)
+            return full_data.get("data", full_data)
 
         except Exception as e:
             logger.error(f"Error loading pipeline {pipeline_id}: {e}")
@@ -154,27 +130,24 @@ class JsonPipelineRepository(IPipelineRepository):
         """
         file_path = self._get_file_path(pipeline_id)
 
-        if not file_path.exists():
+        try:
+            # Delete file (a missing file is the not-found case; no stat first)
+            await asyncio.to_thread(file_path.unlink)
+        except FileNotFoundError:
             logger.debug(f"Pipeline not found for deletion: {pipeline_id}")
             return False
-
-        try:
-            # Delete file
-            file_path.unlink()
-
-            # Update metadata
-            metadata = await self._load_metadata()
-            if pipeline_id in metadata:
-                del metadata[pipeline_id]
-                await self._save_metadata(metadata)
-
-            logger.info(f"Deleted pipeline: {pipeline_id}")
-            return True
-
         except Exception as e:
             logger.error(f"Error deleting pipeline {pipeline_id}: {e}")
             return False
 
+        self._forget(pipeline_id)
+
+        # Update metadata
+        await self._update_metadata({pipeline_id: None})
+
+        logger.info(f"Deleted pipeline: {pipeline_id}")
+        return True
+
     async def exists(self, pipeline_id: str) -> bool:
         """
         Check if a pipeline exists.
@@ -203,10 +176,10 @@ class JsonPipelineRepository(IPipelineRepository):
             logger.debug(f"Pipeline not found for update: {pipeline_id}")
             return False
 
-        # Get existing data to preserve created_at
-        existing = await self.get(pipeline_id)
-        if existing:
-            pipeline_data["created_at"] = existing.get("created_at")
+        # Preserve created_at from the index rather than re-reading the file
+        meta = (await self._load_metadata()).get(pipeline_id)
+        if meta and meta.get("created_at"):
+            pipeline_data["created_at"] = meta["created_at"]
 
         await self.save(pipeline_id, pipeline_data)
         return True
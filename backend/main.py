@@ -1,5 +1,6 @@
 """Main FastAPI application for UI Pipeline System."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -37,6 +38,9 @@ async def lifespan(app: FastAPI):
     logger.info("Starting UI Pipeline System...")
     logger.info(f"Plugin directory: {settings.PLUGIN_DIR}")
 
+    # Run short event handlers eagerly (Python 3.12+)
+    event_bus.install_eager_task_factory(asyncio.get_running_loop())
+
     # Initialize managers
     plugin_loader = PluginLoader(str(settings.PLUGIN_DIR))
     device_manager = DeviceManager(plugin_loader)
@@ -44,8 +48,12 @@ async def lifespan(app: FastAPI):
     pipeline_repository = JsonPipelineRepository()
     composite_repository = JsonCompositeRepository()
 
-    # Discover plugins
-    plugins = await plugin_loader.discover_plugins()
+    # Discover plugins while warming the repository metadata caches
+    plugins, _, _ = await asyncio.gather(
+        plugin_loader.discover_plugins(),
+        pipeline_repository.preload(),
+        composite_repository.preload(),
+    )
     logger.info(f"Discovered {len(plugins)} plugins")
 
     # Set managers for legacy routes (backward compatibility)
@@ -76,6 +84,11 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down UI Pipeline System...")
+    # Flush pending composite writes
+    await container.composite_write_coordinator().close()
+    # Write metadata indexes still waiting for their debounced flush
+    await pipeline_repository.flush()
+    await composite_repository.flush()
     # Unwire container
     container.unwire()
     logger.info("UI Pipeline System shutdown complete")
@@ -1,11 +1,5 @@
 """Example device implementation."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_device import BaseDevice, DeviceStatus
 from typing import Any, Dict
 import asyncio
@@ -48,7 +42,11 @@ class ExampleDevice(BaseDevice):
             self.status = DeviceStatus.CONNECTING
 
             # TODO: Implement actual connection logic
-            # Example: self.connection = serial.Serial(self.port, self.baudrate)
+            # Example: self.connection = await self.run_blocking(
+            #     serial.Serial, self.port, self.baudrate
+            # )
+            # Route every blocking driver call through run_blocking so it
+            # runs in the shared I/O pool instead of on the event loop
 
             # Simulate connection delay
             await asyncio.sleep(0.1)
@@ -90,7 +88,7 @@ class ExampleDevice(BaseDevice):
         # TODO: Implement actual health check
         # Example: Send ping command and check response
 
-        return self.status == DeviceStatus.CONNECTED
+        return self.is_connected()
 
     def get_info(self) -> Dict[str, Any]:
         """
@@ -1,11 +1,5 @@
 """Example device functions."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_function import BaseFunction
 from typing import Any, Dict
 import time
@@ -54,6 +48,11 @@ class WriteValueFunction(BaseFunction):
     Function ID: write_value
     """
 
+    # Input schema, compiled once by BaseFunction when the class is defined
+    _SCHEMA = {
+        'value': {'type': 'number', 'required': True}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute write operation.
@@ -65,10 +64,7 @@ class WriteValueFunction(BaseFunction):
             {'complete': True, 'success': bool}
         """
         # Validate inputs
-        schema = {
-            'value': {'type': 'number', 'required': True}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         # Get device instance
         device = self.get_device()
@@ -1,9 +1,5 @@
 """Loadcell indicator device."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_device import BaseDevice, DeviceStatus
 from typing import Any, Dict
 import asyncio
@@ -21,12 +17,29 @@ class LoadcellDevice(BaseDevice):
         self.baudrate = config.get('baudrate', 9600)
         self.unit = config.get('unit', 'g')
         self.decimal_places = config.get('decimal_places', 2)
+        # Readings are rounded by integer scaling; cheaper than round()
+        self._scale = 10 ** self.decimal_places
+
+        # Config never changes after init; get_info reuses this dict
+        self._info_config = {
+            "port": self.port,
+            "baudrate": self.baudrate,
+            "unit": self.unit,
+            "decimal_places": self.decimal_places,
+        }
+
+        # Own generator per device; an optional 'seed' makes readings repeatable
+        self._rnd = random.Random(config.get('seed'))
 
         # Internal state
         self.tare_offset = 0.0
         self.current_value = 0.0
         self.is_stable = True
 
+        # Returned by every reading and updated in place; callers copy it
+        # if they need to keep a snapshot
+        self._reading = {"value": 0.0, "unit": self.unit, "stable": True}
+
     async def connect(self) -> bool:
         """Connect to loadcell indicator."""
         try:
@@ -45,7 +58,7 @@ class LoadcellDevice(BaseDevice):
 
     async def health_check(self) -> bool:
         """Check device health."""
-        return self.status == DeviceStatus.CONNECTED
+        return self.is_connected()
 
     def get_info(self) -> Dict[str, Any]:
         """Get device info."""
@@ -53,12 +66,7 @@ class LoadcellDevice(BaseDevice):
             "id": self.instance_id,
             "type": "loadcell",
             "status": self.get_status(),
-            "config": {
-                "port": self.port,
-                "baudrate": self.baudrate,
-                "unit": self.unit,
-                "decimal_places": self.decimal_places
-            },
+            "config": self._info_config,
             "state": {
                 "value": self.current_value,
                 "tare_offset": self.tare_offset,
@@ -66,6 +74,17 @@ class LoadcellDevice(BaseDevice):
             }
         }
 
+    def _round(self, value: float) -> float:
+        """Round a reading to decimal_places (half away from zero)."""
+        return int(value * self._scale + (0.5 if value >= 0 else -0.5)) / self._scale
+
+    def _reading_view(self) -> Dict[str, Any]:
+        """Refresh and return the shared reading dict."""
+        reading = self._reading
+        reading["value"] = self.current_value
+        reading["stable"] = self.is_stable
+        return reading
+
     async def tare(self) -> Dict[str, Any]:
         """Zero the loadcell."""
         await asyncio.sleep(0.1)
@@ -77,36 +96,36 @@ class LoadcellDevice(BaseDevice):
         await asyncio.sleep(0.02)
 
         # Simulate measurement
-        raw_value = 50.0 + random.uniform(-2.0, 2.0)
-        self.current_value = round(raw_value - self.tare_offset, self.decimal_places)
-        self.is_stable = random.random() > 0.1  # 90% stable
+        raw_value = 50.0 + self._rnd.uniform(-2.0, 2.0)
+        self.current_value = self._round(raw_value - self.tare_offset)
+        self.is_stable = self._rnd.random() > 0.1  # 90% stable
 
-        return {
-            "value": self.current_value,
-            "unit": self.unit,
-            "stable": self.is_stable
-        }
+        return self._reading_view()
 
     async def get_average(self, samples: int = 5) -> Dict[str, Any]:
         """Read averaged value."""
-        values = []
-        for _ in range(samples):
-            await asyncio.sleep(0.02)
-            raw_value = 50.0 + random.uniform(-2.0, 2.0)
-            values.append(raw_value - self.tare_offset)
-
-        avg_value = sum(values) / len(values)
-        self.current_value = round(avg_value, self.decimal_places)
+        # One wait for the whole sampling window instead of one per sample
+        await asyncio.sleep(0.02 * samples)
+
+        # Welford's running mean/variance: one pass, no sample list
+        noise_mean = 0.0
+        sq_dev_sum = 0.0
+        uniform = self._rnd.uniform
+        for n in range(1, samples + 1):
+            noise = uniform(-2.0, 2.0)
+            delta = noise - noise_mean
+            noise_mean += delta / n
+            sq_dev_sum += delta * (noise - noise_mean)
+
+        # Offsets are applied once to the mean; variance does not depend on them
+        avg_value = 50.0 + noise_mean - self.tare_offset
+        self.current_value = self._round(avg_value)
 
         # Check stability (low variance = stable)
-        variance = sum((v - avg_value) ** 2 for v in values) / len(values)
+        variance = sq_dev_sum / samples
         self.is_stable = variance < 0.5
 
-        return {
-            "value": self.current_value,
-            "unit": self.unit,
-            "stable": self.is_stable
-        }
+        return self._reading_view()
 
     def evaluate(self, value: float, spec_min: float, spec_max: float) -> Dict[str, Any]:
         """Evaluate value against spec."""
@@ -1,9 +1,5 @@
 """Loadcell indicator functions."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_function import BaseFunction
 from typing import Any, Dict
 
@@ -76,12 +72,13 @@ class GetValueFunction(BaseFunction):
 class GetAverageFunction(BaseFunction):
     """Get averaged loadcell value."""
 
+    _SCHEMA = {
+        'samples': {'type': 'number', 'required': False, 'default': 5}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get average."""
-        schema = {
-            'samples': {'type': 'number', 'required': False, 'default': 5}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         device = self.get_device()
         if not device.is_connected():
@@ -100,14 +97,15 @@ class GetAverageFunction(BaseFunction):
 class EvaluateFunction(BaseFunction):
     """Evaluate value against spec."""
 
+    _SCHEMA = {
+        'value': {'type': 'number', 'required': True},
+        'spec_min': {'type': 'number', 'required': True},
+        'spec_max': {'type': 'number', 'required': True}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute evaluation."""
-        schema = {
-            'value': {'type': 'number', 'required': True},
-            'spec_min': {'type': 'number', 'required': True},
-            'spec_max': {'type': 'number', 'required': True}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         device = self.get_device()
         if not device.is_connected():
@@ -1,11 +1,5 @@
 """Logic device implementation - Virtual device for logic operations."""
 
-import sys
-from pathlib import Path
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_device import BaseDevice, DeviceStatus
 from typing import Any, Dict
 
@@ -28,6 +22,9 @@ class LogicDevice(BaseDevice):
         """
         super().__init__(instance_id, config)
 
+        # No configurable settings; get_info reuses this empty dict
+        self._info_config: Dict[str, Any] = {}
+
     async def connect(self) -> bool:
         """
         Connect to the device (virtual - always succeeds).
@@ -55,7 +52,7 @@ class LogicDevice(BaseDevice):
         Returns:
             True if connected
         """
-        return self.status == DeviceStatus.CONNECTED
+        return self.is_connected()
 
     def get_info(self) -> Dict[str, Any]:
         """
@@ -68,6 +65,6 @@ class LogicDevice(BaseDevice):
             "id": self.instance_id,
             "type": "logic_device",
             "status": self.get_status(),
-            "config": {},
+            "config": self._info_config,
             "error": self.get_error()
         }
@@ -1,12 +1,8 @@
 """Logic control functions."""
 
-import sys
-from pathlib import Path
 import asyncio
 import logging
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import time
 
 from core.base_function import BaseFunction
 from typing import Any, Dict
@@ -21,6 +17,8 @@ class DelayFunction(BaseFunction):
     Function ID: delay
     """
 
+    SHORT_DELAY_MS = 2
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute delay.
@@ -37,15 +35,28 @@ class DelayFunction(BaseFunction):
         # Get duration from config (in milliseconds)
         duration_ms = inputs.get('duration_ms', 1000)
 
+        if duration_ms <= 0:
+            return {
+                'complete': True
+            }
+
         # Convert to seconds
         duration_sec = duration_ms / 1000.0
 
-        logger.info(f"Delay: waiting {duration_ms}ms ({duration_sec}s)")
+        logger.info("Delay: waiting %sms (%ss)", duration_ms, duration_sec)
 
         # Wait
-        await asyncio.sleep(duration_sec)
+        if duration_ms < self.SHORT_DELAY_MS:
+            # Timer-based sleeps can overshoot sub-tick delays by a whole
+            # scheduler tick (~15.6ms on Windows); yield to the loop until
+            # a high-resolution deadline instead
+            deadline = time.perf_counter() + duration_sec
+            while time.perf_counter() < deadline:
+                await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(duration_sec)
 
-        logger.info(f"Delay: complete after {duration_ms}ms")
+        logger.info("Delay: complete after %sms", duration_ms)
 
         return {
             'complete': True
@@ -72,20 +83,14 @@ class BranchFunction(BaseFunction):
         Returns:
             {'true': True} or {'false': True} based on condition
         """
-        condition = inputs.get('condition', False)
+        condition = bool(inputs.get('condition', False))
 
-        logger.info(f"Branch: condition is {condition}")
+        logger.info("Branch: condition is %s", condition)
 
-        if condition:
-            return {
-                'true': True,
-                'false': False
-            }
-        else:
-            return {
-                'true': False,
-                'false': True
-            }
+        return {
+            'true': condition,
+            'false': not condition
+        }
 
 
 class PrintFunction(BaseFunction):
@@ -112,7 +117,7 @@ class PrintFunction(BaseFunction):
 
         # Print to console and log
         print(f"[Pipeline Print] {message}")
-        logger.info(f"Print: {message}")
+        logger.info("Print: %s", message)
 
         return {
             'complete': True
@@ -141,7 +146,7 @@ class SetVariableFunction(BaseFunction):
         """
         value = inputs.get('value', None)
 
-        logger.info(f"SetVariable: value = {value}")
+        logger.info("SetVariable: value = %s", value)
 
         return {
             'complete': True,
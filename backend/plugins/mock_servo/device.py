@@ -1,9 +1,5 @@
 """Mock servo motor device."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_device import BaseDevice, DeviceStatus
 from typing import Any, Dict
 import asyncio
@@ -19,6 +15,12 @@ class MockServoDevice(BaseDevice):
         self.axis = config.get('axis', 0)
         self.max_position = config.get('max_position', 1000.0)
 
+        # Config never changes after init; get_info reuses this dict
+        self._info_config = {
+            "axis": self.axis,
+            "max_position": self.max_position,
+        }
+
         # Internal state
         self.current_position = 0.0
         self.current_velocity = 0.0
@@ -42,7 +44,7 @@ class MockServoDevice(BaseDevice):
 
     async def health_check(self) -> bool:
         """Check servo health."""
-        return self.status == DeviceStatus.CONNECTED
+        return self.is_connected()
 
     def get_info(self) -> Dict[str, Any]:
         """Get device info."""
@@ -50,10 +52,7 @@ class MockServoDevice(BaseDevice):
             "id": self.instance_id,
             "type": "mock_servo",
             "status": self.get_status(),
-            "config": {
-                "axis": self.axis,
-                "max_position": self.max_position
-            },
+            "config": self._info_config,
             "state": {
                 "position": self.current_position,
                 "velocity": self.current_velocity,
@@ -71,8 +70,10 @@ class MockServoDevice(BaseDevice):
 
     async def move_to_position(self, position: float, speed: float = 100.0) -> float:
         """Move to target position."""
-        if position < 0 or position > self.max_position:
-            raise ValueError(f"Position {position} out of range [0, {self.max_position}]")
+        max_position = self.max_position
+        # Chained compare: one range test, and NaN positions are rejected
+        if not 0 <= position <= max_position:
+            raise ValueError(f"Position {position} out of range [0, {max_position}]")
 
         # Simulate movement
         distance = abs(position - self.current_position)
@@ -1,9 +1,5 @@
 """Mock servo motor functions."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_function import BaseFunction
 from typing import Any, Dict
 
@@ -29,14 +25,15 @@ class HomeFunction(BaseFunction):
 class MoveFunction(BaseFunction):
     """Move servo to position function."""
 
+    _SCHEMA = {
+        'position': {'type': 'number', 'required': True},
+        'speed': {'type': 'number', 'required': False, 'default': 100.0}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute move."""
         # Validate inputs
-        schema = {
-            'position': {'type': 'number', 'required': True},
-            'speed': {'type': 'number', 'required': False, 'default': 100.0}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         device = self.get_device()
 
@@ -1,14 +1,18 @@
 """Power supply device."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_device import BaseDevice, DeviceStatus
 from typing import Any, Dict
 import asyncio
 import random
 
+# Readings are reported to 3 decimals, rounded by integer scaling
+_R3 = 1000.0
+
+
+def _round3(value: float) -> float:
+    """Round to 3 decimals (half away from zero); cheaper than round()."""
+    return int(value * _R3 + (0.5 if value >= 0 else -0.5)) / _R3
+
 
 class PowerSupplyDevice(BaseDevice):
     """Power supply control device."""
@@ -21,6 +25,20 @@ class PowerSupplyDevice(BaseDevice):
         self.baudrate = config.get('baudrate', 9600)
         self.max_voltage = config.get('max_voltage', 30.0)
         self.max_current = config.get('max_current', 5.0)
+        # Skip the simulated command latency (e.g. for automated tests)
+        self.fast_mock = config.get('fast_mock', False)
+
+        # Config never changes after init; get_info reuses this dict
+        self._info_config = {
+            "port": self.port,
+            "baudrate": self.baudrate,
+            "max_voltage": self.max_voltage,
+            "max_current": self.max_current,
+            "fast_mock": self.fast_mock,
+        }
+
+        # Own generator per device; an optional 'seed' makes readings repeatable
+        self._rnd = random.Random(config.get('seed'))
 
         # Internal state
         self.output_on = False
@@ -28,18 +46,24 @@ class PowerSupplyDevice(BaseDevice):
         self.set_current_value = 0.0
         self.actual_voltage = 0.0
         self.actual_current = 0.0
+        self._output_view = {"voltage": 0.0, "current": 0.0, "output_on": False}
 
     async def connect(self) -> bool:
         """Connect to power supply."""
         try:
             self.status = DeviceStatus.CONNECTING
-            await asyncio.sleep(0.1)
+            await self._settle(0.1)
             self.status = DeviceStatus.CONNECTED
             return True
         except Exception as e:
             self.set_error(str(e))
             return False
 
+    async def _settle(self, seconds: float):
+        """Simulate command latency unless fast_mock is set."""
+        if not self.fast_mock:
+            await asyncio.sleep(seconds)
+
     async def disconnect(self) -> bool:
         """Disconnect from power supply."""
         self.status = DeviceStatus.DISCONNECTED
@@ -47,7 +71,7 @@ class PowerSupplyDevice(BaseDevice):
 
     async def health_check(self) -> bool:
         """Check device health."""
-        return self.status == DeviceStatus.CONNECTED
+        return self.is_connected()
 
     def get_info(self) -> Dict[str, Any]:
         """Get device info."""
@@ -55,12 +79,7 @@ class PowerSupplyDevice(BaseDevice):
             "id": self.instance_id,
             "type": "power_supply",
             "status": self.get_status(),
-            "config": {
-                "port": self.port,
-                "baudrate": self.baudrate,
-                "max_voltage": self.max_voltage,
-                "max_current": self.max_current
-            },
+            "config": self._info_config,
             "state": {
                 "output_on": self.output_on,
                 "voltage": self.actual_voltage,
@@ -70,15 +89,15 @@ class PowerSupplyDevice(BaseDevice):
 
     async def power_on(self) -> Dict[str, Any]:
         """Turn on output."""
-        await asyncio.sleep(0.05)
+        await self._settle(0.05)
         self.output_on = True
-        self.actual_voltage = self.set_voltage_value + random.uniform(-0.02, 0.02)
-        self.actual_current = random.uniform(0.01, 0.1)
+        self.actual_voltage = self.set_voltage_value + self._rnd.uniform(-0.02, 0.02)
+        self.actual_current = self._rnd.uniform(0.01, 0.1)
         return {"output_on": self.output_on}
 
     async def power_off(self) -> Dict[str, Any]:
         """Turn off output."""
-        await asyncio.sleep(0.05)
+        await self._settle(0.05)
         self.output_on = False
         self.actual_voltage = 0.0
         self.actual_current = 0.0
@@ -89,25 +108,30 @@ class PowerSupplyDevice(BaseDevice):
         if voltage < 0 or voltage > self.max_voltage:
             raise ValueError(f"Voltage {voltage} out of range [0, {self.max_voltage}]")
 
-        await asyncio.sleep(0.05)
+        await self._settle(0.05)
         self.set_voltage_value = voltage
         if self.output_on:
-            self.actual_voltage = voltage + random.uniform(-0.02, 0.02)
-        return {"actual_voltage": round(self.actual_voltage, 3)}
+            self.actual_voltage = voltage + self._rnd.uniform(-0.02, 0.02)
+        return {"actual_voltage": _round3(self.actual_voltage)}
 
     async def set_current(self, current: float) -> Dict[str, Any]:
         """Set current limit."""
         if current < 0 or current > self.max_current:
             raise ValueError(f"Current {current} out of range [0, {self.max_current}]")
 
-        await asyncio.sleep(0.05)
+        await self._settle(0.05)
         self.set_current_value = current
-        return {"actual_current": round(self.set_current_value, 3)}
+        return {"actual_current": _round3(self.set_current_value)}
 
     def get_output(self) -> Dict[str, Any]:
-        """Get current output state."""
-        return {
-            "voltage": round(self.actual_voltage, 3),
-            "current": round(self.actual_current, 3),
-            "output_on": self.output_on
-        }
+        """
+        Get current output state.
+
+        The same dict is updated and returned on every call; copy it to
+        keep a snapshot.
+        """
+        view = self._output_view
+        view["voltage"] = _round3(self.actual_voltage)
+        view["current"] = _round3(self.actual_current)
+        view["output_on"] = self.output_on
+        return view
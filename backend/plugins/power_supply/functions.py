@@ -1,9 +1,5 @@
 """Power supply functions."""
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.base_function import BaseFunction
 from typing import Any, Dict
 
@@ -66,12 +62,13 @@ class PowerOffFunction(BaseFunction):
 class SetVoltageFunction(BaseFunction):
     """Set output voltage."""
 
+    _SCHEMA = {
+        'voltage': {'type': 'number', 'required': True}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute set voltage."""
-        schema = {
-            'voltage': {'type': 'number', 'required': True}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         device = self.get_device()
         if not device.is_connected():
@@ -87,12 +84,13 @@ class SetVoltageFunction(BaseFunction):
 class SetCurrentFunction(BaseFunction):
     """Set current limit."""
 
+    _SCHEMA = {
+        'current': {'type': 'number', 'required': True}
+    }
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute set current."""
-        schema = {
-            'current': {'type': 'number', 'required': True}
-        }
-        self.validate_inputs(inputs, schema)
+        self.validate_inputs(inputs)
 
         device = self.get_device()
         if not device.is_connected():
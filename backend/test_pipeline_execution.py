@@ -1,58 +1,69 @@
 """Test pipeline execution with events."""
 
 import asyncio
-import json
+import orjson
 import requests
+import sys
 from datetime import datetime
 
+# Shared session so successive calls reuse the keep-alive connection
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+
+
+# Fixed part of the test pipeline; only the ID changes per run
+_PIPELINE_TEMPLATE = {
+    "name": "Test Pipeline with Events",
+    "nodes": [
+        {
+            "id": "device_1",
+            "type": "function",
+            "device_instance": "servo_1",
+            "function_id": "home",
+            "config": {}
+        },
+        {
+            "id": "device_2",
+            "type": "function",
+            "device_instance": "servo_1",
+            "function_id": "move_absolute",
+            "config": {
+                "position": 100
+            }
+        },
+        {
+            "id": "device_3",
+            "type": "function",
+            "device_instance": "servo_1",
+            "function_id": "move_absolute",
+            "config": {
+                "position": 0
+            }
+        }
+    ],
+    "edges": [
+        {
+            "source": "device_1",
+            "target": "device_2",
+            "source_handle": "complete",
+            "target_handle": "trigger"
+        },
+        {
+            "source": "device_2",
+            "target": "device_3",
+            "source_handle": "complete",
+            "target_handle": "trigger"
+        }
+    ],
+    "variables": {}
+}
+
 
 def create_test_pipeline():
     """Create a simple test pipeline."""
     return {
         "pipeline_id": f"test_pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-        "name": "Test Pipeline with Events",
-        "nodes": [
-            {
-                "id": "device_1",
-                "type": "function",
-                "device_instance": "servo_1",
-                "function_id": "home",
-                "config": {}
-            },
-            {
-                "id": "device_2",
-                "type": "function",
-                "device_instance": "servo_1",
-                "function_id": "move_absolute",
-                "config": {
-                    "position": 100
-                }
-            },
-            {
-                "id": "device_3",
-                "type": "function",
-                "device_instance": "servo_1",
-                "function_id": "move_absolute",
-                "config": {
-                    "position": 0
-                }
-            }
-        ],
-        "edges": [
-            {
-                "source": "device_1",
-                "target": "device_2",
-                "source_handle": "complete",
-                "target_handle": "trigger"
-            },
-            {
-                "source": "device_2",
-                "target": "device_3",
-                "source_handle": "complete",
-                "target_handle": "trigger"
-            }
-        ],
-        "variables": {}
+        **_PIPELINE_TEMPLATE
     }
 
 
@@ -69,7 +80,7 @@ def create_device():
     }
 
     print("🔧 Creating device instance...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, data=orjson.dumps(payload))
 
     if response.status_code == 200:
         print("✅ Device created successfully!")
@@ -94,10 +105,10 @@ def execute_pipeline(pipeline_def):
     print(f"   Pipeline ID: {pipeline_def['pipeline_id']}")
     print(f"   Nodes: {len(pipeline_def['nodes'])}")
 
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, data=orjson.dumps(payload))
 
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print("\n✅ Pipeline execution completed!")
         print(f"   Success: {result.get('success')}")
         print(f"   Nodes executed: {result.get('nodes_executed')}")
@@ -131,7 +142,9 @@ def main():
     print("\n💡 Tip: Run test_websocket.py in another terminal to see events!")
     print("   python test_websocket.py\n")
 
-    input("Press Enter to execute pipeline...")
+    # Only pause for an interactive user; CI and piped runs go straight on
+    if sys.stdin.isatty() and "--yes" not in sys.argv:
+        input("Press Enter to execute pipeline...")
 
     if execute_pipeline(pipeline):
         print("\n✅ Test completed successfully!")
@@ -1,10 +1,49 @@
 """WebSocket connection test script."""
 
 import asyncio
-import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+import orjson
 from websockets import connect
 
 
+# Event lines go through a queue and are written by a background thread,
+# so bursts of events never make the receive loop wait on stdout
+_log_queue: queue.Queue = queue.Queue(-1)
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+
+log = logging.getLogger("ws_events")
+log.setLevel(logging.INFO)
+log.propagate = False
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+
+def print_event(data):
+    """Pretty print a single event via the queued event logger."""
+    event_type = data.get("type", "unknown")
+
+    if event_type == "pipeline_started":
+        log.info("🚀 Pipeline Started: %s", data.get('pipeline_name'))
+    elif event_type == "node_executing":
+        log.info("⚙️  Executing Node: %s", data.get('node_id'))
+    elif event_type == "node_completed":
+        exec_time = data.get('execution_time', 0)
+        log.info("✅ Node Completed: %s (%.3fs)", data.get('node_id'), exec_time)
+    elif event_type == "pipeline_completed":
+        total_time = data.get('execution_time', 0)
+        nodes = data.get('nodes_executed', 0)
+        log.info("🎉 Pipeline Completed: %s nodes in %.3fs", nodes, total_time)
+    elif event_type == "pipeline_error":
+        log.info("❌ Pipeline Error: %s", data.get('error_message'))
+    else:
+        log.info("📬 Event: %s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+
+
 async def test_websocket():
     """Test WebSocket connection and events."""
     uri = "ws://localhost:8000/ws"
@@ -17,8 +56,8 @@ async def test_websocket():
 
             # Receive welcome message
             message = await websocket.recv()
-            data = json.loads(message)
-            print(f"\n📨 Received: {json.dumps(data, indent=2)}")
+            data = orjson.loads(message)
+            print(f"\n📨 Received: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
 
             # Listen for events for 30 seconds
             print("\n👂 Listening for events (30 seconds)...")
@@ -28,26 +67,14 @@ async def test_websocket():
                 async with asyncio.timeout(30):
                     while True:
                         message = await websocket.recv()
-                        data = json.loads(message)
-
-                        event_type = data.get("type", "unknown")
-
-                        # Pretty print events
-                        if event_type == "pipeline_started":
-                            print(f"🚀 Pipeline Started: {data.get('pipeline_name')}")
-                        elif event_type == "node_executing":
-                            print(f"⚙️  Executing Node: {data.get('node_id')}")
-                        elif event_type == "node_completed":
-                            exec_time = data.get('execution_time', 0)
-                            print(f"✅ Node Completed: {data.get('node_id')} ({exec_time:.3f}s)")
-                        elif event_type == "pipeline_completed":
-                            total_time = data.get('execution_time', 0)
-                            nodes = data.get('nodes_executed', 0)
-                            print(f"🎉 Pipeline Completed: {nodes} nodes in {total_time:.3f}s")
-                        elif event_type == "pipeline_error":
-                            print(f"❌ Pipeline Error: {data.get('error_message')}")
+                        data = orjson.loads(message)
+
+                        # The server coalesces bursts of events into one frame
+                        if data.get("type") == "batch":
+                            for event in data.get("events", []):
+                                print_event(event)
                         else:
-                            print(f"📬 Event: {json.dumps(data, indent=2)}")
+                            print_event(data)
 
             except asyncio.TimeoutError:
                 print("\n⏱️  Timeout reached (no more events)")
@@ -60,5 +87,10 @@ if __name__ == "__main__":
     print("=" * 60)
     print("WebSocket Event Listener Test")
     print("=" * 60)
-    asyncio.run(test_websocket())
+    _log_listener.start()
+    try:
+        asyncio.run(test_websocket())
+    finally:
+        # Drain queued event lines before the final message
+        _log_listener.stop()
     print("\n✅ Test completed!")
@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+
+import asyncio
+
+try:
+    # Installed with uvicorn[standard] everywhere except Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+    # Run the async tests on uvloop's libuv-based event loop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
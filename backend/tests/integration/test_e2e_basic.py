@@ -1,6 +1,9 @@
 """End-to-end integration tests."""
 
+import asyncio
+import copy
 import pytest
+import pytest_asyncio
 import sys
 from pathlib import Path
 
@@ -10,12 +13,107 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.plugin_loader import PluginLoader
 from core.device_manager import DeviceManager
 from core.execution_engine import ExecutionEngine
+from domain.events.event_bus import EventBus
+from domain.events.pipeline_events import PipelineStartedEvent
+from domain.exceptions import CircularDependencyError
+
+
+# Home -> Move -> Get Position on a single servo; the device instance is
+# filled in per pipeline by _make_pipeline()
+_SERVO_NODES = [
+    {
+        "id": "node_home",
+        "type": "function",
+        "plugin_id": "mock_servo",
+        "function_id": "home",
+        "config": {}
+    },
+    {
+        "id": "node_move",
+        "type": "function",
+        "plugin_id": "mock_servo",
+        "function_id": "move",
+        "config": {"speed": 100.0}
+    },
+    {
+        "id": "node_get_pos",
+        "type": "function",
+        "plugin_id": "mock_servo",
+        "function_id": "get_position",
+        "config": {}
+    }
+]
+
+_SERVO_EDGES = [
+    {
+        "id": "edge_1",
+        "source": "node_home",
+        "source_handle": "complete",
+        "target": "node_move",
+        "target_handle": "trigger"
+    },
+    {
+        "id": "edge_2",
+        "source": "node_home",
+        "source_handle": "position",
+        "target": "node_move",
+        "target_handle": "position"
+    },
+    {
+        "id": "edge_3",
+        "source": "node_move",
+        "source_handle": "complete",
+        "target": "node_get_pos",
+        "target_handle": "trigger"
+    }
+]
+
+
+def _make_pipeline(pipeline_id, instance_id, prefix=""):
+    """Build a Home -> Move -> Get Position pipeline for one servo.
+
+    A non-empty prefix is prepended to every node ID.
+    """
+    return {
+        "pipeline_id": pipeline_id,
+        "name": "Test Pipeline",
+        "nodes": [
+            {**node, "id": prefix + node["id"], "device_instance": instance_id}
+            for node in _SERVO_NODES
+        ],
+        "edges": [
+            {**edge, "source": prefix + edge["source"], "target": prefix + edge["target"]}
+            for edge in _SERVO_EDGES
+        ] if prefix else _SERVO_EDGES,
+        "variables": {}
+    }
+
+
+@pytest_asyncio.fixture(scope="module")
+async def plugin_loader():
+    """Plugin loader with plugins discovered once per module."""
+    loader = PluginLoader("plugins")
+    await loader.discover_plugins()
+    return loader
+
+
+@pytest_asyncio.fixture(scope="module")
+async def device_manager(plugin_loader):
+    """Device manager shared by the module; tests use distinct instance IDs."""
+    manager = DeviceManager(plugin_loader)
+    yield manager
+    await manager.disconnect_all_devices()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def execution_engine(device_manager, plugin_loader):
+    """Execution engine bound to the shared device manager."""
+    return ExecutionEngine(device_manager, plugin_loader)
 
 
 @pytest.mark.asyncio
-async def test_plugin_discovery():
+async def test_plugin_discovery(plugin_loader):
     """Test plugin discovery."""
-    plugin_loader = PluginLoader("plugins")
     plugins = await plugin_loader.discover_plugins()
 
     assert len(plugins) > 0
@@ -23,11 +121,8 @@ async def test_plugin_discovery():
 
 
 @pytest.mark.asyncio
-async def test_plugin_loading():
+async def test_plugin_loading(plugin_loader):
     """Test plugin loading."""
-    plugin_loader = PluginLoader("plugins")
-    await plugin_loader.discover_plugins()
-
     plugin_data = await plugin_loader.load_plugin("mock_servo")
 
     assert "device_class" in plugin_data
@@ -36,12 +131,8 @@ async def test_plugin_loading():
 
 
 @pytest.mark.asyncio
-async def test_device_instance_creation():
+async def test_device_instance_creation(device_manager):
     """Test device instance creation."""
-    plugin_loader = PluginLoader("plugins")
-    await plugin_loader.discover_plugins()
-
-    device_manager = DeviceManager(plugin_loader)
 
     instance_id = await device_manager.create_device_instance(
         plugin_id="mock_servo",
@@ -57,12 +148,8 @@ async def test_device_instance_creation():
 
 
 @pytest.mark.asyncio
-async def test_function_execution():
+async def test_function_execution(device_manager):
     """Test function execution on device instance."""
-    plugin_loader = PluginLoader("plugins")
-    await plugin_loader.discover_plugins()
-
-    device_manager = DeviceManager(plugin_loader)
 
     # Create device instance
     await device_manager.create_device_instance(
@@ -95,13 +182,8 @@ async def test_function_execution():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_execution():
+async def test_pipeline_execution(device_manager, execution_engine):
     """Test complete pipeline execution."""
-    plugin_loader = PluginLoader("plugins")
-    await plugin_loader.discover_plugins()
-
-    device_manager = DeviceManager(plugin_loader)
-    execution_engine = ExecutionEngine(device_manager, plugin_loader)
 
     # Create device instance
     await device_manager.create_device_instance(
@@ -111,60 +193,7 @@ async def test_pipeline_execution():
     )
 
     # Define simple 3-node pipeline: Home -> Move -> Get Position
-    pipeline_def = {
-        "pipeline_id": "test_pipeline_1",
-        "name": "Test Pipeline",
-        "nodes": [
-            {
-                "id": "node_home",
-                "type": "function",
-                "plugin_id": "mock_servo",
-                "device_instance": "pipeline_servo",
-                "function_id": "home",
-                "config": {}
-            },
-            {
-                "id": "node_move",
-                "type": "function",
-                "plugin_id": "mock_servo",
-                "device_instance": "pipeline_servo",
-                "function_id": "move",
-                "config": {"speed": 100.0}
-            },
-            {
-                "id": "node_get_pos",
-                "type": "function",
-                "plugin_id": "mock_servo",
-                "device_instance": "pipeline_servo",
-                "function_id": "get_position",
-                "config": {}
-            }
-        ],
-        "edges": [
-            {
-                "id": "edge_1",
-                "source": "node_home",
-                "source_handle": "complete",
-                "target": "node_move",
-                "target_handle": "trigger"
-            },
-            {
-                "id": "edge_2",
-                "source": "node_home",
-                "source_handle": "position",
-                "target": "node_move",
-                "target_handle": "position"
-            },
-            {
-                "id": "edge_3",
-                "source": "node_move",
-                "source_handle": "complete",
-                "target": "node_get_pos",
-                "target_handle": "trigger"
-            }
-        ],
-        "variables": {}
-    }
+    pipeline_def = _make_pipeline("test_pipeline_1", "pipeline_servo")
 
     # Execute pipeline
     result = await execution_engine.execute_pipeline(pipeline_def)
@@ -184,19 +213,144 @@ async def test_pipeline_execution():
 
 
 @pytest.mark.asyncio
-async def test_circular_dependency_detection():
-    """Test that circular dependencies are detected."""
-    plugin_loader = PluginLoader("plugins")
-    await plugin_loader.discover_plugins()
+async def test_pipeline_execution_concurrent(device_manager, execution_engine):
+    """Test independent pipelines executing concurrently on one engine."""
+    instance_ids = [f"concurrent_servo_{i}" for i in range(8)]
+
+    await asyncio.gather(*(
+        device_manager.create_device_instance(
+            plugin_id="mock_servo",
+            instance_id=instance_id,
+            config={"axis": 0, "auto_connect": True}
+        )
+        for instance_id in instance_ids
+    ))
+
+    results = await asyncio.gather(*(
+        execution_engine.execute_pipeline(
+            _make_pipeline(f"concurrent_pipeline_{i}", instance_id, prefix=f"p{i}_")
+        )
+        for i, instance_id in enumerate(instance_ids)
+    ))
+
+    for i, result in enumerate(results):
+        prefix = f"p{i}_"
+        assert result["success"] is True
+        assert result["nodes_executed"] == 3
+        # Each run only sees its own nodes' outputs
+        assert set(result["results"]) == {
+            f"{prefix}node_home", f"{prefix}node_move", f"{prefix}node_get_pos"
+        }
+        assert result["results"][f"{prefix}node_get_pos"]["position"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_execution_results_views(device_manager, plugin_loader):
+    """Test the read-only results view, the snapshot copy and their scope."""
+    await device_manager.create_device_instance(
+        plugin_id="mock_servo",
+        instance_id="results_servo",
+        config={"axis": 0, "auto_connect": True}
+    )
+    bus = EventBus()
+    engine = ExecutionEngine(device_manager, plugin_loader, event_bus=bus)
+    first = await engine.execute_pipeline(_make_pipeline("results_1", "results_servo"))
+
+    # Read-only view of the finished run, and an independent copy
+    view = engine.get_execution_results()
+    snapshot = engine.snapshot_execution_results()
+    assert dict(view) == first["results"] == snapshot
+    with pytest.raises(TypeError):
+        view["node_home"] = {}
+    snapshot["node_get_pos"]["position"] = 99.0
+    assert view["node_get_pos"]["position"] == 0.0
+
+    # A task started outside a run keeps seeing the last finished run
+    # while the next run is in progress; the run itself sees its own store
+    started = asyncio.Event()
+    seen = {}
+
+    async def outside_reader():
+        await started.wait()
+        seen["outside"] = engine.snapshot_execution_results()
+
+    async def on_started(event):
+        seen["inside"] = engine.snapshot_execution_results()
+        started.set()
+        await asyncio.sleep(0)
+
+    bus.subscribe(PipelineStartedEvent, on_started)
+    reader = asyncio.create_task(outside_reader())
+    second = await engine.execute_pipeline(
+        _make_pipeline("results_2", "results_servo", prefix="second_")
+    )
+    await reader
+
+    assert seen["inside"] == {}
+    assert seen["outside"] == first["results"]
+    assert set(engine.get_execution_results()) == set(second["results"])
+
+    engine.clear_execution_results()
+    assert engine.snapshot_execution_results() == {}
+
+
+@pytest.mark.asyncio
+async def test_compiled_pipeline_reuse(device_manager, execution_engine):
+    """Test one compiled pipeline executing repeatedly."""
+    await device_manager.create_device_instance(
+        plugin_id="mock_servo",
+        instance_id="compiled_servo",
+        config={"axis": 0, "auto_connect": True}
+    )
+
+    compiled = execution_engine.compile_pipeline(
+        _make_pipeline("compiled_pipeline", "compiled_servo")
+    )
+
+    assert compiled.order == ("node_home", "node_move", "node_get_pos")
+
+    for _ in range(2):
+        result = await execution_engine.execute_pipeline(compiled)
+
+        assert result["success"] is True
+        assert result["nodes_executed"] == 3
+
+
+def test_compile_pipeline_leaves_definition_untouched(execution_engine):
+    """Test that compiling neither rewrites the definition nor requires str IDs."""
 
-    device_manager = DeviceManager(plugin_loader)
-    execution_engine = ExecutionEngine(device_manager, plugin_loader)
+    class NodeId(str):
+        """str subclass, so a rewrite with an interned copy is detectable."""
 
-    # Create device
+    pipeline_def = {
+        "nodes": [{"id": NodeId("a")}, {"id": NodeId("b")}],
+        "edges": [{"source": NodeId("a"), "target": NodeId("b")}],
+    }
+    before = copy.deepcopy(pipeline_def)
+    numbered_def = {
+        "nodes": [{"id": 1}, {"id": 2}],
+        "edges": [{"source": 1, "target": 2}],
+    }
+
+    compiled = execution_engine.compile_pipeline(pipeline_def)
+    numbered = execution_engine.compile_pipeline(numbered_def)
+
+    assert pipeline_def == before
+    assert all(type(node["id"]) is NodeId for node in pipeline_def["nodes"])
+    assert type(pipeline_def["edges"][0]["source"]) is NodeId
+    assert compiled.order == ("a", "b")
+    assert numbered.order == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_circular_dependency_detection(device_manager, execution_engine):
+    """Test that circular dependencies are detected."""
+
+    # Create device (left disconnected: the cycle is rejected before any node runs)
     await device_manager.create_device_instance(
         plugin_id="mock_servo",
         instance_id="circular_servo",
-        config={"auto_connect": True}
+        config={}
     )
 
     # Define pipeline with circular dependency: A -> B -> A
@@ -245,3 +399,9 @@ async def test_circular_dependency_detection():
 
     assert result["success"] is False
     assert "circular" in result["error"].lower()
+
+    # Compiling directly raises instead of returning an error result
+    with pytest.raises(CircularDependencyError) as exc_info:
+        execution_engine.compile_pipeline(pipeline_def)
+    assert exc_info.value.args == (exc_info.value.message,)
+    assert exc_info.value.message.startswith("Circular dependency detected: ")
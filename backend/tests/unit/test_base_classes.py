@@ -1,5 +1,7 @@
 """Unit tests for base device and function classes."""
 
+import threading
+
 import pytest
 from typing import Any, Dict
 from core.base_device import BaseDevice, DeviceStatus
@@ -10,6 +12,8 @@ from core.base_function import BaseFunction
 class MockDevice(BaseDevice):
     """Mock device for testing."""
 
+    __slots__ = ()
+
     async def connect(self) -> bool:
         """Mock connect."""
         self.status = DeviceStatus.CONNECTED
@@ -37,6 +41,8 @@ class MockDevice(BaseDevice):
 class MockFunction(BaseFunction):
     """Mock function for testing."""
 
+    __slots__ = ()
+
     async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Mock execute."""
         return {"result": "success", "value": inputs.get("value", 0)}
@@ -63,8 +69,8 @@ def test_device_initialization():
 
 
 @pytest.mark.asyncio
-async def test_device_connect():
-    """Test device connection."""
+async def test_device_connect_disconnect_lifecycle():
+    """Test device connection followed by disconnection."""
     device = MockDevice("test_device", {})
 
     result = await device.connect()
@@ -73,15 +79,6 @@ async def test_device_connect():
     assert device.status == DeviceStatus.CONNECTED
     assert device.is_connected() is True
 
-
-@pytest.mark.asyncio
-async def test_device_disconnect():
-    """Test device disconnection."""
-    device = MockDevice("test_device", {})
-
-    await device.connect()
-    assert device.is_connected() is True
-
     result = await device.disconnect()
 
     assert result is True
@@ -136,6 +133,20 @@ def test_device_get_info():
     assert info["config"]["port"] == "COM1"
 
 
+@pytest.mark.asyncio
+async def test_device_run_blocking():
+    """Test blocking calls run in the device I/O pool."""
+    device = MockDevice("test_device", {})
+
+    def blocking_read(size, prefix=""):
+        return prefix + threading.current_thread().name, size
+
+    thread_name, size = await device.run_blocking(blocking_read, 8, prefix="t:")
+
+    assert thread_name.startswith("t:device-io")
+    assert size == 8
+
+
 # Tests for BaseFunction
 def test_function_initialization():
     """Test function initialization."""
@@ -222,38 +233,62 @@ def test_function_validate_inputs_default_values():
     assert inputs["timeout"] == 5.0
 
 
-def test_function_validate_type_all_types():
-    """Test type validation for all supported types."""
+def test_function_validate_inputs_class_schema():
+    """Test validation against the compiled class-level schema."""
+
+    class SchemaFunction(MockFunction):
+        _SCHEMA = {
+            "position": {"type": "number", "required": True},
+            "speed": {"type": "number", "required": False, "default": 100.0}
+        }
+
     device = MockDevice("test_device", {})
-    func = MockFunction(device)
+    func = SchemaFunction(device)
 
-    # Number (int and float)
-    assert func._validate_type(42, "number") is True
-    assert func._validate_type(3.14, "number") is True
-    assert func._validate_type("42", "number") is False
+    with pytest.raises(ValueError, match="Required input 'position' is missing"):
+        func.validate_inputs({})
 
-    # String
-    assert func._validate_type("hello", "string") is True
-    assert func._validate_type(42, "string") is False
+    with pytest.raises(ValueError, match="Input 'position' has invalid type"):
+        func.validate_inputs({"position": "invalid"})
 
-    # Boolean
-    assert func._validate_type(True, "boolean") is True
-    assert func._validate_type(False, "boolean") is True
-    assert func._validate_type(1, "boolean") is False
+    inputs = {"position": 50.0}
+    assert func.validate_inputs(inputs) is True
+    assert inputs["speed"] == 100.0
 
-    # Array
-    assert func._validate_type([1, 2, 3], "array") is True
-    assert func._validate_type((1, 2, 3), "array") is True
-    assert func._validate_type("not array", "array") is False
 
-    # Object
-    assert func._validate_type({"key": "value"}, "object") is True
-    assert func._validate_type([1, 2], "object") is False
+@pytest.fixture(scope="module")
+def mock_function():
+    """Mock function shared by the stateless type validation cases."""
+    return MockFunction(MockDevice("test_device", {}))
+
 
+@pytest.mark.parametrize("value,expected_type,expected", [
+    # Number (int and float)
+    (42, "number", True),
+    (3.14, "number", True),
+    ("42", "number", False),
+    # String
+    ("hello", "string", True),
+    (42, "string", False),
+    # Boolean
+    (True, "boolean", True),
+    (False, "boolean", True),
+    (1, "boolean", False),
+    # Array
+    ([1, 2, 3], "array", True),
+    ((1, 2, 3), "array", True),
+    ("not array", "array", False),
+    # Object
+    ({"key": "value"}, "object", True),
+    ([1, 2], "object", False),
     # Any (accepts everything)
-    assert func._validate_type(42, "any") is True
-    assert func._validate_type("string", "any") is True
-    assert func._validate_type(None, "any") is True
+    (42, "any", True),
+    ("string", "any", True),
+    (None, "any", True),
+])
+def test_function_validate_type_all_types(mock_function, value, expected_type, expected):
+    """Test type validation for all supported types."""
+    assert mock_function._validate_type(value, expected_type) is expected
 
 
 def test_function_get_function_info():
@@ -0,0 +1,215 @@
+"""Unit tests for composite use cases."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from domain.entities.composite import CompositeNodeDefinition
+from domain.repositories.composite_write_coordinator import CompositeWriteCoordinator
+from domain.use_cases.composite_use_cases import (
+    CreateCompositeUseCase,
+    UpdateCompositeUseCase,
+    CreateCompositeFromNodesUseCase,
+)
+
+
+def make_composite(composite_id, nested_ids=()):
+    """Build a composite whose subgraph references the given composites."""
+    nodes = [
+        {"id": f"node_{nested_id}", "type": "composite", "composite_id": nested_id}
+        for nested_id in nested_ids
+    ]
+    return CompositeNodeDefinition(
+        composite_id=composite_id,
+        name=composite_id,
+        description="",
+        subgraph={"nodes": nodes, "edges": []},
+    )
+
+
+def make_repository(*composites):
+    """Build a mock repository backed by the given composites."""
+    stored = {c.composite_id: c for c in composites}
+    repo = Mock()
+    repo.get = AsyncMock(side_effect=lambda composite_id: stored.get(composite_id))
+    repo.get_many = AsyncMock(side_effect=lambda composite_ids: {
+        cid: stored[cid] for cid in composite_ids if cid in stored
+    })
+    repo.save = AsyncMock(side_effect=lambda composite: composite.composite_id)
+    repo.update = AsyncMock(return_value=True)
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_create_composite_rejects_self_reference():
+    """Test that a composite cannot contain itself."""
+    # Arrange
+    use_case = CreateCompositeUseCase(make_repository())
+    data = make_composite("a", ["a"]).to_dict()
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="cannot contain itself"):
+        await use_case.execute(data)
+
+
+@pytest.mark.asyncio
+async def test_update_composite_rejects_transitive_cycle():
+    """Test that a cycle through nested composites is detected."""
+    # Arrange: b -> c -> a, and a is updated to contain b
+    repo = make_repository(
+        make_composite("a"),
+        make_composite("b", ["c"]),
+        make_composite("c", ["a"]),
+    )
+    use_case = UpdateCompositeUseCase(repo)
+    data = {"subgraph": make_composite("a", ["b"]).subgraph}
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="a -> b -> c -> a"):
+        await use_case.execute("a", data)
+    repo.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_composite_allows_shared_nested_composite():
+    """Test that a diamond of references is not reported as a cycle."""
+    # Arrange: new -> b, new -> c, b -> d, c -> d
+    repo = make_repository(
+        make_composite("b", ["d"]),
+        make_composite("c", ["d"]),
+        make_composite("d"),
+    )
+    use_case = CreateCompositeUseCase(repo)
+    data = make_composite("new", ["b", "c"]).to_dict()
+
+    # Act
+    result = await use_case.execute(data)
+
+    # Assert
+    assert result["success"] is True
+    # One bulk fetch per nesting level: {b, c}, then {d}
+    assert repo.get_many.await_count == 2
+    repo.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_composite_from_nodes_maps_external_pins():
+    """Test that external edges become typed composite inputs/outputs."""
+    # Arrange
+    repo = make_repository()
+    use_case = CreateCompositeFromNodesUseCase(repo)
+    nodes = [
+        {"id": "n1", "data": {"inputs": [{"name": "in", "type": "number"}], "outputs": []}},
+        {"id": "n2", "data": {"inputs": [], "outputs": [{"name": "out", "type": "string"}]}},
+    ]
+    edges = [{"source": "n1", "target": "n2"}]
+    external_edges = [
+        {"source": "outside", "target": "n1", "targetHandle": "in"},
+        {"source": "n2", "target": "outside", "sourceHandle": "out"},
+    ]
+
+    # Act
+    result = await use_case.execute("Group", nodes, edges, external_edges)
+
+    # Assert
+    composite = result["composite"]
+    assert composite["inputs"][0]["maps_to"] == "n1.in"
+    assert composite["inputs"][0]["type"] == "number"
+    assert composite["outputs"][0]["maps_from"] == "n2.out"
+    assert composite["outputs"][0]["type"] == "string"
+
+
+@pytest.mark.asyncio
+async def test_update_composite_metadata_only_reuses_structure():
+    """Test that a metadata-only update keeps the stored subgraph and pins."""
+    # Arrange
+    existing = make_composite("a", ["b"])
+    repo = make_repository(existing, make_composite("b"))
+    use_case = UpdateCompositeUseCase(repo)
+
+    # Act
+    result = await use_case.execute("a", {"name": "Renamed"})
+
+    # Assert
+    updated = repo.update.call_args.args[1]
+    assert result["composite"]["name"] == "Renamed"
+    assert updated is not existing
+    assert updated.subgraph is existing.subgraph
+    assert existing.name == "a"
+
+
+@pytest.mark.asyncio
+async def test_create_composite_rejects_incomplete_pin():
+    """Test that a pin without a required key is reported as invalid."""
+    # Arrange
+    use_case = CreateCompositeUseCase(make_repository())
+    data = make_composite("a").to_dict()
+    data["inputs"] = [{"name": "in", "type": "number"}]
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="missing input.maps_to"):
+        await use_case.execute(dict(data))
+
+
+@pytest.mark.asyncio
+async def test_write_coordinator_batches_concurrent_saves():
+    """Test that concurrent saves are written with one save_many call."""
+    # Arrange
+    repo = make_repository()
+    repo.save_many = AsyncMock(side_effect=lambda batch: [c.composite_id for c in batch])
+    coordinator = CompositeWriteCoordinator(repo)
+    composites = [make_composite(f"c{i}") for i in range(3)]
+
+    # Act
+    ids = await asyncio.gather(*(coordinator.save(c) for c in composites))
+    await coordinator.close()
+
+    # Assert
+    assert ids == ["c0", "c1", "c2"]
+    repo.save_many.assert_awaited_once()
+    repo.save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_write_coordinator_isolates_failed_save():
+    """Test that one rejected composite only fails its own caller."""
+    # Arrange
+    repo = make_repository()
+    repo.save_many = AsyncMock(side_effect=ValueError("batch failed"))
+
+    def save(composite):
+        if composite.composite_id == "bad":
+            raise ValueError("Invalid composite")
+        return composite.composite_id
+
+    repo.save = AsyncMock(side_effect=save)
+    coordinator = CompositeWriteCoordinator(repo)
+
+    # Act
+    results = await asyncio.gather(
+        coordinator.save(make_composite("good")),
+        coordinator.save(make_composite("bad")),
+        return_exceptions=True,
+    )
+    await coordinator.close()
+
+    # Assert
+    assert results[0] == "good"
+    assert isinstance(results[1], ValueError)
+
+
+def test_composite_to_dict_returns_independent_copy():
+    """Test that editing a to_dict() result leaves the composite untouched."""
+    composite = make_composite("a", ["b"])
+    cached_json = composite.to_json()
+
+    data = composite.to_dict()
+    data["name"] = "HACK"
+    data["subgraph"]["nodes"].clear()
+
+    assert composite.to_dict()["name"] == "a"
+    assert len(composite.subgraph["nodes"]) == 1
+    assert composite.to_json() is cached_json
+
+    composite.name = "Renamed"
+    assert b'"Renamed"' in composite.to_json()
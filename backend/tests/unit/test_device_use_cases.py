@@ -2,6 +2,8 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock
+from core.base_device import BaseDevice
+from core.device_manager import DeviceManager
 from domain.use_cases.device_use_cases import (
     ListDevicesUseCase,
     CreateDeviceUseCase,
@@ -14,7 +16,7 @@ from domain.use_cases.device_use_cases import (
 async def test_list_devices_use_case():
     """Test listing devices."""
     # Arrange
-    mock_device_manager = Mock()
+    mock_device_manager = Mock(spec=DeviceManager)
     mock_device_manager.list_device_instances.return_value = [
         {"id": "device1", "status": "connected"},
         {"id": "device2", "status": "connected"},
@@ -47,10 +49,10 @@ async def test_list_devices_use_case_no_manager():
 async def test_create_device_use_case():
     """Test creating a device."""
     # Arrange
-    mock_device_manager = Mock()
+    mock_device_manager = Mock(spec=DeviceManager)
     mock_device_manager.create_device_instance = AsyncMock(return_value="device1")
     
-    mock_device = Mock()
+    mock_device = Mock(spec=BaseDevice)
     mock_device.get_info.return_value = {
         "id": "device1",
         "status": "connected",
@@ -87,40 +89,33 @@ async def test_create_device_use_case_no_manager():
 
 
 @pytest.mark.asyncio
-async def test_delete_device_use_case():
-    """Test deleting a device."""
+@pytest.mark.parametrize("removed,expected_error", [
+    pytest.param(True, None, id="deleted"),
+    pytest.param(False, "Device 'device1' not found", id="not_found"),
+])
+async def test_delete_device_use_case(removed, expected_error):
+    """Test deleting an existing and a non-existent device."""
     # Arrange
-    mock_device_manager = Mock()
-    mock_device_manager.remove_device_instance = AsyncMock(return_value=True)
-    use_case = DeleteDeviceUseCase(mock_device_manager)
-
-    # Act
-    result = await use_case.execute("device1")
-
-    # Assert
-    assert result["success"] is True
-    assert result["instance_id"] == "device1"
-    mock_device_manager.remove_device_instance.assert_called_once_with("device1")
-
-
-@pytest.mark.asyncio
-async def test_delete_device_use_case_not_found():
-    """Test deleting a non-existent device."""
-    # Arrange
-    mock_device_manager = Mock()
-    mock_device_manager.remove_device_instance = AsyncMock(return_value=False)
+    mock_device_manager = Mock(spec=DeviceManager)
+    mock_device_manager.remove_device_instance = AsyncMock(return_value=removed)
     use_case = DeleteDeviceUseCase(mock_device_manager)
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Device 'device1' not found"):
-        await use_case.execute("device1")
+    if expected_error is not None:
+        with pytest.raises(ValueError, match=expected_error):
+            await use_case.execute("device1")
+    else:
+        result = await use_case.execute("device1")
+        assert result["success"] is True
+        assert result["instance_id"] == "device1"
+    mock_device_manager.remove_device_instance.assert_called_once_with("device1")
 
 
 @pytest.mark.asyncio
 async def test_execute_function_use_case_success():
     """Test executing a device function successfully."""
     # Arrange
-    mock_device_manager = Mock()
+    mock_device_manager = Mock(spec=DeviceManager)
     mock_device_manager.execute_function = AsyncMock(return_value={"result": "success"})
     use_case = ExecuteFunctionUseCase(mock_device_manager)
 
@@ -138,7 +133,7 @@ async def test_execute_function_use_case_success():
 async def test_execute_function_use_case_error():
     """Test executing a device function with error."""
     # Arrange
-    mock_device_manager = Mock()
+    mock_device_manager = Mock(spec=DeviceManager)
     mock_device_manager.execute_function = AsyncMock(side_effect=Exception("Execution failed"))
     use_case = ExecuteFunctionUseCase(mock_device_manager)
 
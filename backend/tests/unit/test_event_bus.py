@@ -0,0 +1,173 @@
+"""Unit tests for the event bus."""
+
+import gc
+
+import pytest
+from dataclasses import dataclass
+from domain.events.event_bus import EventBus
+
+
+@dataclass
+class BaseEvent:
+    """Base event for testing."""
+    value: int
+
+
+@dataclass
+class ChildEvent(BaseEvent):
+    """Subclass event for testing."""
+    pass
+
+
+@pytest.mark.asyncio
+async def test_publish_to_async_and_sync_handlers():
+    """Test that both async and sync handlers receive events."""
+    bus = EventBus()
+    received = []
+
+    async def async_handler(event):
+        received.append(("async", event.value))
+
+    def sync_handler(event):
+        received.append(("sync", event.value))
+
+    bus.subscribe(BaseEvent, async_handler)
+    bus.subscribe(BaseEvent, sync_handler)
+
+    await bus.publish(BaseEvent(1))
+
+    assert sorted(received) == [("async", 1), ("sync", 1)]
+    assert bus.get_subscribers_count(BaseEvent) == 2
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe():
+    """Test that unsubscribed handlers no longer receive events."""
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event.value)
+
+    bus.subscribe(BaseEvent, handler)
+    await bus.publish(BaseEvent(1))
+
+    bus.unsubscribe(BaseEvent, handler)
+    await bus.publish(BaseEvent(2))
+
+    assert received == [1]
+    assert bus.get_subscribers_count(BaseEvent) == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_others():
+    """Test that an exception in one handler doesn't stop the rest."""
+    bus = EventBus()
+    received = []
+
+    async def failing_handler(event):
+        raise RuntimeError("boom")
+
+    async def handler(event):
+        received.append(event.value)
+
+    bus.subscribe(BaseEvent, failing_handler)
+    bus.subscribe(BaseEvent, handler)
+
+    await bus.publish(BaseEvent(1))
+
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_base_class_and_wildcard_subscribers():
+    """Test delivery to base-class and wildcard subscribers."""
+    bus = EventBus()
+    received = []
+
+    async def base_handler(event):
+        received.append("base")
+
+    async def child_handler(event):
+        received.append("child")
+
+    async def wildcard_handler(event):
+        received.append("all")
+
+    bus.subscribe(BaseEvent, base_handler)
+    await bus.publish(ChildEvent(1))
+
+    # Cached resolution is invalidated by new subscriptions
+    bus.subscribe(ChildEvent, child_handler)
+    bus.subscribe_all(wildcard_handler)
+    await bus.publish(ChildEvent(2))
+
+    assert received[0] == "base"
+    assert sorted(received[1:]) == ["all", "base", "child"]
+
+    received.clear()
+    bus.unsubscribe_all(wildcard_handler)
+    await bus.publish(BaseEvent(3))
+
+    assert received == ["base"]
+
+
+@pytest.mark.asyncio
+async def test_bound_method_handlers_are_weak():
+    """Test that bound-method handlers are dropped with their instance."""
+    bus = EventBus()
+    received = []
+
+    class Listener:
+        async def on_event(self, event):
+            received.append(event.value)
+
+    listener = Listener()
+    bus.subscribe(BaseEvent, listener.on_event)
+    await bus.publish(BaseEvent(1))
+
+    assert received == [1]
+
+    # Unsubscribe with a fresh bound method object still matches
+    bus.unsubscribe(BaseEvent, listener.on_event)
+    assert bus.get_subscribers_count(BaseEvent) == 0
+
+    bus.subscribe(BaseEvent, listener.on_event)
+    del listener
+    gc.collect()
+    await bus.publish(BaseEvent(2))
+
+    assert bus.get_subscribers_count(BaseEvent) == 0
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_bound_method_of_unhashable_instance():
+    """Test that bound methods of unhashable instances can subscribe."""
+    bus = EventBus()
+    received = []
+
+    @dataclass
+    class Listener:
+        name: str
+
+        async def on_event(self, event):
+            received.append((self.name, event.value))
+
+    listener = Listener("a")
+    with pytest.raises(TypeError):
+        hash(listener)
+
+    bus.subscribe(BaseEvent, listener.on_event)
+    bus.subscribe_all(listener.on_event)
+    await bus.publish(BaseEvent(1))
+
+    assert received == [("a", 1), ("a", 1)]
+
+    bus.unsubscribe_all(listener.on_event)
+    del listener
+    gc.collect()
+    await bus.publish(BaseEvent(2))
+
+    assert bus.get_subscribers_count(BaseEvent) == 0
+    assert received == [("a", 1), ("a", 1)]
@@ -0,0 +1,143 @@
+"""Unit tests for the JSON file repositories."""
+
+import asyncio
+import os
+
+import orjson
+import pytest
+from unittest.mock import patch
+from domain.entities.composite import CompositeNodeDefinition
+from infrastructure.storage.json_composite_repository import JsonCompositeRepository
+from infrastructure.storage.json_pipeline_repository import JsonPipelineRepository
+
+
+def make_composite(composite_id, category="Composite"):
+    """Build a minimal valid composite."""
+    return CompositeNodeDefinition(
+        composite_id=composite_id,
+        name=composite_id,
+        description="",
+        subgraph={"nodes": [], "edges": []},
+        category=category,
+    )
+
+
+@pytest.mark.asyncio
+async def test_composite_is_built_once_per_file_version(tmp_path):
+    """Test that unchanged files are read once, even cold and concurrent."""
+    # Arrange
+    writer = JsonCompositeRepository(str(tmp_path))
+    await writer.save_many([make_composite("a"), make_composite("b")])
+    await writer.flush()
+    repo = JsonCompositeRepository(str(tmp_path))
+
+    # Act
+    with patch.object(repo, "_read_bytes", wraps=repo._read_bytes) as read_bytes:
+        single, concurrent, first = await asyncio.gather(
+            repo.get("a"), repo.get("a"), repo.get_by_category("Composite")
+        )
+        again = await repo.get_by_category("Composite")
+
+    # Assert
+    assert [c.composite_id for c in first] == ["a", "b"]
+    assert single == concurrent == first[0] == again[0]
+    assert read_bytes.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_composite_reloaded_after_external_change(tmp_path):
+    """Test that a file modified outside the repository is read again."""
+    # Arrange
+    repo = JsonCompositeRepository(str(tmp_path))
+    await repo.save(make_composite("a"))
+    path = tmp_path / "a.json"
+    data = orjson.loads(path.read_bytes())
+    data["name"] = "renamed"
+    path.write_bytes(orjson.dumps(data))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # Act
+    composite = await repo.get("a")
+
+    # Assert
+    assert composite.name == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_metadata_written_on_flush(tmp_path):
+    """Test that index changes stay in memory until flushed."""
+    # Arrange
+    repo = JsonPipelineRepository(str(tmp_path))
+    metadata_path = tmp_path / "_metadata.json"
+
+    # Act
+    await repo.save("p1", {"name": "First"})
+    await repo.save("p2", {"name": "Second"})
+    await repo.delete("p1")
+    written_before_flush = metadata_path.exists()
+    await repo.flush()
+
+    # Assert
+    assert written_before_flush is False
+    assert list(orjson.loads(metadata_path.read_bytes())) == ["p2"]
+    assert await repo.delete("p1") is False
+
+
+@pytest.mark.asyncio
+async def test_non_ascii_ids_round_trip_without_collision(tmp_path):
+    """Test that ids differing only in non-ASCII letters map to distinct files."""
+    # Arrange
+    repo = JsonPipelineRepository(str(tmp_path))
+
+    # Act
+    await repo.save("파이프라인1", {"name": "First"})
+    await repo.save("테스트1", {"name": "Second"})
+
+    # Assert
+    assert (await repo.get("파이프라인1"))["name"] == "First"
+    assert (await repo.get("테스트1"))["name"] == "Second"
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == [
+        "테스트1.json", "파이프라인1.json"
+    ]
+
+
+def test_failed_write_removes_temp_file(tmp_path):
+    """Test that a write failing before the rename leaves no temp file behind."""
+    # Arrange
+    repo = JsonPipelineRepository(str(tmp_path))
+    path = tmp_path / "p1.json"
+
+    # Act
+    with patch("os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            repo._write_bytes(path, b"{}")
+
+    # Assert
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_cached_items_are_not_shared_between_gets(tmp_path):
+    """Test that mutating a returned item does not change later reads."""
+    # Arrange
+    composites = JsonCompositeRepository(str(tmp_path / "composites"))
+    pipelines = JsonPipelineRepository(str(tmp_path / "pipelines"))
+    await composites.save(make_composite("a"))
+    await pipelines.save("p1", {"name": "First", "nodes": []})
+
+    # Act
+    composite = await composites.get("a")
+    composite.name = "HACK"
+    composite.subgraph["nodes"].append({"id": "n1"})
+    await composites.save(make_composite("b"))
+    pipeline = await pipelines.get("p1")
+    pipeline["name"] = "HACK"
+    pipeline["nodes"].append({"id": "n1"})
+
+    # Assert
+    reloaded = await composites.get("a")
+    assert reloaded is not composite
+    assert reloaded.name == "a"
+    assert reloaded.subgraph["nodes"] == []
+    assert await pipelines.get("p1") == {"name": "First", "nodes": []}
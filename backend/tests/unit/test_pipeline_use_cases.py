@@ -1,7 +1,11 @@
 """Unit tests for pipeline use cases."""
 
+import re
+
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
+from core.execution_engine import ExecutionEngine
+from domain.repositories.pipeline_repository import IPipelineRepository
 from domain.use_cases.pipeline_use_cases import (
     ExecutePipelineUseCase,
     SavePipelineUseCase,
@@ -10,66 +14,73 @@ from domain.use_cases.pipeline_use_cases import (
     DeletePipelineUseCase,
 )
 
+pytestmark = pytest.mark.asyncio
 
-@pytest.mark.asyncio
-async def test_execute_pipeline_use_case_success():
-    """Test executing a pipeline successfully."""
-    # Arrange
-    mock_engine = Mock()
-    mock_engine.execute_pipeline = AsyncMock(return_value={
-        "success": True,
-        "results": {"node1": {"output": "value"}},
-        "nodes_executed": 1,
-    })
-    use_case = ExecutePipelineUseCase(mock_engine)
-    
-    pipeline_def = {
+# Error expected by the not-found get and delete cases
+_NOT_FOUND_RE = re.compile(r"Pipeline 'pipeline1' not found")
+
+
+@pytest.fixture
+def mock_engine():
+    """Execution engine mock; spec'd async methods are AsyncMocks."""
+    return Mock(spec=ExecutionEngine)
+
+
+@pytest.fixture
+def mock_repository():
+    """Pipeline repository mock; spec'd async methods are AsyncMocks."""
+    return Mock(spec=IPipelineRepository)
+
+
+@pytest.fixture(scope="module")
+def pipeline_def():
+    """Pipeline definition shared by the module; use cases only read it."""
+    return {
         "pipeline_id": "pipeline1",
         "name": "Test Pipeline",
         "nodes": [],
         "edges": [],
     }
 
-    # Act
-    result = await use_case.execute(pipeline_def)
 
-    # Assert
-    assert result["success"] is True
-    assert result["pipeline_id"] == "pipeline1"
-    assert "execution_time" in result
-    mock_engine.execute_pipeline.assert_called_once_with(pipeline_def)
-
-
-@pytest.mark.asyncio
-async def test_execute_pipeline_use_case_error():
-    """Test executing a pipeline with error."""
+@pytest.mark.parametrize("engine_result,engine_error,expected_error", [
+    pytest.param(
+        {
+            "success": True,
+            "results": {"node1": {"output": "value"}},
+            "nodes_executed": 1,
+        },
+        None,
+        None,
+        id="success",
+    ),
+    pytest.param(None, Exception("Pipeline error"), "Pipeline error", id="error"),
+])
+async def test_execute_pipeline_use_case(
+    mock_engine, pipeline_def, engine_result, engine_error, expected_error
+):
+    """Test executing a pipeline, successfully and with an engine error."""
     # Arrange
-    mock_engine = Mock()
-    mock_engine.execute_pipeline = AsyncMock(side_effect=Exception("Pipeline error"))
+    mock_engine.execute_pipeline.return_value = engine_result
+    mock_engine.execute_pipeline.side_effect = engine_error
     use_case = ExecutePipelineUseCase(mock_engine)
-    
-    pipeline_def = {"pipeline_id": "pipeline1"}
 
     # Act
     result = await use_case.execute(pipeline_def)
 
     # Assert
-    assert result["success"] is False
-    assert "Pipeline error" in result["error"]
+    assert result["success"] is (expected_error is None)
+    assert result["pipeline_id"] == "pipeline1"
+    assert "execution_time" in result
+    mock_engine.execute_pipeline.assert_called_once_with(pipeline_def)
+    if expected_error is not None:
+        assert expected_error in result["error"]
 
 
-@pytest.mark.asyncio
-async def test_save_pipeline_use_case():
+async def test_save_pipeline_use_case(mock_repository, pipeline_def):
     """Test saving a pipeline."""
     # Arrange
-    mock_repository = Mock()
-    mock_repository.save = AsyncMock()
     use_case = SavePipelineUseCase(mock_repository)
-    
-    pipeline_def = {
-        "pipeline_id": "pipeline1",
-        "name": "Test Pipeline",
-    }
 
     # Act
     result = await use_case.execute(pipeline_def)
@@ -80,58 +91,45 @@ async def test_save_pipeline_use_case():
     mock_repository.save.assert_called_once_with("pipeline1", pipeline_def)
 
 
-@pytest.mark.asyncio
-async def test_save_pipeline_use_case_no_id():
+async def test_save_pipeline_use_case_no_id(mock_repository, pipeline_def):
     """Test saving a pipeline without ID."""
     # Arrange
-    mock_repository = Mock()
     use_case = SavePipelineUseCase(mock_repository)
-    
-    pipeline_def = {"name": "Test Pipeline"}
+
+    pipeline_def = {k: v for k, v in pipeline_def.items() if k != "pipeline_id"}
 
     # Act & Assert
     with pytest.raises(ValueError, match="Pipeline ID is required"):
         await use_case.execute(pipeline_def)
 
 
-@pytest.mark.asyncio
-async def test_get_pipeline_use_case():
-    """Test getting a pipeline."""
+@pytest.mark.parametrize("stored", [
+    pytest.param({"pipeline_id": "pipeline1"}, id="found"),
+    pytest.param(None, id="not_found"),
+])
+async def test_get_pipeline_use_case(mock_repository, stored):
+    """Test getting an existing and a non-existent pipeline."""
     # Arrange
-    mock_repository = Mock()
-    mock_repository.get = AsyncMock(return_value={"pipeline_id": "pipeline1"})
-    use_case = GetPipelineUseCase(mock_repository)
-
-    # Act
-    result = await use_case.execute("pipeline1")
-
-    # Assert
-    assert result["pipeline_id"] == "pipeline1"
-    mock_repository.get.assert_called_once_with("pipeline1")
-
-
-@pytest.mark.asyncio
-async def test_get_pipeline_use_case_not_found():
-    """Test getting a non-existent pipeline."""
-    # Arrange
-    mock_repository = Mock()
-    mock_repository.get = AsyncMock(return_value=None)
+    mock_repository.get.return_value = stored
     use_case = GetPipelineUseCase(mock_repository)
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Pipeline 'pipeline1' not found"):
-        await use_case.execute("pipeline1")
+    if stored is None:
+        with pytest.raises(ValueError, match=_NOT_FOUND_RE):
+            await use_case.execute("pipeline1")
+    else:
+        result = await use_case.execute("pipeline1")
+        assert result["pipeline_id"] == "pipeline1"
+    mock_repository.get.assert_called_once_with("pipeline1")
 
 
-@pytest.mark.asyncio
-async def test_list_pipelines_use_case():
+async def test_list_pipelines_use_case(mock_repository):
     """Test listing pipelines."""
     # Arrange
-    mock_repository = Mock()
-    mock_repository.list_all = AsyncMock(return_value=[
+    mock_repository.list_all.return_value = [
         {"id": "pipeline1", "name": "Pipeline 1"},
         {"id": "pipeline2", "name": "Pipeline 2"},
-    ])
+    ]
     use_case = ListPipelinesUseCase(mock_repository)
 
     # Act
@@ -143,31 +141,40 @@ async def test_list_pipelines_use_case():
     mock_repository.list_all.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_delete_pipeline_use_case():
-    """Test deleting a pipeline."""
+@pytest.mark.parametrize("deleted", [
+    pytest.param(True, id="deleted"),
+    pytest.param(False, id="not_found"),
+])
+async def test_delete_pipeline_use_case(mock_repository, deleted):
+    """Test deleting an existing and a non-existent pipeline."""
     # Arrange
-    mock_repository = Mock()
-    mock_repository.delete = AsyncMock(return_value=True)
+    mock_repository.delete.return_value = deleted
     use_case = DeletePipelineUseCase(mock_repository)
 
-    # Act
-    result = await use_case.execute("pipeline1")
-
-    # Assert
-    assert result["success"] is True
-    assert result["pipeline_id"] == "pipeline1"
+    # Act & Assert
+    if deleted:
+        result = await use_case.execute("pipeline1")
+        assert result["success"] is True
+        assert result["pipeline_id"] == "pipeline1"
+    else:
+        with pytest.raises(ValueError, match=_NOT_FOUND_RE):
+            await use_case.execute("pipeline1")
     mock_repository.delete.assert_called_once_with("pipeline1")
 
 
-@pytest.mark.asyncio
-async def test_delete_pipeline_use_case_not_found():
-    """Test deleting a non-existent pipeline."""
+async def test_list_pipelines_use_case_page(mock_repository):
+    """Test listing pipelines one page at a time."""
     # Arrange
-    mock_repository = Mock()
-    mock_repository.delete = AsyncMock(return_value=False)
-    use_case = DeletePipelineUseCase(mock_repository)
+    mock_repository.list_page.return_value = [
+        {"id": "pipeline1", "name": "Pipeline 1"},
+        {"id": "pipeline2", "name": "Pipeline 2"},
+    ]
+    use_case = ListPipelinesUseCase(mock_repository)
 
-    # Act & Assert
-    with pytest.raises(ValueError, match="Pipeline 'pipeline1' not found"):
-        await use_case.execute("pipeline1")
+    # Act
+    result = await use_case.execute_page(offset=2, limit=2)
+
+    # Assert
+    assert len(result["items"]) == 2
+    assert result["next_offset"] == 4
+    mock_repository.list_page.assert_called_once_with(2, 2)
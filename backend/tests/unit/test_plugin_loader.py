@@ -0,0 +1,35 @@
+"""Unit tests for the plugin loader."""
+
+import os
+import shutil
+import sys
+
+from core.plugin_loader import PluginLoader
+
+
+def test_load_module_distinguishes_copied_plugin_dirs(tmp_path):
+    """Test that same-id plugins in different directories are not confused."""
+    # Arrange
+    first = tmp_path / "first" / "demo"
+    first.mkdir(parents=True)
+    (first / "device.py").write_text("SOURCE = 'first'\n")
+    second = tmp_path / "second" / "demo"
+    shutil.copytree(first, second)
+    (second / "device.py").write_text("SOURCE = 'second'\n")
+    stat = (first / "device.py").stat()
+    os.utime(second / "device.py", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    loader = PluginLoader(str(tmp_path / "first"))
+    module_name = "test_plugin_loader_demo.device"
+
+    # Act
+    try:
+        loaded_first = loader._load_module(first / "device.py", module_name)
+        loaded_second = loader._load_module(second / "device.py", module_name)
+        loaded_again = loader._load_module(second / "device.py", module_name)
+    finally:
+        sys.modules.pop(module_name, None)
+
+    # Assert
+    assert loaded_first.SOURCE == "first"
+    assert loaded_second.SOURCE == "second"
+    assert loaded_again is loaded_second
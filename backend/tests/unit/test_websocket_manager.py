@@ -0,0 +1,41 @@
+"""Unit tests for the WebSocket broadcast manager."""
+
+import asyncio
+
+import orjson
+import pytest
+from api.v1.routes.websocket import WebSocketManager
+
+
+class RecordingWebSocket:
+    """WebSocket stand-in that records sent text frames."""
+
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, payload):
+        self.frames.append(orjson.loads(payload))
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_only_unserializable_event():
+    """Test that one bad event does not cost the rest of its batch."""
+    # Arrange
+    manager = WebSocketManager()
+    websocket = RecordingWebSocket()
+    manager.active_connections.append(websocket)
+
+    # Act
+    await manager.broadcast({"type": "node_completed", "outputs": {"value": 1}})
+    await manager.broadcast({"type": "node_completed", "outputs": {"value": {1, 2}}})
+    await manager.broadcast({"type": "pipeline_completed"})
+    await asyncio.sleep(manager.BATCH_WINDOW * 4)
+
+    # Assert
+    assert websocket.frames == [{
+        "type": "batch",
+        "events": [
+            {"type": "node_completed", "outputs": {"value": 1}},
+            {"type": "pipeline_completed"},
+        ],
+    }]
@@ -108,9 +108,14 @@ export function useWebSocket(options: UseWebSocketOptions = {}): UseWebSocketRet
 
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data) as WebSocketEvent;
-          console.log('[WebSocket] Message:', data);
-          onMessage?.(data);
+          const data = JSON.parse(event.data);
+          // The server coalesces bursts of events into one batch frame
+          const events: WebSocketEvent[] =
+            data.type === 'batch' ? data.events : [data];
+          for (const evt of events) {
+            console.log('[WebSocket] Message:', evt);
+            onMessage?.(evt);
+          }
         } catch (error) {
           console.error('[WebSocket] Failed to parse message:', error);
         }